@@ -0,0 +1,82 @@
+"""
+FlightX Assets
+==============
+Process-wide image and font cache.  Each image is decoded from disk once,
+every (path, size, tint) variant is scaled / tinted once, and each font
+file is opened once per point size; all of them are shared by whoever
+asks next.  Rendered text and pre-drawn widget surfaces are cached too.
+
+config.resize() and config.toggle_fullscreen() clear the cache, since
+window-sized backgrounds and fonts change with the window.
+
+Surfaces from the cache are shared: blit them, never draw on them.
+"""
+
+import pygame
+
+_images = {}
+_fonts = {}
+_texts = {}
+_surfaces = {}
+
+# Rendered text is keyed by string, so HUD counters keep adding entries;
+# start over once this many have piled up.
+TEXT_CACHE_LIMIT = 1024
+
+
+def image(path, size=None, tint=None, alpha=True):
+    """
+    The image at `path`, smoothscaled to `size` (w, h) and multiplied by
+    the RGB `tint` when given.  Converted for fast blitting once a video
+    mode exists (with per-pixel alpha unless `alpha` is False).
+    """
+    key = (path, size, tint, alpha)
+    surface = _images.get(key)
+    if surface is None:
+        if tint is not None:
+            surface = image(path, size, alpha=alpha).copy()
+            surface.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+        elif size is not None:
+            surface = pygame.transform.smoothscale(image(path, alpha=alpha), size)
+        else:
+            surface = pygame.image.load(path)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha() if alpha else surface.convert()
+        _images[key] = surface
+    return surface
+
+
+def font(path, size):
+    """A pygame Font for `path` at `size` points."""
+    key = (path, size)
+    f = _fonts.get(key)
+    if f is None:
+        f = _fonts[key] = pygame.font.Font(path, size)
+    return f
+
+
+def text(font, string, color):
+    """font.render(string, True, color), rendered once per (string, font, color)."""
+    key = (string, font, color)
+    surface = _texts.get(key)
+    if surface is None:
+        if len(_texts) >= TEXT_CACHE_LIMIT:
+            _texts.clear()
+        surface = _texts[key] = font.render(string, True, color)
+    return surface
+
+
+def surface(key, build):
+    """A pre-rendered surface: build() is called once per `key` and the result reused."""
+    s = _surfaces.get(key)
+    if s is None:
+        s = _surfaces[key] = build()
+    return s
+
+
+def clear():
+    """Drop every cached image, font, text and surface (they are rebuilt on next use)."""
+    _images.clear()
+    _fonts.clear()
+    _texts.clear()
+    _surfaces.clear()
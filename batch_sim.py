@@ -0,0 +1,226 @@
+"""
+FlightX Batch Simulator
+========================
+Structure-of-arrays version of the NEAT game loop.  Every plane's position,
+velocity, alive flag, lifespan, score and vision live in NumPy arrays, and
+the whole population is stepped with a handful of vectorised operations per
+tick instead of one Python `Player` at a time.
+
+Obstacles still come from a regular `World`, so the course (and its random
+draws) is exactly the one the pygame game plays.
+"""
+
+import math
+
+import numpy as np
+import pygame
+
+import brain
+import config
+import perf
+import player
+import world
+
+
+def _round_half_away(values):
+    """pygame.Rect stores ints and rounds assigned floats half away from zero."""
+    return np.trunc(values + np.copysign(0.5, values))
+
+
+class BatchSimulator:
+    """
+    Steps N planes at once against a shared World.
+
+    Planes are loaded from `Player` objects with `load_players()`, advanced
+    with `step(decide)` and written back with `sync_players()`; `run()`
+    does all three for a whole generation.
+    """
+
+    # Plane hitbox (player.Plane: 40×40 at (50, 200), inflate(-12, -12)) and physics
+    HITBOX = 28
+    LEFT = 56
+    GRAVITY = player.Plane.GRAVITY
+    MAX_VEL = player.Plane.MAX_VEL
+    FLAP_IMPULSE = player.Plane.FLAP_IMPULSE
+    FLAP_CEILING = player.Plane.FLAP_CEILING
+
+    def __init__(self, sim_world=None, seed=None):
+        self.world = sim_world if sim_world is not None else world.World()
+        self.rng = np.random.default_rng(seed)
+        self.reset(0)
+
+    def reset(self, size):
+        self.size = size
+        self.top = np.full(size, 206.0)
+        self.vel = np.zeros(size)
+        self.alive = np.ones(size, dtype=bool)
+        self.lifespan = np.zeros(size, dtype=np.int64)
+        self.score = np.zeros(size, dtype=np.int64)
+        self.vision = np.zeros((size, 4))
+
+    # ---- Player <-> arrays ----
+    def load_players(self, players):
+        self.reset(len(players))
+        for i, p in enumerate(players):
+            self.top[i] = p.rect.y
+            self.vel[i] = p.vel
+            self.alive[i] = p.alive
+            self.lifespan[i] = p.lifespan
+            self.score[i] = p.score
+            self.vision[i] = p.vision
+
+    def sync_players(self, players):
+        for i, p in enumerate(players):
+            p.rect.y = int(self.top[i])
+            p.vel = float(self.vel[i])
+            p.alive = bool(self.alive[i])
+            p.lifespan = int(self.lifespan[i])
+            p.score = int(self.score[i])
+            p.vision = [float(v) for v in self.vision[i]]
+
+    # ---- geometry ----
+    def _overlaps(self, idx, rect):
+        """Vectorised pygame.Rect.colliderect of planes `idx` against one rect."""
+        if rect.width <= 0 or rect.height <= 0:
+            return np.zeros(len(idx), dtype=bool)
+        top = self.top[idx]
+        return ((self.LEFT < rect.right) & (self.LEFT + self.HITBOX > rect.left)
+                & (top < rect.bottom) & (top + self.HITBOX > rect.top))
+
+    def _wall_boxes(self):
+        """(left, top, right, bottom) arrays for every pipe wall on screen."""
+        rects = []
+        for p in self.world.pipes:
+            walls = p.wall_rects if hasattr(p, 'wall_rects') else (p.top_rect, p.bottom_rect)
+            rects.extend(r for r in walls if r.width > 0 and r.height > 0)
+        if not rects:
+            return None
+        boxes = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.float64)
+        return boxes.T
+
+    def closest_pipe(self):
+        return self.world.next_pipe
+
+    # ---- per-tick phases ----
+    def look(self, idx, pipe):
+        if pipe is None:
+            self.vision[idx] = 0
+            return
+        gap = (pipe.top_rect.bottom + pipe.bottom_rect.top) / 2
+        centery = self.top[idx] + self.HITBOX // 2
+        centerx = self.LEFT + self.HITBOX // 2
+        self.vision[idx, 0] = np.clip((centery - gap) / 250, -1, 1)
+        self.vision[idx, 1] = min(1, max(-1, (pipe.x - centerx) / 400))
+        self.vision[idx, 2] = min(1, max(-1, pipe.opening / 150))
+        self.vision[idx, 3] = np.clip(self.vel[idx] / 10, -1, 1)
+
+    def think(self, idx, pipe, decide, generation):
+        """Return a boolean flap mask for planes `idx`."""
+        if pipe is None:
+            # Before the first pipe is in range, hover near screen center
+            target_y = config.win_height * 0.45
+            return self.top[idx] + self.HITBOX // 2 > target_y + 10
+
+        decision = np.asarray(decide(idx, self.vision[idx]), dtype=np.float64)
+        noise_scale = max(0.01, 0.08 * math.exp(-0.08 * generation))
+        decision = decision + self.rng.normal(0, noise_scale, len(idx))
+        return decision > 0.5
+
+    def flap(self, idx):
+        idx = idx[self.top[idx] >= 0]   # no flapping through the ceiling
+        impulse = self.FLAP_IMPULSE * config.jump_scale
+        ceiling = self.FLAP_CEILING * config.jump_scale
+        self.vel[idx] = np.maximum(self.vel[idx] - impulse, ceiling)
+
+    def move(self, idx):
+        crashed = self._overlaps(idx, config.ground.rect)
+        boxes = self._wall_boxes()
+        if boxes is not None:
+            left, top, right, bottom = boxes
+            plane_top = self.top[idx, None]
+            crashed |= ((self.LEFT < right) & (self.LEFT + self.HITBOX > left)
+                        & (plane_top < bottom) & (plane_top + self.HITBOX > top)).any(axis=1)
+
+        dead = idx[crashed]
+        self.alive[dead] = False
+        self.vel[dead] = 0
+
+        flying = idx[~crashed]
+        self.vel[flying] = np.minimum(self.vel[flying] + self.GRAVITY, self.MAX_VEL)
+        self.top[flying] = _round_half_away(self.top[flying] + self.vel[flying])
+        self.lifespan[flying] += 1
+
+    def apply_obstacles(self):
+        idx = np.flatnonzero(self.alive)
+        w = self.world
+        # Every plane shares one x-span, so one grid query finds all candidates
+        wind_zones, coins, flying_blocks, falling_obstacles = w.obstacle_grid().query(
+            self.LEFT, self.LEFT + self.HITBOX)
+        for wz in wind_zones:
+            self.vel[idx[self._overlaps(idx, wz.rect)]] -= wz.strength
+        for coin in coins:
+            if not coin.collected:
+                bob_y = coin.y + int(4 * math.sin(coin.bob_tick))
+                coin_rect = (coin.x - coin.RADIUS, bob_y - coin.RADIUS, coin.RADIUS * 2, coin.RADIUS * 2)
+                if self._overlaps(idx, pygame.Rect(coin_rect)).any():
+                    coin.collected = True
+                    w.add_score(coin.BONUS)
+        for ob in flying_blocks + falling_obstacles:
+            self.alive[idx[self._overlaps(idx, ob.rect)]] = False
+
+    def step(self, decide, generation=1):
+        """
+        Advance the world and every live plane by one tick.
+        decide(indices, vision_rows) must return one network output per row.
+        """
+        w = self.world
+        with perf.phase('tick'):
+            with perf.phase('pipes'):
+                w.spawn_tick()
+                passed = w.update_pipes()
+                if passed:
+                    self.score[self.alive] += passed
+
+            idx = np.flatnonzero(self.alive)
+            if len(idx):
+                pipe = self.closest_pipe()
+                with perf.phase('look'):
+                    self.look(idx, pipe)
+                with perf.phase('think'):
+                    flaps = idx[self.think(idx, pipe, decide, generation)]
+                with perf.phase('update'):
+                    self.flap(flaps)
+                    self.move(idx)
+
+            with perf.phase('obstacles'):
+                w.advance_obstacles()
+                self.apply_obstacles()
+        perf.tick(len(idx))
+
+    # ---- whole generations ----
+    def run(self, players, generation=1, max_ticks=None, exact=True):
+        """
+        Play `players` to extinction (or `max_ticks`) and write the results
+        back.  All brains are evaluated together through a BrainBatch; see
+        BrainBatch.feed_forward for `exact`.  Returns the ticks run.
+        """
+        self.load_players(players)
+        ticks = self.simulate(brain.BrainBatch([p.brain for p in players]), generation, max_ticks, exact)
+        self.sync_players(players)
+        return ticks
+
+    def simulate(self, batch, generation=1, max_ticks=None, exact=True):
+        """
+        Step the loaded planes, one BrainBatch row per plane, until they
+        have all crashed (or `max_ticks`).  Returns the ticks run.
+        """
+        def decide(idx, vision):
+            return batch.feed_forward(vision, idx, exact=exact)
+
+        ticks = 0
+        while self.alive.any():
+            self.step(decide, generation)
+            ticks += 1
+            if max_ticks is not None and ticks >= max_ticks:
+                break
+        return ticks
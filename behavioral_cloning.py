@@ -72,6 +72,9 @@ class DataRecorder:
 # ---------------------------------------------------------------------------
 # Neural Network Model
 # ---------------------------------------------------------------------------
+# Map output index to action: 0 → flap(1), 1 → glide(0), 2 → drop(-1)
+ACTIONS = (1, 0, -1)
+
 if TORCH_AVAILABLE:
     class BCModel(nn.Module):
         """Small MLP: 4 inputs → 64 → 32 → 3 action classes."""
@@ -91,13 +94,16 @@ if TORCH_AVAILABLE:
 
         def predict_action(self, state_list):
             """Given a list of 4 floats, return action int: 1, 0, or -1."""
+            return self.predict_actions([state_list])[0]
+
+        def predict_actions(self, states):
+            """Actions for a batch of states (one forward pass)."""
             self.eval()
             with torch.no_grad():
-                x = torch.tensor([state_list], dtype=torch.float32)
+                x = torch.tensor(states, dtype=torch.float32)
                 logits = self.forward(x)
-                idx = torch.argmax(logits, dim=1).item()
-            # Map index to action: 0 → flap(1), 1 → glide(0), 2 → drop(-1)
-            return [1, 0, -1][idx]
+                idx = torch.argmax(logits, dim=1).tolist()
+            return [ACTIONS[i] for i in idx]
 else:
     # Fallback stub so the file can be imported without torch
     class BCModel:
@@ -105,6 +111,8 @@ else:
             raise RuntimeError("PyTorch is not installed. Run: pip install torch")
         def predict_action(self, state_list):
             raise RuntimeError("PyTorch is not installed.")
+        def predict_actions(self, states):
+            raise RuntimeError("PyTorch is not installed.")
 
 
 # ---------------------------------------------------------------------------
@@ -1,4 +1,8 @@
+import math
 import random
+
+import numpy as np
+
 import node
 import connection
 
@@ -7,10 +11,17 @@ class Brain:
     def __init__(self, inputs, hidden_layers=None, clone=False):
         self.inputs = inputs
         self.hidden_layers = hidden_layers if hidden_layers else []
-        self.nodes = []
-        self.connections = []
         self.layers = 2 + len(self.hidden_layers)
-        self.net = []
+
+        # Node graph; brains cloned from weight arrays build it on first use
+        self._nodes = []
+        self._connections = []
+        self._net = []
+        self._bias_node = None
+        self._output_node = None
+        self._compiled = None
+        # True while the graph is the one _build() made (skips is_fully_layered())
+        self._layered = False
         
         # Node IDs - Always calculate these
         self.bias_index = self.inputs
@@ -21,60 +32,126 @@ class Brain:
         for h_count in self.hidden_layers:
             current_id += h_count
         self.output_index = current_id
-        
+
         if not clone:
-            # Reset current_id for actual node creation
-            current_id = self.inputs + 1
-            
-            # Input nodes (Layer 0)
-            for i in range(self.inputs):
-                n = node.Node(i)
-                n.layer = 0
-                self.nodes.append(n)
-
-            # Bias node (Layer 0)
-            n_bias = node.Node(self.bias_index)
-            n_bias.layer = 0
-            self.nodes.append(n_bias)
-            self.bias_node = n_bias
-
-            # Hidden layers
-            hidden_node_ids = []
-            for i, h_count in enumerate(self.hidden_layers):
-                layer_ids = []
-                for _ in range(h_count):
-                    n = node.Node(current_id)
-                    n.layer = i + 1  # 0 is input, so hidden starts at 1
-                    self.nodes.append(n)
-                    layer_ids.append(current_id)
-                    current_id += 1
-                hidden_node_ids.append(layer_ids)
-
-            # Output node (Last Layer)
-            n_out = node.Node(self.output_index)
-            n_out.layer = self.layers - 1
-            self.nodes.append(n_out)
-            self.output_node = n_out
-
-            # Connections: Fully connected between adjacent layers
-            # Layer 0 (Inputs+Bias) -> Layer 1 (First Hidden or Output)
-            prev_layer_nodes = [n for n in self.nodes if n.layer == 0]
-            
-            # Connect through hidden layers
-            for i in range(len(self.hidden_layers)):
-                current_layer_nodes = [n for n in self.nodes if n.layer == i + 1]
-                for prev in prev_layer_nodes:
-                    for curr in current_layer_nodes:
-                        self.connections.append(
-                            connection.Connection(prev, curr, random.uniform(-1, 1))
-                        )
-                prev_layer_nodes = current_layer_nodes
-
-            # Connect last layer to output
-            for prev in prev_layer_nodes:
-                self.connections.append(
-                    connection.Connection(prev, self.output_node, random.uniform(-1, 1))
-                )
+            self._build()
+
+    # ---- node graph (built lazily) ----
+    def _materialize(self):
+        if not self._nodes and self._compiled is not None:
+            self._build(self._compiled)
+            self.generate_net()
+
+    @property
+    def nodes(self):
+        self._materialize()
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, value):
+        self._nodes = value
+        self._layered = False
+
+    @property
+    def connections(self):
+        self._materialize()
+        return self._connections
+
+    @connections.setter
+    def connections(self, value):
+        self._connections = value
+        self._layered = False
+
+    @property
+    def net(self):
+        self._materialize()
+        return self._net
+
+    @net.setter
+    def net(self, value):
+        self._net = value
+
+    @property
+    def bias_node(self):
+        self._materialize()
+        return self._bias_node
+
+    @bias_node.setter
+    def bias_node(self, value):
+        self._bias_node = value
+
+    @property
+    def output_node(self):
+        self._materialize()
+        return self._output_node
+
+    @output_node.setter
+    def output_node(self, value):
+        self._output_node = value
+
+    def __getstate__(self):
+        # Pickle the node graph under its public names (the format older
+        # saves use) and leave the compiled-weights cache out.
+        self._materialize()
+        state = {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+        for key in ('nodes', 'connections', 'net', 'bias_node', 'output_node'):
+            state[key] = self.__dict__['_' + key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for key in ('nodes', 'connections', 'net', 'bias_node', 'output_node'):
+            self.__dict__['_' + key] = self.__dict__.pop(key, [] if key in ('nodes', 'connections', 'net') else None)
+        self._compiled = None
+        self._layered = False
+
+    def _build(self, matrices=None):
+        """
+        Create the fully connected layered nodes and connections.  Weights
+        are taken from `matrices` (as returned by compile()) or drawn at random.
+        """
+        current_id = self.inputs + 1
+
+        # Input nodes (Layer 0)
+        layer_nodes = [[]]
+        for i in range(self.inputs):
+            n = node.Node(i)
+            n.layer = 0
+            layer_nodes[0].append(n)
+
+        # Bias node (Layer 0)
+        n_bias = node.Node(self.bias_index)
+        n_bias.layer = 0
+        layer_nodes[0].append(n_bias)
+        self._bias_node = n_bias
+
+        # Hidden layers
+        for i, h_count in enumerate(self.hidden_layers):
+            layer = []
+            for _ in range(h_count):
+                n = node.Node(current_id)
+                n.layer = i + 1  # 0 is input, so hidden starts at 1
+                layer.append(n)
+                current_id += 1
+            layer_nodes.append(layer)
+
+        # Output node (Last Layer)
+        n_out = node.Node(self.output_index)
+        n_out.layer = self.layers - 1
+        layer_nodes.append([n_out])
+        self._output_node = n_out
+
+        for layer in layer_nodes:
+            self._nodes.extend(layer)
+
+        # Connections: Fully connected between adjacent layers
+        for l in range(len(layer_nodes) - 1):
+            weights = matrices[l].tolist() if matrices is not None else None
+            for i, prev in enumerate(layer_nodes[l]):
+                for j, curr in enumerate(layer_nodes[l + 1]):
+                    weight = weights[i][j] if weights is not None else random.uniform(-1, 1)
+                    self._connections.append(connection.Connection(prev, curr, weight))
+        self._layered = True
 
     def connect_nodes(self):
         for n in self.nodes:
@@ -85,31 +162,35 @@ class Brain:
 
     def generate_net(self):
         self.connect_nodes()
-        self.net = []
-        for l in range(self.layers):
-            for n in self.nodes:
-                if n.layer == l:
-                    self.net.append(n)
+        # Stable sort keeps node order within each layer
+        self.net = sorted((n for n in self.nodes if 0 <= n.layer < self.layers),
+                          key=lambda n: n.layer)
 
     def feed_forward(self, vision):
+        nodes = self.nodes
         for i in range(self.inputs):
-            self.nodes[i].output_value = vision[i]
+            nodes[i].output_value = vision[i]
 
-        bias = self.bias_node if self.bias_node else self.get_node(self.bias_index)
+        bias = self._bias_node if self._bias_node else self.get_node(self.bias_index)
         bias.output_value = 1
 
-        for n in self.net:
+        for n in self._net:
             n.activate()
 
-        output_node = self.output_node if self.output_node else self.get_node(self.output_index)
+        output_node = self._output_node if self._output_node else self.get_node(self.output_index)
         output = output_node.output_value
 
-        for n in self.nodes:
+        for n in nodes:
             n.input_value = 0
 
         return output
 
-    def clone(self):
+    def clone(self, detach=False):
+        """
+        A copy of this brain.  Clones share the read-only weight matrices
+        unless `detach` is set (needed when they are views of a buffer that
+        will be overwritten, see Population.next_gen()).
+        """
         # Compatibility check for old saved models
         if not hasattr(self, 'bias_index'):
             self.bias_index = self.inputs
@@ -121,29 +202,108 @@ class Brain:
 
         clone = Brain(self.inputs, self.hidden_layers, True)
 
-        for n in self.nodes:
-            clone.nodes.append(n.clone())
+        if self._layered or not self._nodes or self.is_fully_layered():
+            # Share the read-only weight matrices; the clone only builds
+            # nodes and connections if something asks for them.
+            clone._compiled = self.compile()
+            if detach:
+                clone._compiled = _split(self.genome(), [m.shape for m in clone._compiled])
+            return clone
 
-        for c in self.connections:
-            clone.connections.append(
-                c.clone(
-                    clone.get_node(c.from_node.id),
-                    clone.get_node(c.to_node.id),
-                )
-            )
+        for n in self._nodes:
+            clone._nodes.append(n.clone())
+
+        by_id = {n.id: n for n in clone._nodes}
+        for c in self._connections:
+            clone._connections.append(c.clone(by_id[c.from_node.id], by_id[c.to_node.id]))
 
         clone.layers = self.layers
-        clone.bias_node = clone.get_node(self.bias_index)
-        clone.output_node = clone.get_node(self.output_index)
+        clone.bias_node = by_id.get(self.bias_index)
+        clone.output_node = by_id.get(self.output_index)
         clone.generate_net()
         return clone
 
+    def is_fully_layered(self):
+        """True for the standard topology built by __init__ (every adjacent-layer pair connected)."""
+        sizes = [self.inputs + 1] + list(self.hidden_layers) + [1]
+        return (self.layers == len(sizes)
+                and len(self.nodes) == sum(sizes)
+                and len(self.connections) == sum(a * b for a, b in zip(sizes, sizes[1:]))
+                and all(n.id == i for i, n in enumerate(self.nodes)))
+
+    def compile(self):
+        """
+        Cached, read-only tuple of per-layer weight matrices (see
+        weight_matrices()).  mutate() and invalidate() drop the cache.
+        """
+        if self._compiled is None:
+            compiled = tuple(self.weight_matrices())
+            for m in compiled:
+                m.setflags(write=False)
+            self._compiled = compiled
+        return self._compiled
+
+    def genome(self):
+        """Every connection weight as one flat array, in connection order."""
+        if self._layered or not self._nodes or self.is_fully_layered():
+            # _build() creates connections row by row, which is the ravel order
+            return np.concatenate([m.ravel() for m in self.compile()])
+        return np.array([c.weight for c in self._connections])
+
+    def load_genome(self, genome):
+        """
+        Replace every weight with `genome` (flat, in connection order) and
+        drop the node graph; the matrices are read-only views of `genome`.
+        """
+        sizes = [self.inputs + 1] + list(self.hidden_layers) + [1]
+        self._nodes, self._connections, self._net = [], [], []
+        self._bias_node = self._output_node = None
+        self._layered = False
+        self.layers = len(sizes)
+        self._compiled = _split(genome, list(zip(sizes, sizes[1:])))
+
+    def invalidate(self):
+        """Forget the compiled weights; call after editing connection weights directly."""
+        self._materialize()
+        self._compiled = None
+
+    def weight_matrices(self):
+        """
+        One (fan_in, fan_out) weight matrix per layer transition.  Rows and
+        columns follow the order of self.net, with the bias as the last row
+        of the first matrix, so sums accumulate in the same order as
+        feed_forward().
+        """
+        layer_nodes = [[] for _ in range(self.layers)]
+        for n in self.net:
+            layer_nodes[n.layer].append(n)
+        if [n.id for n in layer_nodes[0]] != list(range(self.inputs + 1)):
+            raise ValueError('input layer must be inputs followed by the bias node')
+
+        position = {}
+        for nodes in layer_nodes:
+            for i, n in enumerate(nodes):
+                position[n.id] = i
+
+        matrices = [np.zeros((len(layer_nodes[l]), len(layer_nodes[l + 1])))
+                    for l in range(self.layers - 1)]
+        for c in self.connections:
+            l = c.from_node.layer
+            if c.to_node.layer != l + 1:
+                raise ValueError('only fixed-topology brains (adjacent layers) can be batched')
+            matrices[l][position[c.from_node.id], position[c.to_node.id]] = c.weight
+        return matrices
+
     def get_node(self, node_id):
         for n in self.nodes:
             if n.id == node_id:
                 return n
 
     def mutate(self):
+        if not self._nodes:
+            self._mutate_compiled()
+            return
+        self._compiled = None
         # 80% chance: perturb weights
         if random.random() < 0.8:
             for c in self.connections:
@@ -156,3 +316,92 @@ class Brain:
         if random.random() < 0.05 and self.connections:
             c = random.choice(self.connections)
             c.weight *= -1
+
+    def _mutate_compiled(self):
+        """
+        mutate() for a brain that only has its weight matrices.  The flat
+        weight list is in connection order and the random draws are the
+        same, so the result matches mutating the node graph.
+        """
+        shapes = [m.shape for m in self._compiled]
+        weights = np.concatenate([m.ravel() for m in self._compiled]).tolist()
+        self._compiled = _split(np.array(mutated_genome(weights)), shapes)
+
+
+def mutated_genome(weights):
+    """
+    Brain.mutate() applied to a flat weight list (connection order).
+    Returns the new list; the random draws are the same as mutate()'s.
+    """
+    if random.random() < 0.8:
+        weights = [connection.mutated_weight(w) for w in weights]
+    else:
+        weights = list(weights)
+    if random.random() < 0.1 and weights:
+        k = random.randrange(len(weights))
+        weights[k] = random.uniform(-1, 1)
+    if random.random() < 0.05 and weights:
+        weights[random.randrange(len(weights))] *= -1
+    return weights
+
+
+def _split(flat, shapes):
+    """Read-only (rows, cols) views of consecutive slices of `flat`."""
+    compiled = []
+    offset = 0
+    for rows, cols in shapes:
+        m = flat[offset:offset + rows * cols].reshape(rows, cols)
+        m.setflags(write=False)
+        compiled.append(m)
+        offset += rows * cols
+    return tuple(compiled)
+
+
+_exp = np.frompyfunc(math.exp, 1, 1)
+
+
+class BrainBatch:
+    """
+    A generation of fixed-topology brains stacked into weight tensors, one
+    (population, fan_in, fan_out) array per layer, so every brain's decision
+    is evaluated with one batched operation per layer.
+
+    feed_forward(exact=True) accumulates each neuron's inputs in node order
+    and uses math.exp, which reproduces Brain.feed_forward() bit for bit;
+    exact=False uses np.matmul and np.exp, which may differ in the last ulp.
+    """
+
+    def __init__(self, brains):
+        self.weights = [np.stack(layer) for layer in zip(*(b.compile() for b in brains))]
+
+    @classmethod
+    def from_weights(cls, weights):
+        """Wrap already stacked per-layer weights (e.g. a shard sent to a worker process)."""
+        batch = cls.__new__(cls)
+        batch.weights = list(weights)
+        return batch
+
+    def __len__(self):
+        return len(self.weights[0]) if self.weights else 0
+
+    def feed_forward(self, vision, rows=None, exact=True):
+        """
+        vision: (n, inputs) array, one row per brain in `rows` (all brains
+        when rows is None).  Returns the (n,) output node values.
+        """
+        vision = np.asarray(vision, dtype=np.float64)
+        values = np.hstack([vision, np.ones((len(vision), 1))])
+
+        for w in self.weights:
+            if rows is not None:
+                w = w[rows]
+            if exact:
+                total = np.zeros((len(values), w.shape[2]))
+                for i in range(w.shape[1]):
+                    total = total + w[:, i, :] * values[:, i, None]
+                values = 1 / (1 + _exp(-total).astype(np.float64))
+            else:
+                total = np.matmul(values[:, None, :], w)[:, 0, :]
+                values = 1 / (1 + np.exp(-total))
+
+        return values[:, 0]
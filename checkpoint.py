@@ -0,0 +1,187 @@
+"""
+FlightX Population Checkpoints
+==============================
+Saves the complete evolutionary state of a Population so training can
+pick up where it stopped: every player's genome, each species' benchmark
+and champion genomes, staleness and fitness records, the generation
+counter, the speciation threshold and the `random` module's state.
+
+A checkpoint is one uncompressed .npz file of flat float64 arrays (the
+genome layout of genome_io.py), so resuming is a handful of array reads.
+Writes are atomic: the file is written beside its target and renamed over
+it, so a crash mid-save leaves the previous checkpoint intact.
+
+Take checkpoints between generations (after natural_selection()); the
+new players have not flown yet, so nothing else needs saving.
+
+Usage:
+    saver = checkpoint.Checkpointer('population.ckpt.npz', every=10)
+    ...after each generation...
+    saver.maybe_save(pop)       # copies the state now, writes in the background
+    saver.wait()
+
+    pop = checkpoint.load('population.ckpt.npz')
+"""
+
+import json
+import os
+import random
+import threading
+
+import numpy as np
+
+import brain
+import genome_io
+import player
+import population
+import species
+
+
+VERSION = 1
+CHECKPOINT_FILE = 'population.ckpt.npz'
+
+
+def capture(pop):
+    """The population's state as a dict of arrays (copies, safe to write from another thread)."""
+    first = pop.players[0].brain if pop.players else pop.species[0].champion.brain
+    inputs, hidden = first.inputs, list(first.hidden_layers)
+    length = genome_io.genome_length(inputs, hidden)
+
+    def stack(brains):
+        genomes = np.empty((len(brains), length))
+        for row, b in zip(genomes, brains):
+            g = b.genome()
+            if len(g) != length:
+                raise genome_io.GenomeFormatError('checkpoints need fully layered brains with one topology')
+            row[:] = g
+        return genomes
+
+    version, mt_state, gauss_next = random.getstate()
+    meta = {
+        'version': VERSION,
+        'inputs': inputs,
+        'hidden_layers': hidden,
+        'generation': pop.generation,
+        'size': pop.size,
+        'threshold': pop.threshold,
+        'target_species': pop.target_species,
+        'rng_version': version,
+        'rng_gauss_next': gauss_next,
+    }
+    return {
+        'meta': np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8),
+        'players': stack([p.brain for p in pop.players]),
+        'benchmarks': stack([s.benchmark_brain for s in pop.species]),
+        'champions': stack([s.champion.brain for s in pop.species]),
+        'staleness': np.array([s.staleness for s in pop.species], dtype=np.int64),
+        'benchmark_fitness': np.array([s.benchmark_fitness for s in pop.species], dtype=np.float64),
+        'champion_score': np.array([s.champion_score for s in pop.species], dtype=np.int64),
+        'average_fitness': np.array([s.average_fitness for s in pop.species], dtype=np.float64),
+        'species_threshold': np.array([s.threshold for s in pop.species], dtype=np.float64),
+        'rng': np.array(mt_state, dtype=np.uint32),
+    }
+
+
+def write(path, state):
+    """Write a capture() result atomically."""
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        np.savez(f, **state)
+    os.replace(tmp, path)
+
+
+def save(pop, path=CHECKPOINT_FILE):
+    write(path, capture(pop))
+
+
+def _brain(inputs, hidden, genome):
+    b = brain.Brain(inputs, hidden, True)
+    b.load_genome(genome)
+    return b
+
+
+def load(path=CHECKPOINT_FILE, restore_rng=True):
+    """
+    Rebuild the Population saved at `path`.  With `restore_rng` the
+    `random` module continues from where the saved run left off.
+    """
+    with np.load(path) as data:
+        state = {name: data[name] for name in data.files}
+    meta = json.loads(state['meta'].tobytes().decode())
+    if meta['version'] != VERSION:
+        raise genome_io.GenomeFormatError(f'unsupported checkpoint version {meta["version"]}')
+    inputs, hidden = meta['inputs'], meta['hidden_layers']
+
+    pop = population.Population(meta['size'], target_species=meta['target_species'])
+    pop.generation = meta['generation']
+    pop.threshold = meta['threshold']
+    pop.players = []
+    for genome in state['players']:
+        p = player.Player()
+        p.brain = _brain(inputs, hidden, genome)
+        pop.players.append(p)
+
+    pop.species = []
+    for j in range(len(state['benchmarks'])):
+        champion = player.Player()
+        champion.brain = _brain(inputs, hidden, state['champions'][j])
+        champion.fitness = float(state['benchmark_fitness'][j])
+        s = species.Species(champion, float(state['species_threshold'][j]))
+        s.players = []
+        s.benchmark_brain = _brain(inputs, hidden, state['benchmarks'][j])
+        s.benchmark_genome = s.benchmark_brain.genome()
+        s.staleness = int(state['staleness'][j])
+        s.champion_score = int(state['champion_score'][j])
+        s.average_fitness = int(state['average_fitness'][j])
+        pop.species.append(s)
+
+    if restore_rng:
+        random.setstate((meta['rng_version'], tuple(int(x) for x in state['rng']), meta['rng_gauss_next']))
+    print(f'[CHECKPOINT] Resumed {path} at generation {pop.generation}')
+    return pop
+
+
+class Checkpointer:
+    """
+    Saves a population every `every` generations.  The state is copied on
+    the calling thread and written by a background thread; a new save
+    first waits for the previous write to finish.
+    """
+
+    def __init__(self, path=CHECKPOINT_FILE, every=10):
+        self.path = path
+        self.every = every
+        self._writer = None
+
+    def maybe_save(self, pop):
+        """Save if the generation `pop` just finished is a multiple of `every`."""
+        if self.every and (pop.generation - 1) % self.every == 0:
+            self.save(pop)
+
+    def save(self, pop, background=True):
+        try:
+            state = capture(pop)
+        except genome_io.GenomeFormatError as e:
+            print(f'[CHECKPOINT] Skipped: {e}')
+            return
+        self.wait()
+        if background:
+            self._writer = threading.Thread(target=self._write, args=(state, pop.generation),
+                                            name='checkpoint', daemon=True)
+            self._writer.start()
+        else:
+            self._write(state, pop.generation)
+
+    def _write(self, state, generation):
+        try:
+            write(self.path, state)
+        except OSError as e:
+            print(f'[CHECKPOINT] Error saving {self.path}: {e}')
+        else:
+            print(f'[CHECKPOINT] Saved {self.path} (resumes at generation {generation})')
+
+    def wait(self):
+        """Block until the last background write is on disk."""
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
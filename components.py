@@ -1,6 +1,7 @@
 import pygame
 import random
 import math
+import assets
 
 
 class Ground:
@@ -18,21 +19,23 @@ class Ground:
 class Pipes:
     width = 15
 
-    def __init__(self, win_width):
-        self.opening = random.randint(90, 130)
+    def __init__(self, win_width, rng=random):
+        self.opening = rng.randint(90, 130)
         self.x = win_width
-        self.bottom_height = random.randint(10, 300)
+        self.bottom_height = rng.randint(10, 300)
         self.top_height = Ground.ground_level - self.bottom_height - self.opening
-        self.bottom_rect, self.top_rect = pygame.Rect(0, 0, 0, 0), pygame.Rect(0, 0, 0, 0)
         self.passed = False
         self.counted = False
         self.off_screen = False
+        self.update_rects()
 
-    def draw(self, window):
+    def update_rects(self):
+        # Collision geometry lives here (not in draw) so headless runs see real pipes
         self.bottom_rect = pygame.Rect(self.x, Ground.ground_level - self.bottom_height, self.width, self.bottom_height)
-        pygame.draw.rect(window, (255, 255, 255), self.bottom_rect)
-
         self.top_rect = pygame.Rect(self.x, 0, self.width, self.top_height)
+
+    def draw(self, window):
+        pygame.draw.rect(window, (255, 255, 255), self.bottom_rect)
         pygame.draw.rect(window, (255, 255, 255), self.top_rect)
 
     def update(self):
@@ -41,6 +44,7 @@ class Pipes:
             self.passed = True
         if self.x <= -self.width:
             self.off_screen = True
+        self.update_rects()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -50,30 +54,24 @@ class Pipes:
 class MovingPipes(Pipes):
     """Pipes that oscillate vertically, making the gap a moving target."""
 
-    def __init__(self, win_width):
-        super().__init__(win_width)
+    def __init__(self, win_width, rng=random):
+        super().__init__(win_width, rng)
         self.base_bottom_height = self.bottom_height
         self.base_top_height = self.top_height
-        self.amplitude = random.randint(20, 50)   # pixels of oscillation
-        self.frequency = random.uniform(0.02, 0.05)  # speed of oscillation
-        self.phase = random.uniform(0, 2 * math.pi)
+        self.amplitude = rng.randint(20, 50)   # pixels of oscillation
+        self.frequency = rng.uniform(0.02, 0.05)  # speed of oscillation
+        self.phase = rng.uniform(0, 2 * math.pi)
         self.tick = 0
 
     def update(self):
-        super().update()
         self.tick += 1
         shift = int(self.amplitude * math.sin(self.frequency * self.tick + self.phase))
         self.bottom_height = max(10, self.base_bottom_height + shift)
         self.top_height = max(10, Ground.ground_level - self.bottom_height - self.opening)
+        super().update()
 
     def draw(self, window):
         # Draw with a distinct color (cyan) so player can see they're special
-        self.bottom_rect = pygame.Rect(
-            self.x, Ground.ground_level - self.bottom_height,
-            self.width, self.bottom_height
-        )
-        self.top_rect = pygame.Rect(self.x, 0, self.width, self.top_height)
-
         pygame.draw.rect(window, (0, 220, 220), self.bottom_rect)
         pygame.draw.rect(window, (0, 220, 220), self.top_rect)
 
@@ -85,11 +83,11 @@ class WindZone:
     """
     WIDTH = 60
 
-    def __init__(self, win_width):
+    def __init__(self, win_width, rng=random):
         self.x = win_width
-        self.y = random.randint(50, Ground.ground_level - 120)
-        self.height = random.randint(80, 160)
-        self.strength = random.choice([-0.35, -0.25, 0.25, 0.35])
+        self.y = rng.randint(50, Ground.ground_level - 120)
+        self.height = rng.randint(80, 160)
+        self.strength = rng.choice([-0.35, -0.25, 0.25, 0.35])
         self.rect = pygame.Rect(self.x, self.y, self.WIDTH, self.height)
         self.off_screen = False
         # Visual
@@ -103,13 +101,11 @@ class WindZone:
             self.off_screen = True
 
     def draw(self, window):
-        # Semi-transparent colored rectangle
+        # Semi-transparent colored rectangle (one shared surface per size and color)
         alpha = int(80 + 40 * math.sin(self.alpha_tick * 0.08))
-        surf = pygame.Surface((self.WIDTH, self.height), pygame.SRCALPHA)
-        if self.strength > 0:
-            surf.fill((80, 255, 80, alpha))   # green = upward
-        else:
-            surf.fill((255, 80, 80, alpha))   # red = downward
+        color = (80, 255, 80) if self.strength > 0 else (255, 80, 80)  # green = up, red = down
+        surf = assets.surface(('wind', self.height, color), lambda: self._zone_surface(color))
+        surf.set_alpha(alpha)
         window.blit(surf, self.rect)
 
         # Arrow indicators
@@ -125,6 +121,14 @@ class WindZone:
                     (cx - 6, ay - 4), (cx + 6, ay - 4), (cx, ay + 8)
                 ])
 
+    def _zone_surface(self, color):
+        surf = pygame.Surface((self.WIDTH, self.height))
+        surf.fill(color)
+        return surf
+
+    def x_span(self):
+        return self.rect.left, self.rect.right
+
     def affects(self, player_rect):
         """Check if a player rect is inside this wind zone."""
         return self.rect.colliderect(player_rect)
@@ -143,7 +147,7 @@ class Coin:
     RADIUS = 8
     BONUS = 3
 
-    def __init__(self, pipe_x, gap_y=None):
+    def __init__(self, pipe_x, gap_y=None, rng=random):
         """
         pipe_x: x position of the pipe that just spawned.
         gap_y:  vertical center of the pipe's gap (if available).
@@ -154,10 +158,10 @@ class Coin:
         if gap_y is not None:
             self.y = gap_y
         else:
-            self.y = random.randint(60, Ground.ground_level - 60)
+            self.y = rng.randint(60, Ground.ground_level - 60)
         self.collected = False
         self.off_screen = False
-        self.bob_tick = random.uniform(0, 2 * math.pi)
+        self.bob_tick = rng.uniform(0, 2 * math.pi)
 
     def update(self):
         self.x -= 1
@@ -171,12 +175,20 @@ class Coin:
         bob_y = self.y + int(4 * math.sin(self.bob_tick))
         # Gold coin with glow
         glow_radius = self.RADIUS + 3 + int(2 * math.sin(self.bob_tick * 2))
-        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (255, 215, 0, 60), (glow_radius, glow_radius), glow_radius)
+        glow_surf = assets.surface(('coin_glow', glow_radius), lambda: self._glow_surface(glow_radius))
         window.blit(glow_surf, (self.x - glow_radius, bob_y - glow_radius))
         pygame.draw.circle(window, (255, 215, 0), (self.x, bob_y), self.RADIUS)
         pygame.draw.circle(window, (255, 255, 150), (self.x, bob_y), self.RADIUS, 2)
 
+    @staticmethod
+    def _glow_surface(radius):
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (255, 215, 0, 60), (radius, radius), radius)
+        return surf
+
+    def x_span(self):
+        return self.x - self.RADIUS, self.x + self.RADIUS
+
     def check_collect(self, player_rect):
         """Return True if collected by this player."""
         if self.collected:
@@ -197,17 +209,17 @@ class FlyingBlock:
     """
     SIZE = 18
 
-    def __init__(self, win_width):
-        self.x = win_width + random.randint(0, 100)
-        self.y = random.randint(40, Ground.ground_level - 40)
-        self.speed = random.uniform(1.0, 2.0)
+    def __init__(self, win_width, rng=random):
+        self.x = win_width + rng.randint(0, 100)
+        self.y = rng.randint(40, Ground.ground_level - 40)
+        self.speed = rng.uniform(1.0, 2.0)
         self.rect = pygame.Rect(self.x, self.y, self.SIZE, self.SIZE)
         self.off_screen = False
         self.wing_tick = 0
         # Slight vertical wobble
         self.base_y = self.y
-        self.wobble_amp = random.randint(5, 15)
-        self.wobble_freq = random.uniform(0.03, 0.07)
+        self.wobble_amp = rng.randint(5, 15)
+        self.wobble_freq = rng.uniform(0.03, 0.07)
 
     def update(self):
         self.x -= self.speed
@@ -233,6 +245,9 @@ class FlyingBlock:
         pygame.draw.circle(window, (0, 0, 0),
                            (self.rect.right - 3, self.rect.y + 5), 1)
 
+    def x_span(self):
+        return self.rect.left, self.rect.right
+
     def check_collision(self, player_rect):
         return self.rect.colliderect(player_rect)
 
@@ -245,14 +260,14 @@ class FallingObstacle:
     WIDTH = 16
     HEIGHT = 16
 
-    def __init__(self, win_width):
-        self.x = random.randint(50, win_width - 50)
+    def __init__(self, win_width, rng=random):
+        self.x = rng.randint(50, win_width - 50)
         self.y = -self.HEIGHT  # start above screen
-        self.fall_speed = random.uniform(1.0, 2.0)
+        self.fall_speed = rng.uniform(1.0, 2.0)
         self.rect = pygame.Rect(self.x, self.y, self.WIDTH, self.HEIGHT)
         self.off_screen = False
         self.rotation = 0
-        self.rot_speed = random.uniform(2.0, 6.0)
+        self.rot_speed = rng.uniform(2.0, 6.0)
 
     def update(self):
         self.y += self.fall_speed
@@ -281,6 +296,9 @@ class FallingObstacle:
         if self.y < 50:
             pygame.draw.line(window, (255, 150, 50, 120), (cx, 0), (cx, int(self.y)), 1)
 
+    def x_span(self):
+        return self.rect.left, self.rect.right
+
     def check_collision(self, player_rect):
         return self.rect.colliderect(player_rect)
 
@@ -293,23 +311,23 @@ class MultiHolePipes:
     """
     width = 15
 
-    def __init__(self, win_width):
+    def __init__(self, win_width, rng=random):
         self.x = win_width
         self.passed = False
         self.counted = False
         self.off_screen = False
 
-        num_holes = random.choice([2, 2, 3])
+        num_holes = rng.choice([2, 2, 3])
         total = Ground.ground_level
         min_gap = 60
-        real_gap = random.randint(85, 115)
+        real_gap = rng.randint(85, 115)
 
         # Generate segment boundaries
         segments = []
         remaining = total
         gaps = []
         for i in range(num_holes):
-            gap = real_gap if i == 0 else random.randint(min_gap, min_gap + 15)
+            gap = real_gap if i == 0 else rng.randint(min_gap, min_gap + 15)
             gaps.append(gap)
         total_gap = sum(gaps)
         total_wall = remaining - total_gap
@@ -319,7 +337,7 @@ class MultiHolePipes:
         # Distribute wall sections
         walls = []
         for i in range(num_holes + 1):
-            w = random.randint(15, max(20, total_wall // (num_holes + 1) + 10))
+            w = rng.randint(15, max(20, total_wall // (num_holes + 1) + 10))
             walls.append(w)
         # Scale walls to fit
         wall_sum = sum(walls)
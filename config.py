@@ -1,5 +1,7 @@
 import pygame
+import assets
 import components
+import spatial
 
 win_height = 720
 win_width = 900
@@ -10,7 +12,7 @@ show_lines = False
 jump_scale = 1.0
 
 ground = None
-pipes = []
+pipes = spatial.PipeTrack()
 
 
 def create_window():
@@ -27,6 +29,7 @@ def toggle_fullscreen():
     fullscreen = not fullscreen
     create_window()
     reset_ground()
+    assets.clear()
 
 
 def resize(width, height):
@@ -35,6 +38,7 @@ def resize(width, height):
     win_height = max(360, height)
     create_window()
     reset_ground()
+    assets.clear()
 
 
 def reset_ground():
@@ -1,5 +1,17 @@
 import random
 
+
+def mutated_weight(weight):
+    if random.uniform(0, 1) < 0.1:
+        return random.uniform(-2, 2)
+    weight += random.gauss(0, 1) / 5
+    if weight > 2:
+        weight = 2
+    if weight < -2:
+        weight = -2
+    return weight
+
+
 class Connection:
     def __init__(self, from_node, to_node, weight):
         self.from_node = from_node
@@ -7,15 +19,8 @@ class Connection:
         self.weight = weight
 
     def mutate_weight(self):
-        if random.uniform(0, 1) < 0.1:
-            self.weight = random.uniform(-2, 2)
-        else:
-            self.weight += random.gauss(0, 1) / 5
-            if self.weight > 2:
-                self.weight = 2
-            if self.weight < -2:
-                self.weight = -2
+        self.weight = mutated_weight(self.weight)
 
     def clone(self, from_node, to_node):
         clone = Connection(from_node, to_node, self.weight)
-        return clone
\ No newline at end of file
+        return clone
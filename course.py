@@ -0,0 +1,67 @@
+"""
+FlightX Course
+==============
+A seeded, replayable obstacle schedule.  Spawn number N gets one seed per
+obstacle kind ('pipe', 'wind', 'block', 'falling', 'coin'), and each
+obstacle draws its geometry from a `random.Random` built from that seed.
+
+The course therefore does not depend on the global `random` stream, on
+how many obstacles the score gates let through, or on which process
+plays it: `World`, `FlightXEnv` and parallel evaluators that share a
+Course (or just its seed) see the same obstacles.
+
+Usage:
+    c = Course(seed=42, length=500)      # precompute 500 spawns
+    c.save('courses/benchmark.json')
+    world.World(course=Course.load('courses/benchmark.json'))
+"""
+
+import json
+import random
+
+
+class Course:
+    VERSION = 1
+    KINDS = ('pipe', 'wind', 'block', 'falling', 'coin')
+
+    def __init__(self, seed=None, length=0):
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self._source = random.Random(self.seed)
+        self.entries = []
+        self.extend(length)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def extend(self, length):
+        """Precompute spawns up to `length` (spawns past the end are generated on demand)."""
+        while len(self.entries) < length:
+            self.entries.append({kind: self._source.randrange(2 ** 32) for kind in self.KINDS})
+
+    def rng(self, index, kind):
+        """Random stream for obstacle `kind` of spawn number `index` (0-based)."""
+        self.extend(index + 1)
+        return random.Random(self.entries[index][kind])
+
+    # ---- serialization ----
+    def to_dict(self):
+        return {'version': self.VERSION, 'seed': self.seed, 'entries': self.entries}
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != cls.VERSION:
+            raise ValueError(f"unsupported course version: {data.get('version')}")
+        course = cls(data['seed'])
+        # Stored entries win; spawns past them continue the seed's stream
+        course.extend(len(data['entries']))
+        course.entries = [dict(e) for e in data['entries']]
+        return course
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
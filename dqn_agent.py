@@ -8,7 +8,6 @@ exploration.  Trains headlessly using FlightXEnv.
 import os
 import random
 import json
-from collections import deque
 
 import numpy as np
 
@@ -20,12 +19,15 @@ try:
 except ImportError:
     TORCH_AVAILABLE = False
 
-from flightx_env import FlightXEnv
+from flightx_env import FlightXEnv, FlightXVecEnv
 
 
 # ---------------------------------------------------------------------------
 # Q‑Network
 # ---------------------------------------------------------------------------
+# Q-value index to action: flap(1), glide(0), drop(-1)
+ACTIONS = (1, 0, -1)
+
 if TORCH_AVAILABLE:
     class QNetwork(nn.Module):
         """MLP Q‑function: state (4) → Q‑values (3 actions)."""
@@ -42,6 +44,12 @@ if TORCH_AVAILABLE:
 
         def forward(self, x):
             return self.net(x)
+
+        def predict_actions(self, states):
+            """Greedy actions (1 flap, 0 glide, -1 drop) for a batch of states, one forward pass."""
+            with torch.no_grad():
+                idx = self(torch.tensor(states, dtype=torch.float32)).argmax(1).tolist()
+            return [ACTIONS[i] for i in idx]
 else:
     class QNetwork:
         def __init__(self, *a, **kw):
@@ -52,25 +60,162 @@ else:
 # Replay Buffer
 # ---------------------------------------------------------------------------
 class ReplayBuffer:
-    def __init__(self, capacity=50_000):
-        self.buffer = deque(maxlen=capacity)
+    """
+    Fixed-size ring buffer of transitions held in preallocated arrays, so
+    push() is O(1) and sample() is one fancy-index per field.
+
+    With `memmap_dir` the arrays are .npy files on disk (np.memmap), for
+    buffers of millions of transitions that should not live in RAM.
+    """
+
+    def __init__(self, capacity=50_000, state_dim=4, memmap_dir=None):
+        self.capacity = capacity
+        self.memmap_dir = memmap_dir
+        self.pos = 0
+        self.size = 0
+        self.rng = np.random.default_rng()
+
+        self.states = self._alloc('states', (capacity, state_dim), np.float32)
+        self.actions = self._alloc('actions', (capacity,), np.int64)
+        self.rewards = self._alloc('rewards', (capacity,), np.float32)
+        self.next_states = self._alloc('next_states', (capacity, state_dim), np.float32)
+        self.dones = self._alloc('dones', (capacity,), np.float32)
+
+    def _alloc(self, name, shape, dtype):
+        if self.memmap_dir is None:
+            return np.zeros(shape, dtype=dtype)
+        os.makedirs(self.memmap_dir, exist_ok=True)
+        path = os.path.join(self.memmap_dir, f'{name}.npy')
+        return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=shape)
 
     def push(self, state, action, reward, next_state, done):
-        self.buffer.append((state, action, reward, next_state, done))
+        i = self.pos
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+        self.pos = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def push_batch(self, states, actions, rewards, next_states, dones):
+        """Insert a batch of transitions (one per row) at once."""
+        idx = (self.pos + np.arange(len(actions))) % self.capacity
+        self.states[idx] = states
+        self.actions[idx] = actions
+        self.rewards[idx] = rewards
+        self.next_states[idx] = next_states
+        self.dones[idx] = dones
+        self.pos = int(idx[-1] + 1) % self.capacity
+        self.size = min(self.size + len(idx), self.capacity)
 
     def sample(self, batch_size):
-        batch = random.sample(self.buffer, batch_size)
-        states, actions, rewards, next_states, dones = zip(*batch)
+        idx = self.rng.choice(self.size, batch_size, replace=False)
         return (
-            np.array(states, dtype=np.float32),
-            np.array(actions, dtype=np.int64),
-            np.array(rewards, dtype=np.float32),
-            np.array(next_states, dtype=np.float32),
-            np.array(dones, dtype=np.float32),
+            self.states[idx],
+            self.actions[idx],
+            self.rewards[idx],
+            self.next_states[idx],
+            self.dones[idx],
         )
 
     def __len__(self):
-        return len(self.buffer)
+        return self.size
+
+
+class SumTree:
+    """
+    Binary tree whose leaves are per-transition priorities and whose inner
+    nodes hold subtree sums: O(log n) update and proportional lookup.
+    Both work on whole batches of indices at once.
+    """
+
+    def __init__(self, capacity):
+        # Heap layout: root at 1, leaves at [leaves, 2 * leaves)
+        self.leaves = 1 << max(0, (capacity - 1).bit_length())
+        self.depth = self.leaves.bit_length() - 1
+        self.tree = np.zeros(2 * self.leaves)
+
+    @property
+    def total(self):
+        return self.tree[1]
+
+    def get(self, idx):
+        return self.tree[np.asarray(idx) + self.leaves]
+
+    def update(self, idx, priorities):
+        node = np.asarray(idx) + self.leaves
+        self.tree[node] = priorities
+        for _ in range(self.depth):
+            node = np.unique(node // 2)
+            self.tree[node] = self.tree[2 * node] + self.tree[2 * node + 1]
+
+    def find(self, values):
+        """Leaf index for each value in [0, total): the prefix-sum search, one level per step."""
+        values = np.array(values, dtype=np.float64)
+        node = np.ones(len(values), dtype=np.int64)
+        for _ in range(self.depth):
+            left = self.tree[2 * node]
+            go_right = values > left
+            values -= np.where(go_right, left, 0)
+            node = 2 * node + go_right
+        return node - self.leaves
+
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    """
+    Proportional prioritized replay (Schaul et al.): transitions are drawn
+    with probability p^alpha / sum(p^alpha), where p is the last |TD error|,
+    and sample() also returns importance-sampling weights (annealed from
+    `beta` to 1) and the indices to pass back to update_priorities().
+    """
+
+    def __init__(self, capacity=50_000, state_dim=4, memmap_dir=None,
+                 alpha=0.6, beta=0.4, beta_increment=1e-4, eps=1e-3):
+        super().__init__(capacity, state_dim, memmap_dir)
+        self.tree = SumTree(capacity)
+        self.alpha = alpha
+        self.beta = beta
+        self.beta_increment = beta_increment
+        self.eps = eps
+        self.max_priority = 1.0
+
+    def push(self, state, action, reward, next_state, done):
+        # New transitions get the highest priority seen, so each is replayed at least once
+        i = self.pos
+        super().push(state, action, reward, next_state, done)
+        self.tree.update([i], self.max_priority ** self.alpha)
+
+    def push_batch(self, states, actions, rewards, next_states, dones):
+        idx = (self.pos + np.arange(len(actions))) % self.capacity
+        super().push_batch(states, actions, rewards, next_states, dones)
+        self.tree.update(idx, self.max_priority ** self.alpha)
+
+    def sample(self, batch_size):
+        # Stratified: one draw from each of batch_size equal slices of the total
+        total = self.tree.total
+        values = (np.arange(batch_size) + self.rng.random(batch_size)) * (total / batch_size)
+        idx = np.minimum(self.tree.find(values), self.size - 1)
+
+        probs = self.tree.get(idx) / total
+        weights = (self.size * probs) ** -self.beta
+        weights /= weights.max()
+        self.beta = min(1.0, self.beta + self.beta_increment)
+
+        return (
+            self.states[idx],
+            self.actions[idx],
+            self.rewards[idx],
+            self.next_states[idx],
+            self.dones[idx],
+            weights.astype(np.float32),
+            idx,
+        )
+
+    def update_priorities(self, idx, td_errors):
+        priorities = np.abs(td_errors) + self.eps
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+        self.tree.update(idx, priorities ** self.alpha)
 
 
 # ---------------------------------------------------------------------------
@@ -80,7 +225,8 @@ class DQNAgent:
     """
     DQN agent with target network and ε‑greedy exploration.
 
-    Call `train()` to run headless training.
+    Call `train()` to run headless training (`num_envs > 1` steps that many
+    environments at once and picks all their actions in one forward pass).
     Call `load_model()` to load a saved model for inference.
     """
 
@@ -99,6 +245,8 @@ class DQNAgent:
         batch_size=64,
         target_update=1000,
         buffer_capacity=50_000,
+        replay_dir=None,
+        prioritized=False,
     ):
         if not TORCH_AVAILABLE:
             raise RuntimeError("PyTorch is required. Run: pip install torch")
@@ -119,7 +267,11 @@ class DQNAgent:
 
         self.optimizer = optim.Adam(self.policy_net.parameters(), lr=lr)
         self.criterion = nn.SmoothL1Loss()  # Huber loss
-        self.buffer = ReplayBuffer(buffer_capacity)
+        # replay_dir: keep the replay arrays memory-mapped in this directory
+        # prioritized: sample by TD error and weight the loss (PrioritizedReplayBuffer)
+        self.prioritized = prioritized
+        buffer_cls = PrioritizedReplayBuffer if prioritized else ReplayBuffer
+        self.buffer = buffer_cls(buffer_capacity, state_dim, memmap_dir=replay_dir)
 
         self.steps_done = 0
         self.training_log = []   # list of {"episode", "reward", "score", "epsilon"}
@@ -132,12 +284,24 @@ class DQNAgent:
             q = self.policy_net(torch.tensor([state], dtype=torch.float32))
             return q.argmax(1).item()
 
+    def select_actions(self, states):
+        """ε-greedy actions for a batch of states, with one forward pass."""
+        with torch.no_grad():
+            q = self.policy_net(torch.as_tensor(np.asarray(states, dtype=np.float32)))
+        actions = q.argmax(1).numpy()
+        explore = np.random.random(len(actions)) < self.epsilon
+        actions[explore] = np.random.randint(0, self.action_dim, explore.sum())
+        return actions
+
     # ---- one gradient step ----
     def _learn(self):
         if len(self.buffer) < self.batch_size:
             return
 
-        states, actions, rewards, next_states, dones = self.buffer.sample(self.batch_size)
+        if self.prioritized:
+            states, actions, rewards, next_states, dones, weights, idx = self.buffer.sample(self.batch_size)
+        else:
+            states, actions, rewards, next_states, dones = self.buffer.sample(self.batch_size)
 
         s = torch.tensor(states)
         a = torch.tensor(actions).unsqueeze(1)
@@ -151,20 +315,29 @@ class DQNAgent:
             next_q = self.target_net(ns).max(1, keepdim=True)[0]
             target = r + self.gamma * next_q * (1 - d)
 
-        loss = self.criterion(q_values, target)
+        if self.prioritized:
+            # Importance-sampling weighted Huber loss; |TD error| becomes the new priority
+            w = torch.as_tensor(weights).unsqueeze(1)
+            loss = (w * nn.functional.smooth_l1_loss(q_values, target, reduction='none')).mean()
+            self.buffer.update_priorities(idx, (target - q_values).detach().squeeze(1).numpy())
+        else:
+            loss = self.criterion(q_values, target)
         self.optimizer.zero_grad()
         loss.backward()
         nn.utils.clip_grad_norm_(self.policy_net.parameters(), 1.0)
         self.optimizer.step()
 
     # ---- training loop ----
-    def train(self, num_episodes=500, max_steps=5000, progress_callback=None):
+    def train(self, num_episodes=500, max_steps=5000, progress_callback=None, num_envs=1):
         """
         Run headless training.
         progress_callback(episode, total, reward, score, epsilon) is called
         each episode for UI updates.
         Returns the training log.
         """
+        if num_envs > 1:
+            return self._train_vec(num_episodes, max_steps, progress_callback, num_envs)
+
         env = FlightXEnv()
 
         for ep in range(1, num_episodes + 1):
@@ -188,32 +361,72 @@ class DQNAgent:
                 if done:
                     break
 
-            # Decay epsilon
-            self.epsilon = max(self.epsilon_end, self.epsilon * self.epsilon_decay)
+            self._end_episode(ep, num_episodes, total_reward, info.get('score', 0), progress_callback)
 
-            entry = {
-                'episode': ep,
-                'reward': round(total_reward, 2),
-                'score': info.get('score', 0),
-                'epsilon': round(self.epsilon, 4),
-            }
-            self.training_log.append(entry)
-
-            if ep % 10 == 0 or ep == 1:
-                print(
-                    f"[DQN] Ep {ep}/{num_episodes}  "
-                    f"Reward={total_reward:.1f}  Score={info['score']}  "
-                    f"ε={self.epsilon:.3f}"
-                )
+        # Save
+        self.save_model()
+        self._save_log()
+        return self.training_log
 
-            if progress_callback:
-                progress_callback(ep, num_episodes, total_reward, info['score'], self.epsilon)
+    def _train_vec(self, num_episodes, max_steps, progress_callback, num_envs):
+        """
+        train() over a FlightXVecEnv: every vector step adds one transition
+        per env to the buffer and takes one gradient step.
+        """
+        envs = FlightXVecEnv(num_envs, max_steps=max_steps)
+        states = envs.reset()
+        returns = np.zeros(num_envs)
+        ep = 0
+
+        while ep < num_episodes:
+            actions = self.select_actions(states)
+            next_states, rewards, dones, info = envs.step(actions)
+            self.buffer.push_batch(states, actions, rewards, info['final_state'], dones)
+            returns += rewards
+            states = next_states
+
+            prev_steps = self.steps_done
+            self.steps_done += num_envs
+            self._learn()
+
+            # Sync target network
+            if self.steps_done // self.target_update_freq > prev_steps // self.target_update_freq:
+                self.target_net.load_state_dict(self.policy_net.state_dict())
+
+            for i in np.flatnonzero(dones | info['truncated']):
+                if ep < num_episodes:
+                    ep += 1
+                    self._end_episode(ep, num_episodes, float(returns[i]), int(info['score'][i]),
+                                      progress_callback)
+                returns[i] = 0
 
         # Save
         self.save_model()
         self._save_log()
         return self.training_log
 
+    def _end_episode(self, ep, num_episodes, total_reward, score, progress_callback):
+        # Decay epsilon
+        self.epsilon = max(self.epsilon_end, self.epsilon * self.epsilon_decay)
+
+        entry = {
+            'episode': ep,
+            'reward': round(total_reward, 2),
+            'score': score,
+            'epsilon': round(self.epsilon, 4),
+        }
+        self.training_log.append(entry)
+
+        if ep % 10 == 0 or ep == 1:
+            print(
+                f"[DQN] Ep {ep}/{num_episodes}  "
+                f"Reward={total_reward:.1f}  Score={score}  "
+                f"ε={self.epsilon:.3f}"
+            )
+
+        if progress_callback:
+            progress_callback(ep, num_episodes, total_reward, score, self.epsilon)
+
     def save_model(self):
         torch.save(self.policy_net.state_dict(), self.MODEL_FILE)
         print(f"[DQN] Model saved to {self.MODEL_FILE}")
@@ -242,10 +455,7 @@ class DQNAgent:
     @staticmethod
     def predict_action(model, state_list):
         """Given a QNetwork and state list, return action int: 1 (flap), 0 (glide), -1 (drop)."""
-        with torch.no_grad():
-            q = model(torch.tensor([state_list], dtype=torch.float32))
-            idx = q.argmax(1).item()
-        return [1, 0, -1][idx]
+        return model.predict_actions([state_list])[0]
 
     @staticmethod
     def load_training_log():
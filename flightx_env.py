@@ -1,11 +1,17 @@
 """
 FlightX Headless Environment
 =============================
-Gym-like wrapper around the FlightX game physics for RL training.
-No Pygame rendering — pure numerical simulation.
+Gym-like wrapper around the FlightX game for RL training.
+It steps the game's own World (every pipe type, wind, coins, flying blocks
+and falling obstacles) and Plane physics — no Pygame rendering, no window.
 """
 
-import random
+import numpy as np
+
+import config
+import player
+import spatial
+import world
 
 
 class FlightXEnv:
@@ -19,91 +25,50 @@ class FlightXEnv:
 
     State (4 floats, same as Player.vision):
         [y_offset_to_gap, x_distance_to_pipe, gap_size_norm, velocity_norm]
+
+    Each step() runs one game tick in the same order as World.step(): the
+    action is applied where a Player would think(), the plane moves, the
+    obstacles act, and the next state is what Player.look() sees on the
+    following tick.
     """
 
-    # Physics constants (mirror components.py / player.py)
-    GRAVITY = 0.25
-    MAX_VEL = 5
-    FLAP_IMPULSE = 2.2
-    FLAP_CEILING = -5.0
-    DROP_ACCEL = 0.9
-    DROP_MAX = 6.0
-    PIPE_SPEED = 1
-    PIPE_WIDTH = 15
-    SPAWN_INTERVAL = 200
-
-    def __init__(self, win_width=900, win_height=720):
-        self.win_width = win_width
-        self.win_height = win_height
-        self.ground_y = int(win_height * 0.8)
+    FLAP, GLIDE, DROP = 0, 1, 2
+
+    # Rewards
+    SURVIVE_REWARD = 0.1
+    POINT_REWARD = 10.0     # per point of game score (pipes passed and coin bonuses)
+    CRASH_REWARD = -100.0
+
+    def __init__(self, course=None):
+        # Replays `course` (a course.Course) on every reset, or rolls a fresh
+        # one per episode.  Own pipe list: training may run while the game is on screen.
+        self.world = world.World(course, pipes=spatial.PipeTrack())
         self.reset()
 
     def reset(self):
-        self.player_x = 50
-        self.player_y = 200
-        self.player_vel = 0.0
-        self.pipes = []
-        self.spawn_timer = 10
-        self.score = 0
-        self.alive = True
+        self.world.reset()
+        self.plane = player.Plane(pipes=self.world.pipes)
         self.steps = 0
+        self._advance_course()
         return self._get_state()
 
-    # ---- internal pipe helpers ----
-    def _spawn_pipe(self):
-        opening = random.randint(90, 130)
-        bottom_h = random.randint(10, 300)
-        top_h = self.ground_y - bottom_h - opening
-        self.pipes.append({
-            'x': self.win_width,
-            'top_h': top_h,
-            'bottom_y': self.ground_y - bottom_h,
-            'opening': opening,
-            'passed': False,
-            'counted': False,
-        })
-
-    def _closest_pipe(self):
-        for p in self.pipes:
-            if not p['passed']:
-                return p
-        return None
+    @property
+    def score(self):
+        return self.world.score
+
+    @property
+    def alive(self):
+        return self.plane.alive
+
+    # ---- internal helpers ----
+    def _advance_course(self):
+        """Spawn and scroll obstacles, then let the plane look (start of a game tick)."""
+        self.world.spawn_tick()
+        self.world.update_pipes([self.plane])
+        self.plane.look()
 
     def _get_state(self):
-        p = self._closest_pipe()
-        if p is None:
-            return [0.0, 0.0, 0.0, self._clamp(self.player_vel / 10)]
-        gap_center = (p['top_h'] + p['bottom_y']) / 2
-        return [
-            self._clamp((self.player_y - gap_center) / 250),
-            self._clamp((p['x'] - self.player_x) / 400),
-            self._clamp(p['opening'] / 150),
-            self._clamp(self.player_vel / 10),
-        ]
-
-    @staticmethod
-    def _clamp(v, lo=-1, hi=1):
-        return max(lo, min(hi, v))
-
-    # ---- collision checks ----
-    def _collides(self):
-        # Ground / ceiling
-        if self.player_y + 14 >= self.ground_y or self.player_y - 14 < 0:
-            return True
-        # Pipes (simple AABB, half-size 14 matching Player inflate(-12,-12) on 40×40)
-        px, py = self.player_x, self.player_y
-        half = 14
-        for p in self.pipes:
-            pipe_left = p['x']
-            pipe_right = p['x'] + self.PIPE_WIDTH
-            if px + half > pipe_left and px - half < pipe_right:
-                # Top pipe
-                if py - half < p['top_h']:
-                    return True
-                # Bottom pipe
-                if py + half > p['bottom_y']:
-                    return True
-        return False
+        return list(self.plane.vision)
 
     # ---- step ----
     def step(self, action):
@@ -111,47 +76,74 @@ class FlightXEnv:
         Execute one frame.
         Returns (state, reward, done, info).
         """
-        if not self.alive:
+        if not self.plane.alive:
             return self._get_state(), 0.0, True, {'score': self.score}
 
+        score_before = self.world.score
+
         # Action
-        if action == 0:   # flap
-            if self.player_y - 14 > 0:
-                self.player_vel = max(self.player_vel - self.FLAP_IMPULSE, self.FLAP_CEILING)
-        elif action == 2:  # drop
-            self.player_vel = min(self.player_vel + self.DROP_ACCEL, self.DROP_MAX)
-        # action == 1 → glide (do nothing)
-
-        # Physics
-        self.player_vel += self.GRAVITY
-        self.player_vel = min(self.player_vel, self.MAX_VEL)
-        self.player_y += self.player_vel
+        if action == self.FLAP:
+            self.plane.bird_flap()
+        elif action == self.DROP:
+            self.plane.bird_drop()
+        # GLIDE → do nothing
+
+        # Physics and obstacles
+        self.plane.update(config.ground)
+        self.world.update_obstacles([self.plane])
         self.steps += 1
 
-        # Pipes
-        self.spawn_timer -= 1
-        if self.spawn_timer <= 0:
-            self._spawn_pipe()
-            self.spawn_timer = self.SPAWN_INTERVAL
-
-        reward = 0.1  # survival reward per frame
-
-        for p in self.pipes:
-            p['x'] -= self.PIPE_SPEED
-            if p['x'] + self.PIPE_WIDTH <= self.player_x and not p['passed']:
-                p['passed'] = True
-            if p['passed'] and not p['counted']:
-                p['counted'] = True
-                self.score += 1
-                reward += 10.0  # pipe passed bonus
-
-        # Remove off-screen
-        self.pipes = [p for p in self.pipes if p['x'] > -self.PIPE_WIDTH]
-
-        # Collision
-        if self._collides():
-            self.alive = False
-            reward = -100.0
-
-        state = self._get_state()
-        return state, reward, not self.alive, {'score': self.score}
+        if not self.plane.alive:
+            return self._get_state(), self.CRASH_REWARD, True, {'score': self.score}
+
+        self._advance_course()
+        reward = self.SURVIVE_REWARD + self.POINT_REWARD * (self.world.score - score_before)
+        return self._get_state(), reward, False, {'score': self.score}
+
+
+class FlightXVecEnv:
+    """
+    N FlightXEnv instances stepped together, with batched NumPy I/O so a
+    policy can pick every env's action in one forward pass.
+
+    Finished envs reset automatically: for a done env the returned state
+    is the first state of its next episode, and info['final_state'] holds
+    the state the episode ended on.  Episodes longer than `max_steps` are
+    cut short the same way and flagged in info['truncated'].
+    """
+
+    def __init__(self, num_envs, course=None, max_steps=None):
+        self.envs = [FlightXEnv(course) for _ in range(num_envs)]
+        self.max_steps = max_steps
+
+    def __len__(self):
+        return len(self.envs)
+
+    def reset(self):
+        return np.array([env.reset() for env in self.envs], dtype=np.float32)
+
+    def step(self, actions):
+        """
+        actions: one action per env.
+        Returns (states, rewards, dones, info) as arrays of length N; info
+        has 'score', 'final_state' and 'truncated'.
+        """
+        n = len(self.envs)
+        states = np.empty((n, 4), dtype=np.float32)
+        final_states = np.empty((n, 4), dtype=np.float32)
+        rewards = np.empty(n, dtype=np.float32)
+        dones = np.zeros(n, dtype=bool)
+        truncated = np.zeros(n, dtype=bool)
+        scores = np.empty(n, dtype=np.int64)
+
+        for i, env in enumerate(self.envs):
+            state, rewards[i], dones[i], info = env.step(int(actions[i]))
+            scores[i] = info['score']
+            final_states[i] = state
+            truncated[i] = not dones[i] and self.max_steps is not None and env.steps >= self.max_steps
+            if dones[i] or truncated[i]:
+                state = env.reset()
+            states[i] = state
+
+        return states, rewards, dones, {'score': scores, 'final_state': final_states,
+                                        'truncated': truncated}
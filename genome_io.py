@@ -0,0 +1,175 @@
+"""
+FlightX Genome Files
+====================
+Compact, versioned storage for brain weights, replacing pickled Brain
+objects.  A file holds any number of genomes that share one topology:
+
+    header   64-byte aligned, little-endian
+             magic 'FXGENOME', version (u16), itemsize (u8: 4 or 8),
+             inputs (u16), hidden layer count (u16), genome count (u32),
+             genome length (u32), then one u16 per hidden layer
+    weights  count × length floats (float32 by default), each row a flat
+             genome in Brain.genome() order
+
+The weights start on a 64-byte boundary, so they can be memory-mapped
+straight into a (count, length) array: read() does that, and a champion
+load only touches its own row.
+
+Legacy champion.pkl files (a pickled Brain) are still accepted by
+load_brain() and load_brains(); convert one with
+    python genome_io.py champion.pkl champion.fxg
+"""
+
+import os
+import pickle
+import struct
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+import brain
+
+
+MAGIC = b'FXGENOME'
+VERSION = 1
+ALIGN = 64
+_FIXED = struct.Struct('<8sHBxHHII')
+
+# Where the game and trainer keep the champion; the legacy pickle is read if the new file is missing
+CHAMPION_FILE = 'champion.fxg'
+LEGACY_CHAMPION_FILE = 'champion.pkl'
+
+GenomeFile = namedtuple('GenomeFile', 'inputs hidden_layers genomes')
+
+
+class GenomeFormatError(ValueError):
+    pass
+
+
+def _header(inputs, hidden_layers, count, length, itemsize):
+    head = _FIXED.pack(MAGIC, VERSION, itemsize, inputs, len(hidden_layers), count, length)
+    head += struct.pack(f'<{len(hidden_layers)}H', *hidden_layers)
+    return head + b'\0' * (-len(head) % ALIGN)
+
+
+def _read_header(f):
+    fixed = f.read(_FIXED.size)
+    if len(fixed) < _FIXED.size or not fixed.startswith(MAGIC):
+        raise GenomeFormatError('not a FlightX genome file')
+    _, version, itemsize, inputs, layers, count, length = _FIXED.unpack(fixed)
+    if version != VERSION:
+        raise GenomeFormatError(f'unsupported genome file version {version}')
+    if itemsize not in (4, 8):
+        raise GenomeFormatError(f'unsupported weight size {itemsize}')
+    hidden = list(struct.unpack(f'<{layers}H', f.read(2 * layers)))
+    offset = _FIXED.size + 2 * layers
+    offset += -offset % ALIGN
+    return inputs, hidden, count, length, np.dtype(f'<f{itemsize}'), offset
+
+
+def genome_length(inputs, hidden_layers):
+    """Weights in a fully layered brain with this topology (bias included)."""
+    sizes = [inputs + 1] + list(hidden_layers) + [1]
+    return sum(a * b for a, b in zip(sizes, sizes[1:]))
+
+
+def write(path, genomes, inputs, hidden_layers, dtype=np.float32):
+    """
+    Write `genomes` ((count, length) array) atomically: the file is built
+    next to `path` and renamed over it, so a reader never sees half a file.
+    """
+    dtype = np.dtype(dtype).newbyteorder('<')
+    genomes = np.asarray(genomes, dtype=dtype)
+    if genomes.ndim != 2 or genomes.shape[1] != genome_length(inputs, hidden_layers):
+        raise GenomeFormatError(f'genomes of shape {genomes.shape} do not match '
+                                f'{inputs} inputs and hidden layers {list(hidden_layers)}')
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_header(inputs, hidden_layers, len(genomes), genomes.shape[1], dtype.itemsize))
+        f.write(np.ascontiguousarray(genomes).tobytes())
+    os.replace(tmp, path)
+
+
+def read(path, mmap=True):
+    """The GenomeFile at `path`; its genomes are a read-only memory map unless `mmap` is False."""
+    with open(path, 'rb') as f:
+        inputs, hidden, count, length, dtype, offset = _read_header(f)
+        if not mmap or count * length == 0:
+            f.seek(offset)
+            genomes = np.fromfile(f, dtype=dtype, count=count * length).reshape(count, length)
+            return GenomeFile(inputs, hidden, genomes)
+    genomes = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count, length))
+    return GenomeFile(inputs, hidden, genomes)
+
+
+def save_brains(path, brains, dtype=np.float32):
+    """Store fully layered brains that share one topology."""
+    first = brains[0]
+    length = genome_length(first.inputs, first.hidden_layers)
+    genomes = np.empty((len(brains), length))
+    for row, b in zip(genomes, brains):
+        g = b.genome()
+        if len(g) != length or b.inputs != first.inputs or list(b.hidden_layers) != list(first.hidden_layers):
+            raise GenomeFormatError('brains must all be fully layered with the same topology')
+        row[:] = g
+    write(path, genomes, first.inputs, first.hidden_layers, dtype)
+
+
+def _brain(inputs, hidden_layers, genome):
+    b = brain.Brain(inputs, list(hidden_layers), True)
+    b.load_genome(genome)
+    return b
+
+
+def _legacy(path):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def is_genome_file(path):
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_brains(path, rows=None):
+    """Brains for `rows` (default: every genome) of the file; a legacy pickle gives one brain."""
+    if not is_genome_file(path):
+        return [_legacy(path)]
+    gf = read(path)
+    genomes = gf.genomes if rows is None else gf.genomes[rows]
+    # Brains compute in float64; one conversion for the whole block
+    genomes = np.array(genomes, dtype=np.float64)
+    return [_brain(gf.inputs, gf.hidden_layers, g) for g in genomes]
+
+
+def load_brain(path, index=0):
+    """Brain number `index` in the file at `path` (or the Brain pickled there)."""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            f.seek(0)
+            return pickle.load(f)
+        f.seek(0)
+        inputs, hidden, count, length, dtype, offset = _read_header(f)
+        if not -count <= index < count:
+            raise IndexError(f'{path} holds {count} genomes')
+        # Read just this genome's row
+        f.seek(offset + (index % count) * length * dtype.itemsize)
+        genome = np.fromfile(f, dtype=dtype, count=length).astype(np.float64)
+    return _brain(inputs, hidden, genome)
+
+
+def champion_path():
+    """The saved champion to load: CHAMPION_FILE, else the legacy pickle, else None."""
+    for path in (CHAMPION_FILE, LEGACY_CHAMPION_FILE):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print('usage: python genome_io.py champion.pkl champion.fxg')
+        sys.exit(2)
+    save_brains(sys.argv[2], load_brains(sys.argv[1]))
+    print(f'[GENOME] Wrote {sys.argv[2]}')
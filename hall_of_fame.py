@@ -0,0 +1,121 @@
+"""
+FlightX Hall of Fame
+====================
+An SQLite archive of species champions.  After every generation each
+species' champion is recorded with its fitness, score, generation and a
+hash of its genome; a genome already in the archive only has its record
+raised if it did better.  Rows are indexed by fitness, so the best
+champions ever evolved come back with one query.
+
+elite(k) returns up to k top brains that are at least a species
+threshold apart from each other, which Population.load_champion() uses
+to seed a diverse population instead of copies of one brain.
+
+Usage:
+    hof = hall_of_fame.HallOfFame()           # hall_of_fame.sqlite
+    hof.record_generation(pop.species, generation)
+    hof.top(10)                               # Entry rows, best first
+    brains = hof.elite(10)
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections import namedtuple
+
+import numpy as np
+
+import brain
+import genome_io
+import species
+
+
+HALL_OF_FAME_FILE = 'hall_of_fame.sqlite'
+
+Entry = namedtuple('Entry', 'genome_hash fitness score generation inputs hidden_layers genome')
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS champions (
+    genome_hash TEXT PRIMARY KEY,
+    fitness REAL NOT NULL,
+    score INTEGER NOT NULL,
+    generation INTEGER NOT NULL,
+    inputs INTEGER NOT NULL,
+    hidden_layers TEXT NOT NULL,
+    genome BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS champions_by_fitness ON champions (fitness DESC);
+CREATE INDEX IF NOT EXISTS champions_by_generation ON champions (generation);
+'''
+
+
+def genome_hash(genome):
+    """Short content hash of a genome's float64 weights."""
+    return hashlib.sha1(np.asarray(genome, dtype='<f8').tobytes()).hexdigest()[:20]
+
+
+class HallOfFame:
+    """
+    The archive at `path`.  The connection may be used from the thread
+    that runs the simulation as well as the UI thread (not concurrently).
+    """
+
+    # elite() looks through this many candidates per requested brain
+    CANDIDATES = 20
+
+    def __init__(self, path=HALL_OF_FAME_FILE):
+        self.path = path
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __len__(self):
+        return self.db.execute('SELECT COUNT(*) FROM champions').fetchone()[0]
+
+    def record_generation(self, species_list, generation):
+        """Archive the champion of every species in `species_list` (fully layered brains only)."""
+        rows = []
+        for s in species_list:
+            b = s.champion.brain
+            genome = np.asarray(b.genome(), dtype='<f8')
+            if len(genome) != genome_io.genome_length(b.inputs, b.hidden_layers):
+                continue
+            rows.append((genome_hash(genome), float(s.benchmark_fitness), int(s.champion_score),
+                         generation, b.inputs, json.dumps(list(b.hidden_layers)), genome.tobytes()))
+        with self.db:
+            self.db.executemany(
+                'INSERT INTO champions VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (genome_hash) DO UPDATE SET '
+                'fitness = excluded.fitness, score = excluded.score, generation = excluded.generation '
+                'WHERE excluded.fitness > champions.fitness', rows)
+
+    def top(self, k=10):
+        """The k fittest archived champions, best first."""
+        rows = self.db.execute('SELECT * FROM champions ORDER BY fitness DESC LIMIT ?', (k,))
+        return [Entry(h, fitness, score, generation, inputs, json.loads(hidden), np.frombuffer(blob, dtype='<f8'))
+                for h, fitness, score, generation, inputs, hidden, blob in rows]
+
+    def elite(self, k=10, min_distance=species.Species.THRESHOLD):
+        """
+        Up to k brains, fittest first, skipping any within `min_distance`
+        (Species.weight_difference) of one already picked.
+        """
+        picked = []
+        for entry in self.top(k * self.CANDIDATES):
+            same_layout = [e for e in picked if len(e.genome) == len(entry.genome)]
+            if same_layout:
+                distances = species.genome_distances(np.stack([e.genome for e in same_layout]), entry.genome)
+                if (distances < min_distance).any():
+                    continue
+            picked.append(entry)
+            if len(picked) == k:
+                break
+        return [to_brain(e) for e in picked]
+
+
+def to_brain(entry):
+    b = brain.Brain(entry.inputs, list(entry.hidden_layers), True)
+    b.load_genome(entry.genome)
+    return b
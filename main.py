@@ -3,9 +3,17 @@ import pygame
 from sys import exit
 import threading
 import random
+import assets
+import checkpoint
 import config
 import components
+import genome_io
+import hall_of_fame
+import model_registry
+import perf
 import population
+import simulation
+import world
 import matplotlib
 
 try:
@@ -23,25 +31,35 @@ config.create_window()
 pygame.display.set_icon(pygame.image.load('Assets/aeroplane.jpg'))
 config.reset_ground()
 
-background_top = pygame.image.load('Assets/sky2.jpg').convert()
-background_bottom = pygame.image.load('Assets/dark1.jpg').convert()
-main_menu_bg = pygame.image.load('Assets/mainmenu.png').convert_alpha()
+# Backgrounds are scaled to the window once and cached (see assets.py)
+BACKGROUND_TOP = 'Assets/sky2.jpg'
+BACKGROUND_BOTTOM = 'Assets/dark1.jpg'
+MAIN_MENU_BG = 'Assets/mainmenu.png'
+FONT_FILE = 'font/Pixeltype.ttf'
 
 population_manager = population.Population(100)
-game_state = {'pipes_spawn_time': 10, 'score': 0, 'high_score': 0,
-              'wind_zones': [], 'coins': [], 'flying_blocks': [],
-              'falling_obstacles': [], 'obstacle_counter': 0}
+sim_world = world.World()
 graph_state = {'data': [], 'last_logged_gen': None, 'dirty': False}
 ui_state = {
     'simulation_speed': 0.0,
     'slider_dragging': False,
         'jump_dragging': False,
     'is_paused': False,
+    'turbo': False,
 }
+# Worker thread running the current mode's simulation (see simulation.py)
+sim_thread = None
+# Population checkpoints: every 10 generations, on Restart and on quit (C resumes)
+checkpointer = checkpoint.Checkpointer(checkpoint.CHECKPOINT_FILE, every=10)
+# Every generation's species champions; L seeds the population from the best of them
+hall = hall_of_fame.HallOfFame()
+HALL_OF_FAME_ELITE = 10
 notification_state = {
     'message': '',
     'timer': 0,
-    'duration': 120  # frames (2 seconds at 60fps)
+    'duration': 120,  # frames (2 seconds at 60fps)
+    'text': None,     # rendered message the faded surface was built from
+    'surface': None,
 }
 
 music_tracks = {
@@ -103,9 +121,9 @@ def get_fonts():
     menu_size = max(28, int(base * 0.08))
     author_size = max(32, int(base * 0.1))
     return (
-        pygame.font.Font('font/Pixeltype.ttf', title_size),
-        pygame.font.Font('font/Pixeltype.ttf', menu_size),
-        pygame.font.Font('font/Pixeltype.ttf', author_size),
+        assets.font(FONT_FILE, title_size),
+        assets.font(FONT_FILE, menu_size),
+        assets.font(FONT_FILE, author_size),
     )
 
 
@@ -123,44 +141,6 @@ def play_click():
         click_sound.play()
 
 
-def generate_pipes():
-    score = game_state['score']
-    game_state['obstacle_counter'] += 1
-    counter = game_state['obstacle_counter']
-
-    # ── Pipe type selection (score-gated) ──
-    if score >= 30 and counter % 3 == 0:
-        pipe = components.MultiHolePipes(config.win_width)
-        config.pipes.append(pipe)
-    elif counter % 4 == 0:
-        pipe = components.MovingPipes(config.win_width)
-        config.pipes.append(pipe)
-    else:
-        pipe = components.Pipes(config.win_width)
-        config.pipes.append(pipe)
-
-    # ── Compute gap center of the pipe just spawned ──
-    gap_y = None
-    if hasattr(pipe, 'top_rect') and hasattr(pipe, 'bottom_rect'):
-        gap_y = int((pipe.top_height + (components.Ground.ground_level - pipe.bottom_height)) / 2)
-
-    # ── Wind zones: after 50 pts ──
-    if score >= 50 and counter % 4 == 0:
-        game_state['wind_zones'].append(components.WindZone(config.win_width))
-
-    # ── Flying blocks: after 20 pts ──
-    if score >= 20 and counter % 3 == 0:
-        game_state['flying_blocks'].append(components.FlyingBlock(config.win_width))
-
-    # ── Falling obstacles: after 15 pts ──
-    if score >= 15 and counter % 3 == 0:
-        game_state['falling_obstacles'].append(components.FallingObstacle(config.win_width))
-
-    # ── Coins: placed between pipes at gap center ──
-    if counter % 3 == 0:
-        game_state['coins'].append(components.Coin(config.win_width, gap_y))
-
-
 def draw_background():
     ground_y = components.Ground.ground_level
     ground_h = getattr(config.ground, 'rect', pygame.Rect(0, 0, 0, 8)).height if config.ground else 8
@@ -168,26 +148,62 @@ def draw_background():
     bottom_y = ground_y + ground_h
     bottom_h = max(1, config.win_height - bottom_y)
 
-    top_scaled = pygame.transform.smoothscale(background_top, (config.win_width, top_h))
-    bottom_scaled = pygame.transform.smoothscale(background_bottom, (config.win_width, bottom_h))
+    top_scaled = assets.image(BACKGROUND_TOP, (config.win_width, top_h), alpha=False)
+    bottom_scaled = assets.image(BACKGROUND_BOTTOM, (config.win_width, bottom_h), alpha=False)
 
     config.window.blit(top_scaled, (0, 0))
     config.window.blit(bottom_scaled, (0, bottom_y))
 
 
+def cached_box(size, fill, border=None, border_width=2, border_radius=0):
+    """Translucent (optionally outlined) box, drawn once per look and size and then reused."""
+    def build():
+        box = pygame.Surface(size, pygame.SRCALPHA)
+        box.fill(fill)
+        if border:
+            pygame.draw.rect(box, border, box.get_rect(), border_width, border_radius=border_radius)
+        return box
+    return assets.surface(('box', size, fill, border, border_width, border_radius), build)
+
+
+def save_checkpoint(background=True):
+    """Checkpoint the population once it has evolved at least one generation."""
+    if population_manager.species:
+        checkpointer.save(population_manager, background)
+
+
+def resume_checkpoint():
+    global population_manager
+    try:
+        population_manager = checkpoint.load(checkpoint.CHECKPOINT_FILE)
+    except (OSError, ValueError, KeyError) as e:
+        print(f'[CHECKPOINT] Could not resume: {e}')
+        show_notification('No checkpoint to resume!')
+        return
+    sim_world.reset()
+    graph_state['data'].clear()
+    graph_state['last_logged_gen'] = None
+    graph_state['dirty'] = False
+    show_notification(f'Resumed at generation {population_manager.generation}')
+
+
+def load_champion():
+    """
+    Restart the evolution seeded from the hall of fame's elite (or the
+    saved champion file when the hall is empty).
+    """
+    elite = hall.elite(HALL_OF_FAME_ELITE)
+    restart_simulation()
+    return population_manager.load_champion(elite=elite)
+
+
 def restart_simulation():
     global population_manager
+    save_checkpoint()
     population_manager = population.Population(100)
     population_manager.generation = 0
-    config.pipes.clear()
-    game_state['pipes_spawn_time'] = 10
-    game_state['score'] = 0
-    game_state['high_score'] = 0
-    game_state['wind_zones'] = []
-    game_state['coins'] = []
-    game_state['flying_blocks'] = []
-    game_state['falling_obstacles'] = []
-    game_state['obstacle_counter'] = 0
+    sim_world.reset()
+    sim_world.high_score = 0
     ui_state['is_paused'] = False
     graph_state['data'].clear()
     graph_state['last_logged_gen'] = None
@@ -200,6 +216,24 @@ def update_slider_from_mouse(x_pos, track_rect):
     ui_state['simulation_speed'] = round(ratio * 10.0, 2)
 
 
+def toggle_turbo():
+    ui_state['turbo'] = not ui_state['turbo']
+    show_notification('Turbo ON' if ui_state['turbo'] else 'Turbo OFF')
+
+
+# Per-generation timings are appended here while the perf HUD is on (see perf.py)
+PERF_LOG = 'perf_log.jsonl'
+
+
+def toggle_perf():
+    if perf.recorder is None:
+        perf.enable(PERF_LOG)
+        show_notification(f'Perf HUD ON (logging to {PERF_LOG})')
+    else:
+        perf.disable()
+        show_notification('Perf HUD OFF')
+
+
 def update_jump_from_mouse(x_pos, track_rect):
     ratio = max(0.0, min(1.0, (x_pos - track_rect.left) / track_rect.width))
     # Map to 0.5x - 2.0x
@@ -208,6 +242,7 @@ def update_jump_from_mouse(x_pos, track_rect):
 
 def handle_common_events(event):
     if event.type == pygame.QUIT:
+        save_checkpoint(background=False)
         pygame.quit()
         exit()
     if event.type == pygame.KEYDOWN:
@@ -253,17 +288,17 @@ def layout_main_menu(title_font, menu_font, author_font):
     padding = max(10, int(min_side * 0.02))
     gap = max(10, int(min_side * 0.012))
 
-    title_surf = title_font.render('FlightX', True, (255, 255, 255))
-    start_surf = menu_font.render('RL Simulation', True, (0, 0, 0))
-    pvc_surf = menu_font.render('Human vs AI', True, (0, 0, 0))
-    train_clone_surf = menu_font.render('Train Clone (BC)', True, (0, 0, 0))
-    play_clone_surf = menu_font.render('Simulate Clone', True, (0, 0, 0))
-    train_dqn_surf = menu_font.render('Train DQN Agent', True, (0, 0, 0))
-    play_dqn_surf = menu_font.render('Play vs DQN', True, (0, 0, 0))
-    instruction_surf = menu_font.render('Instructions', True, (0, 0, 0))
-    mute_surf = menu_font.render(f'Audio: {"Off" if config.mute else "On"}', True, (0, 0, 0))
-    exit_surf = menu_font.render('Exit', True, (0, 0, 0))
-    author_surf = author_font.render('Author : Farhan Ishraq', True, (255, 255, 255))
+    title_surf = assets.text(title_font, 'FlightX', (255, 255, 255))
+    start_surf = assets.text(menu_font, 'RL Simulation', (0, 0, 0))
+    pvc_surf = assets.text(menu_font, 'Human vs AI', (0, 0, 0))
+    train_clone_surf = assets.text(menu_font, 'Train Clone (BC)', (0, 0, 0))
+    play_clone_surf = assets.text(menu_font, 'Simulate Clone', (0, 0, 0))
+    train_dqn_surf = assets.text(menu_font, 'Train DQN Agent', (0, 0, 0))
+    play_dqn_surf = assets.text(menu_font, 'Play vs DQN', (0, 0, 0))
+    instruction_surf = assets.text(menu_font, 'Instructions', (0, 0, 0))
+    mute_surf = assets.text(menu_font, f'Audio: {"Off" if config.mute else "On"}', (0, 0, 0))
+    exit_surf = assets.text(menu_font, 'Exit', (0, 0, 0))
+    author_surf = assets.text(author_font, 'Author : Farhan Ishraq', (255, 255, 255))
 
     title_rect = title_surf.get_rect(center=(config.win_width // 2, int(config.win_height * 0.15)))
 
@@ -305,12 +340,11 @@ def layout_main_menu(title_font, menu_font, author_font):
 
     author_rect = author_surf.get_rect(midbottom=(config.win_width // 2, config.win_height - gap))
 
-    fs_button_surf = menu_font.render('Fullscreen [F]', True, (0, 0, 0))
-    fs_box = pygame.Surface(
+    fs_button_surf = assets.text(menu_font, 'Fullscreen [F]', (0, 0, 0))
+    fs_box = cached_box(
         (fs_button_surf.get_width() + padding * 2, fs_button_surf.get_height() + padding * 2),
-        pygame.SRCALPHA,
+        (255, 255, 255, 200),
     )
-    fs_box.fill((255, 255, 255, 200))
     fs_box_rect = fs_box.get_rect(topright=(config.win_width - padding, padding))
     fs_text_rect = fs_button_surf.get_rect(center=fs_box_rect.center)
 
@@ -326,7 +360,7 @@ def layout_main_menu(title_font, menu_font, author_font):
 def draw_main_menu(layout):
     config.window.fill((0, 0, 0))
 
-    bg_scaled = pygame.transform.smoothscale(main_menu_bg, (config.win_width, config.win_height))
+    bg_scaled = assets.image(MAIN_MENU_BG, (config.win_width, config.win_height))
     bg_scaled.set_alpha(153)
     config.window.blit(bg_scaled, (0, 0))
 
@@ -337,15 +371,15 @@ def draw_main_menu(layout):
     mouse_pos = pygame.mouse.get_pos()
     buttons = []
     for surf, center, action in layout['options']:
-        box = pygame.Surface(
-            (surf.get_width() + padding * 2, surf.get_height() + padding * 2), pygame.SRCALPHA
-        )
-        box_rect = box.get_rect(center=center)
+        box_size = (surf.get_width() + padding * 2, surf.get_height() + padding * 2)
+        box_rect = pygame.Rect((0, 0), box_size)
+        box_rect.center = center
         text_rect = surf.get_rect(center=box_rect.center)
         hover = box_rect.collidepoint(mouse_pos)
-        box.fill((230, 230, 230, 220) if hover else (255, 255, 255, 200))
         if hover:
-            pygame.draw.rect(box, (50, 150, 255, 255), box.get_rect(), 2)
+            box = cached_box(box_size, (230, 230, 230, 220), border=(50, 150, 255, 255))
+        else:
+            box = cached_box(box_size, (255, 255, 255, 200))
         config.window.blit(box, box_rect)
         config.window.blit(surf, text_rect)
         buttons.append((surf, box_rect, action))
@@ -374,8 +408,8 @@ def render_notification():
         notification_state['timer'] -= 1
         
         # Create semi-transparent background
-        notif_font = pygame.font.Font('font/Pixeltype.ttf', 36)
-        text = notif_font.render(notification_state['message'], True, (255, 255, 255))
+        notif_font = assets.font(FONT_FILE, 36)
+        text = assets.text(notif_font, notification_state['message'], (255, 255, 255))
         
         # Calculate position (top center)
         padding = 20
@@ -384,21 +418,23 @@ def render_notification():
         bg_x = (config.win_width - bg_width) // 2
         bg_y = 80
         
-        # Draw background with fade effect
+        # Background and text are composed once per message onto a private
+        # surface, so the fade only changes that surface's alpha
+        if notification_state['text'] is not text:
+            toast = pygame.Surface((bg_width, bg_height))
+            toast.fill((40, 40, 60))
+            toast.blit(text, (padding, padding // 2))
+            notification_state['text'], notification_state['surface'] = text, toast
+        toast = notification_state['surface']
+
+        # Draw background and text with fade effect
         alpha = min(255, notification_state['timer'] * 4) if notification_state['timer'] < 64 else 255
-        bg_surface = pygame.Surface((bg_width, bg_height))
-        bg_surface.set_alpha(alpha)
-        bg_surface.fill((40, 40, 60))
-        config.window.blit(bg_surface, (bg_x, bg_y))
+        toast.set_alpha(alpha)
+        config.window.blit(toast, (bg_x, bg_y))
         
         # Draw border
         pygame.draw.rect(config.window, (100, 200, 255), 
                         (bg_x, bg_y, bg_width, bg_height), 2)
-        
-        # Draw text
-        text_surface = text.copy()
-        text_surface.set_alpha(alpha)
-        config.window.blit(text_surface, (bg_x + padding, bg_y + padding // 2))
 
 
 def update_graph_data():
@@ -409,13 +445,13 @@ def update_graph_data():
     graph_state['last_logged_gen'] = current_gen
     if current_gen % 3 != 0:
         return
-    graph_state['data'].append((current_gen, game_state['high_score']))
+    graph_state['data'].append((current_gen, sim_world.high_score))
     graph_state['dirty'] = True
 
 
 def render_graph(save_path=None, show_window=False, force=False):
     if force and not graph_state['data']:
-        graph_state['data'].append((population_manager.generation, game_state['high_score']))
+        graph_state['data'].append((population_manager.generation, sim_world.high_score))
     if not graph_state['data']:
         return
 
@@ -460,43 +496,49 @@ def render_graph(save_path=None, show_window=False, force=False):
     graph_state['dirty'] = False
 
 
-def draw_neural_net(window, brain, rect):
+def net_view(brain):
+    """Copy of what draw_neural_net needs: (layers, [(id, layer, output)], [(from, to, weight)])."""
+    nodes = [(n.id, n.layer, n.output_value) for n in brain.nodes]
+    connections = [(c.from_node.id, c.to_node.id, c.weight) for c in brain.connections]
+    return brain.layers, nodes, connections
+
+
+def draw_neural_net(window, net, rect):
     # Draw background for net
     pygame.draw.rect(window, (20, 20, 20, 200), rect, border_radius=8)
     
     # Define layer positions
-    layer_count = brain.layers
+    layer_count, nodes, connections = net
     layer_spacing = rect.width / (layer_count + 1)
     
     node_positions = {} # id -> (x, y)
     
     # Calculate positions
     for l in range(layer_count):
-        layer_nodes = [n for n in brain.nodes if n.layer == l]
+        layer_nodes = [n for n in nodes if n[1] == l]
         node_count = len(layer_nodes)
         node_spacing = rect.height / (node_count + 1)
         
         x = rect.left + layer_spacing * (l + 1)
-        for i, n in enumerate(layer_nodes):
+        for i, (node_id, _, _) in enumerate(layer_nodes):
             y = rect.top + node_spacing * (i + 1)
-            node_positions[n.id] = (x, y)
+            node_positions[node_id] = (x, y)
 
     # Draw connections
-    for c in brain.connections:
-        start = node_positions.get(c.from_node.id)
-        end = node_positions.get(c.to_node.id)
+    for from_id, to_id, weight in connections:
+        start = node_positions.get(from_id)
+        end = node_positions.get(to_id)
         if start and end:
-            color = (0, 255, 0) if c.weight > 0 else (255, 0, 0)
-            width = max(1, int(abs(c.weight) * 3))
+            color = (0, 255, 0) if weight > 0 else (255, 0, 0)
+            width = max(1, int(abs(weight) * 3))
             pygame.draw.line(window, color, start, end, width)
 
     # Draw nodes
-    for n in brain.nodes:
-        pos = node_positions.get(n.id)
+    for node_id, layer, val in nodes:
+        pos = node_positions.get(node_id)
         if pos:
-            val = n.output_value
             # Intensity based on activation
-            intensity = int(255 * val) if n.layer > 0 else 255
+            intensity = int(255 * val) if layer > 0 else 255
             color = (intensity, intensity, intensity)
             pygame.draw.circle(window, color, (int(pos[0]), int(pos[1])), 6)
             pygame.draw.circle(window, (255, 255, 255), (int(pos[0]), int(pos[1])), 6, 1)
@@ -544,121 +586,34 @@ def show_graph_window():
     render_graph(save_path='score_graph.png', show_window=True, force=True)
 
 
-def update_obstacles_tick(players_to_affect):
-    """Update wind zones, coins, and flying blocks. Apply effects to given players."""
-    # Update wind zones
-    for wz in list(game_state['wind_zones']):
-        wz.update()
-        if wz.off_screen:
-            game_state['wind_zones'].remove(wz)
-            continue
-        for pl in players_to_affect:
-            if pl.alive:
-                wz.apply_force(pl)
-
-    # Update coins
-    for coin in list(game_state['coins']):
-        coin.update()
-        if coin.off_screen:
-            game_state['coins'].remove(coin)
-            continue
-        for pl in players_to_affect:
-            if pl.alive and coin.check_collect(pl.rect):
-                game_state['score'] += coin.BONUS
-                if game_state['score'] > game_state.get('high_score', 0):
-                    game_state['high_score'] = game_state['score']
-
-    # Update flying blocks
-    for fb in list(game_state['flying_blocks']):
-        fb.update()
-        if fb.off_screen:
-            game_state['flying_blocks'].remove(fb)
-            continue
-        for pl in players_to_affect:
-            if pl.alive and fb.check_collision(pl.rect):
-                pl.alive = False
-
-    # Update falling obstacles
-    for fo in list(game_state['falling_obstacles']):
-        fo.update()
-        if fo.off_screen:
-            game_state['falling_obstacles'].remove(fo)
-            continue
-        for pl in players_to_affect:
-            if pl.alive and fo.check_collision(pl.rect):
-                pl.alive = False
-
-
-def draw_obstacles(window):
-    """Draw wind zones, coins, flying blocks, and falling obstacles."""
-    for wz in game_state['wind_zones']:
-        wz.draw(window)
-    for coin in game_state['coins']:
-        coin.draw(window)
-    for fb in game_state['flying_blocks']:
-        fb.draw(window)
-    for fo in game_state['falling_obstacles']:
-        fo.draw(window)
-
-
-def run_game_step():
-    draw_background()
+def game_tick():
+    if not population_manager.extinct():
+        sim_world.step(population_manager.players, population_manager.generation)
+    else:
+        sim_world.reset()
+        population_manager.natural_selection()
+        hall.record_generation(population_manager.species, population_manager.generation - 1)
+        checkpointer.maybe_save(population_manager)
+
+
+def game_snapshot():
+    players = population_manager.players
+    best_player = max(players, key=lambda p: p.fitness) if players else None
+    return simulation.Snapshot(
+        sim_world, players,
+        alive=sum(1 for p in players if p.alive), total=len(players),
+        net=net_view(best_player.brain) if best_player and best_player.alive else None,
+    )
 
-    config.ground.draw(config.window)
 
-    def simulation_tick():
-        if game_state['pipes_spawn_time'] <= 0:
-            generate_pipes()
-            game_state['pipes_spawn_time'] = 200
-        game_state['pipes_spawn_time'] -= 1
-
-        for p in list(config.pipes):
-            p.update()
-            if p.passed and not p.counted:
-                game_state['score'] += 1
-                if game_state['score'] > game_state['high_score']:
-                    game_state['high_score'] = game_state['score']
-                p.counted = True
-                
-                # Update individual player scores for fitness
-                for player in population_manager.players:
-                    if player.alive:
-                        player.score += 1
-                        
-            if p.off_screen:
-                config.pipes.remove(p)
+def render_game_step(snap):
+    draw_background()
+    config.ground.draw(config.window)
+    snap.draw(config.window)
 
-        if not population_manager.extinct():
-            population_manager.update_live_players()
-        else:
-            config.pipes.clear()
-            game_state['wind_zones'] = []
-            game_state['coins'] = []
-            game_state['flying_blocks'] = []
-            game_state['falling_obstacles'] = []
-            game_state['obstacle_counter'] = 0
-            population_manager.natural_selection()
-            game_state['score'] = 0
-
-        update_obstacles_tick(population_manager.players)
-
-    if not ui_state['is_paused']:
-        ticks = max(1, int(round(ui_state['simulation_speed'])))
-        for _ in range(ticks):
-            simulation_tick()
-
-    for p in list(config.pipes):
-        p.draw(config.window)
-    draw_obstacles(config.window)
-    for pl in population_manager.players:
-        if pl.alive:
-            pl.draw(config.window)
-            
     # Draw Neural Net of best player
-    if population_manager.players:
-        best_player = max(population_manager.players, key=lambda p: p.fitness) if population_manager.players else None
-        if best_player and best_player.alive:
-             draw_neural_net(config.window, best_player.brain, pygame.Rect(10, config.win_height - 160, 200, 150))
+    if snap.info['net'] is not None:
+        draw_neural_net(config.window, snap.info['net'], pygame.Rect(10, config.win_height - 160, 200, 150))
     
     # Render notifications
     render_notification()
@@ -668,45 +623,39 @@ def run_game_step():
 def _init_sim_clone_players():
     """Create one set of algorithm players for the simulation."""
     import player as player_mod
-    import pickle, os
     players = []
     algo_map = {}
     n = sim_clone_state['planes_per_algo']
 
-    # NEAT players (from champion.pkl)
-    for i in range(n):
-        try:
-            with open('champion.pkl', 'rb') as f:
-                brain = pickle.load(f)
+    # Trained models are loaded once (and again only if their files change);
+    # every plane of an algorithm flies the same read-only policy
+    champion, bc_model, dqn_model = models = _sim_clone_models()
+    sim_clone_state['models'] = models
+
+    # NEAT players (from the saved champion)
+    if champion is not None:
+        for i in range(n):
             p = player_mod.Player(is_human=False)
-            p.brain = brain
+            p.brain = champion
             p.color_tint = ALGO_COLORS['NEAT']
             players.append(p)
             algo_map[id(p)] = 'NEAT'
-        except:
-            pass
 
     # BC players
-    for i in range(n):
-        try:
-            p = player_mod.BCPlayer()
-            if p.load_model():
-                p.color_tint = ALGO_COLORS['BC']
-                players.append(p)
-                algo_map[id(p)] = 'BC'
-        except:
-            pass
+    if bc_model is not None:
+        for i in range(n):
+            p = player_mod.BCPlayer(bc_model)
+            p.color_tint = ALGO_COLORS['BC']
+            players.append(p)
+            algo_map[id(p)] = 'BC'
 
     # DQN players
-    for i in range(n):
-        try:
-            p = player_mod.DQNPlayer()
-            if p.load_model():
-                p.color_tint = ALGO_COLORS['DQN']
-                players.append(p)
-                algo_map[id(p)] = 'DQN'
-        except:
-            pass
+    if dqn_model is not None:
+        for i in range(n):
+            p = player_mod.DQNPlayer(dqn_model)
+            p.color_tint = ALGO_COLORS['DQN']
+            players.append(p)
+            algo_map[id(p)] = 'DQN'
 
     # Heuristic players (always load)
     for i in range(n):
@@ -764,155 +713,127 @@ def _init_sim_clone_players():
         players.append(p)
         algo_map[id(p)] = 'H-FLY'
 
+    _jitter_sim_clone_players(players)
+    return players, algo_map
+
+
+def _sim_clone_models():
+    return (model_registry.registry.get('neat'),
+            model_registry.registry.get('bc'),
+            model_registry.registry.get('dqn'))
+
+
+def _jitter_sim_clone_players(players):
     # Add positional jitter to all players to prevent perfect visual overlap
     for p in players:
         p.rect.centery += random.randint(-40, 40)
         p.rect.centerx += random.randint(-20, 20)
 
-    return players, algo_map
 
+def _restart_sim_clone_players():
+    """Players for the next round: the current ones respawned, unless a model file changed."""
+    players = sim_clone_state['players']
+    if players and _sim_clone_models() == sim_clone_state.get('models'):
+        for p in players:
+            p.respawn()
+        _jitter_sim_clone_players(players)
+        return players, sim_clone_state['algo_map']
+    return _init_sim_clone_players()
 
 
-def run_simulate_clone_step():
-    """Game step for the Simulate Clone mode — multiple AI planes compared."""
-    draw_background()
-    config.ground.draw(config.window)
 
+def simulate_clone_tick():
+    """One tick of the Simulate Clone mode — multiple AI planes compared."""
     all_players = sim_clone_state['players']
 
-    def simulation_tick():
-        if game_state['pipes_spawn_time'] <= 0:
-            generate_pipes()
-            game_state['pipes_spawn_time'] = 200
-        game_state['pipes_spawn_time'] -= 1
-
-        for p in list(config.pipes):
-            p.update()
-            if p.passed and not p.counted:
-                game_state['score'] += 1
-                p.counted = True
-            if p.off_screen:
-                config.pipes.remove(p)
-
-        # Track current round scores per algorithm continuously
-        if 'round_scores' not in sim_clone_state:
-            sim_clone_state['round_scores'] = {algo: 0 for algo in ALGO_COLORS}
-
-        for p in all_players:
-            if p.alive:
-                p.look()
-                p.think(generation=100)
-                p.update(config.ground)
-                # Max score achieved by this algo in the current round
-                algo = sim_clone_state['algo_map'].get(id(p), 'NEAT')
-                sim_clone_state['round_scores'][algo] = max(
-                    sim_clone_state['round_scores'].get(algo, 0),
-                    game_state['score']
-                )
-
-        update_obstacles_tick(all_players)
-
-        # Check if all dead → auto-restart
-        if all(not p.alive for p in all_players) and len(all_players) > 0:
-            # Record scores per algo
-            for algo in ALGO_COLORS:
-                score = sim_clone_state['round_scores'].get(algo, 0)
-                sim_clone_state['history'][algo].append(score)
-                sim_clone_state['best_scores'][algo] = max(
-                    sim_clone_state['best_scores'].get(algo, 0),
-                    score
-                )
-            sim_clone_state['round'] += 1
-            sim_clone_state['round_scores'] = {algo: 0 for algo in ALGO_COLORS}
-
-            # Reset
-            config.pipes.clear()
-            game_state['wind_zones'] = []
-            game_state['coins'] = []
-            game_state['flying_blocks'] = []
-            game_state['falling_obstacles'] = []
-            game_state['obstacle_counter'] = 0
-            game_state['pipes_spawn_time'] = 10
-            game_state['score'] = 0
-            new_players, new_map = _init_sim_clone_players()
-            sim_clone_state['players'] = new_players
-            sim_clone_state['algo_map'] = new_map
-            return True # Indicates a reset occurred
-            
-        return False
-
-    if not ui_state['is_paused']:
-        ticks = max(1, int(round(ui_state['simulation_speed'])))
-        for _ in range(ticks):
-            if simulation_tick():
-                all_players = sim_clone_state['players'] # Refresh in-scope active array
-                break
+    # Track current round scores per algorithm continuously
+    if 'round_scores' not in sim_clone_state:
+        sim_clone_state['round_scores'] = {algo: 0 for algo in ALGO_COLORS}
+
+    sim_world.step(all_players, generation=100)
+
+    for p in all_players:
+        if p.alive:
+            # Max score achieved by this algo in the current round
+            algo = sim_clone_state['algo_map'].get(id(p), 'NEAT')
+            sim_clone_state['round_scores'][algo] = max(
+                sim_clone_state['round_scores'].get(algo, 0),
+                sim_world.score
+            )
+
+    # Check if all dead → auto-restart
+    if all(not p.alive for p in all_players) and len(all_players) > 0:
+        # Record scores per algo
+        for algo in ALGO_COLORS:
+            score = sim_clone_state['round_scores'].get(algo, 0)
+            sim_clone_state['history'][algo].append(score)
+            sim_clone_state['best_scores'][algo] = max(
+                sim_clone_state['best_scores'].get(algo, 0),
+                score
+            )
+        perf.end_generation(sim_clone_state['round'], mode='sim_clone')
+        sim_clone_state['round'] += 1
+        sim_clone_state['round_scores'] = {algo: 0 for algo in ALGO_COLORS}
+
+        # Reset
+        sim_world.reset()
+        new_players, new_map = _restart_sim_clone_players()
+        sim_clone_state['players'] = new_players
+        sim_clone_state['algo_map'] = new_map
+
+
+def sim_clone_snapshot():
+    """Snapshot for Simulate Clone; records (alive, total) planes and best score per algorithm."""
+    players = sim_clone_state['players']
+    algo_map = sim_clone_state['algo_map']
+    counts = {algo: [0, 0] for algo in ALGO_COLORS}
+    for p in players:
+        count = counts.get(algo_map.get(id(p)))
+        if count is not None:
+            count[0] += p.alive
+            count[1] += 1
+    return simulation.Snapshot(sim_world, players, algos=counts,
+                               best_scores=dict(sim_clone_state['best_scores']))
 
-    for p in list(config.pipes):
-        p.draw(config.window)
-    draw_obstacles(config.window)
 
-    # Draw players
-    for pl in all_players:
-        if pl.alive:
-            pl.draw(config.window)
+def render_simulate_clone_step(snap):
+    draw_background()
+    config.ground.draw(config.window)
+    snap.draw(config.window)
 
     render_notification()
 
 
-def run_dqn_play_step():
-    """Game step for playing against the DQN AI."""
+def versus_snapshot(players):
+    """Snapshot for the human-vs-AI modes; records who is still alive for the labels."""
+    human = next((p for p in players if p.is_human), None)
+    ai = next((p for p in players if not p.is_human), None)
+    return simulation.Snapshot(
+        sim_world, players,
+        human_alive=human.alive if human else None,
+        ai_alive=ai.alive if ai else None,
+    )
+
+
+def render_dqn_play_step(snap):
+    """Draw a frame of playing against the DQN AI."""
     draw_background()
     config.ground.draw(config.window)
+    snap.draw(config.window)
 
-    def simulation_tick():
-        if game_state['pipes_spawn_time'] <= 0:
-            generate_pipes()
-            game_state['pipes_spawn_time'] = 200
-        game_state['pipes_spawn_time'] -= 1
-
-        for p in list(config.pipes):
-            p.update()
-            if p.passed and not p.counted:
-                game_state['score'] += 1
-                p.counted = True
-            if p.off_screen:
-                config.pipes.remove(p)
-
-        for p in dqn_play_players:
-            if p.alive:
-                p.look()
-                p.think(generation=100 if not p.is_human else 1)
-                p.update(config.ground)
-
-        update_obstacles_tick(dqn_play_players)
-
-    if not ui_state['is_paused']:
-        ticks = max(1, int(round(ui_state['simulation_speed'])))
-        for _ in range(ticks):
-            simulation_tick()
-
-    for p in list(config.pipes):
-        p.draw(config.window)
-    draw_obstacles(config.window)
-
-    for pl in dqn_play_players:
-        if pl.alive:
-            pl.draw(config.window)
-
-    font = pygame.font.Font('font/Pixeltype.ttf', 40)
-    human = next((p for p in dqn_play_players if p.is_human), None)
-    dqn_ai = next((p for p in dqn_play_players if not p.is_human), None)
-
-    if human and not human.alive:
-        msg = font.render("GAME OVER - Press ESC", True, (255, 0, 0))
+    font = assets.font(FONT_FILE, 40)
+    human_alive = snap.info['human_alive']
+    ai_alive = snap.info['ai_alive']
+
+    if human_alive is False:
+        msg = assets.text(font, "GAME OVER - Press ESC", (255, 0, 0))
         config.window.blit(msg, (config.win_width // 2 - 100, config.win_height // 2))
 
-    if human:
-        h_label = font.render(f"YOU: {'Alive' if human.alive else 'Dead'}", True, (50, 255, 50))
+    if human_alive is not None:
+        h_label = assets.text(font, f"YOU: {'Alive' if human_alive else 'Dead'}", (50, 255, 50))
         config.window.blit(h_label, (20, 20))
-    if dqn_ai:
-        a_label = font.render(f"DQN AI: {'Alive' if dqn_ai.alive else 'Dead'}", True, (255, 180, 80))
+    if ai_alive is not None:
+        a_label = assets.text(font, f"DQN AI: {'Alive' if ai_alive else 'Dead'}", (255, 180, 80))
         config.window.blit(a_label, (20, 60))
 
     render_notification()
@@ -921,84 +842,45 @@ def run_dqn_play_step():
 def render_dqn_training_screen(menu_font):
     """Show DQN training progress screen."""
     config.window.fill((20, 20, 30))
-    title_font = pygame.font.Font('font/Pixeltype.ttf', max(60, int(config.win_height * 0.09)))
-    title = title_font.render('DQN TRAINING IN PROGRESS', True, (255, 200, 100))
+    title_font = assets.font(FONT_FILE, max(60, int(config.win_height * 0.09)))
+    title = assets.text(title_font, 'DQN TRAINING IN PROGRESS', (255, 200, 100))
     title_rect = title.get_rect(center=(config.win_width // 2, config.win_height * 0.3))
     config.window.blit(title, title_rect)
 
     progress_text = dqn_training_state.get('progress', 'Starting...')
-    prog_font = pygame.font.Font('font/Pixeltype.ttf', max(32, int(config.win_height * 0.045)))
-    prog_surf = prog_font.render(progress_text, True, (220, 220, 220))
+    prog_font = assets.font(FONT_FILE, max(32, int(config.win_height * 0.045)))
+    prog_surf = assets.text(prog_font, progress_text, (220, 220, 220))
     prog_rect = prog_surf.get_rect(center=(config.win_width // 2, config.win_height * 0.5))
     config.window.blit(prog_surf, prog_rect)
 
-    hint = prog_font.render('Press ESC to cancel', True, (150, 150, 255))
+    hint = assets.text(prog_font, 'Press ESC to cancel', (150, 150, 255))
     hint_rect = hint.get_rect(center=(config.win_width // 2, config.win_height * 0.7))
     config.window.blit(hint, hint_rect)
 
 
-def run_pvc_game_step():
+def render_pvc_game_step(snap):
     draw_background()
     config.ground.draw(config.window)
-
-    def simulation_tick():
-        if game_state['pipes_spawn_time'] <= 0:
-            generate_pipes()
-            game_state['pipes_spawn_time'] = 200
-        game_state['pipes_spawn_time'] -= 1
-
-        for p in list(config.pipes):
-            p.update()
-            if p.passed and not p.counted:
-                 game_state['score'] += 1
-                 p.counted = True
-                 
-            if p.off_screen:
-                config.pipes.remove(p)
-
-        # Update Players
-        human_alive = False
-        for p in pvc_players:
-            if p.alive:
-                p.look()
-                p.think(generation=100 if not p.is_human else 1)
-                p.update(config.ground)
-                if p.is_human:
-                    human_alive = True
-
-        update_obstacles_tick(pvc_players)
-
-    if not ui_state['is_paused']:
-        ticks = max(1, int(round(ui_state['simulation_speed'])))
-        for _ in range(ticks):
-            simulation_tick()
-
-    for p in list(config.pipes):
-        p.draw(config.window)
-    draw_obstacles(config.window)
-
-    for pl in pvc_players:
-        if pl.alive:
-            pl.draw(config.window)
+    snap.draw(config.window)
     
     # Simple UI for PvC
-    font = pygame.font.Font('font/Pixeltype.ttf', 40)
+    font = assets.font(FONT_FILE, 40)
     
-    human = next((p for p in pvc_players if p.is_human), None)
-    ai = next((p for p in pvc_players if not p.is_human), None)
+    human_alive = snap.info['human_alive']
+    ai_alive = snap.info['ai_alive']
     
-    if human and not human.alive:
-         msg = font.render("GAME OVER - Press ESC", True, (255, 0, 0))
+    if human_alive is False:
+         msg = assets.text(font, "GAME OVER - Press ESC", (255, 0, 0))
          config.window.blit(msg, (config.win_width//2 - 100, config.win_height//2))
     
     # Labels
-    if human:
+    if human_alive is not None:
          h_color = (50, 255, 50) 
-         h_label = font.render(f"YOU: {'Alive' if human.alive else 'Dead'}", True, h_color)
+         h_label = assets.text(font, f"YOU: {'Alive' if human_alive else 'Dead'}", h_color)
          config.window.blit(h_label, (20, 20))
          
-    if ai:
-         a_label = font.render(f"AI: {'Alive' if ai.alive else 'Dead'}", True, (255, 255, 255))
+    if ai_alive is not None:
+         a_label = assets.text(font, f"AI: {'Alive' if ai_alive else 'Dead'}", (255, 255, 255))
          config.window.blit(a_label, (20, 60))
     
     # Render notifications
@@ -1007,25 +889,26 @@ def run_pvc_game_step():
 
 def render_game_placeholder(title_font):
     config.window.fill((0, 0, 0))
-    bg_scaled = pygame.transform.smoothscale(main_menu_bg, (config.win_width, config.win_height))
+    bg_scaled = assets.image(MAIN_MENU_BG, (config.win_width, config.win_height))
     bg_scaled.set_alpha(153)
     config.window.blit(bg_scaled, (0, 0))
-    text = title_font.render('GAME STARTED', True, (255, 255, 255))
+    text = assets.text(title_font, 'GAME STARTED', (255, 255, 255))
     rect = text.get_rect(center=(config.win_width // 2, config.win_height // 2))
     config.window.blit(text, rect)
 
 
 def render_instructions(menu_font):
     config.window.fill((0, 0, 0))
-    bg_scaled = pygame.transform.smoothscale(main_menu_bg, (config.win_width, config.win_height))
+    bg_scaled = assets.image(MAIN_MENU_BG, (config.win_width, config.win_height))
     bg_scaled.set_alpha(153)
     config.window.blit(bg_scaled, (0, 0))
 
-    instr_font = pygame.font.Font('font/Pixeltype.ttf', max(32, int(menu_font.get_height() * 1.05)))
+    instr_font = assets.font(FONT_FILE, max(32, int(menu_font.get_height() * 1.05)))
 
     lorem = (
         'FlightX Control Panel Guide\n\n'
-        'Speed Bar: Drag to adjust simulation speed (0-10).\n\n'
+        'Speed Bar: Drag to adjust simulation speed (0-10); T toggles Turbo.\n\n'
+        'Perf HUD: P shows where each tick and generation spends its time.\n\n'
         'Plane Count: Set number of agents (applies after Restart).\n\n'
         'Lines Off: Toggle AI vision lines on/off.\n\n'
         'Stats: View active Jumps, Alive Agents, and Reward.\n\n'
@@ -1039,9 +922,7 @@ def render_instructions(menu_font):
     box_h = min(config.win_height - outer_pad * 2, int(config.win_height * 0.78))
     box_rect = pygame.Rect(0, 0, box_w, box_h)
     box_rect.center = (config.win_width // 2, config.win_height // 2)
-    panel = pygame.Surface(box_rect.size, pygame.SRCALPHA)
-    panel.fill((50, 50, 50, 210))
-    pygame.draw.rect(panel, (220, 220, 220, 230), panel.get_rect(), width=2, border_radius=12)
+    panel = cached_box(box_rect.size, (50, 50, 50, 210), border=(220, 220, 220, 230), border_radius=12)
     config.window.blit(panel, box_rect.topleft)
 
     inner_pad = max(18, int(instr_font.get_height() * 0.6))
@@ -1071,7 +952,7 @@ def render_instructions(menu_font):
     y = box_rect.top + inner_pad
     first_line = True
     for line in lines:
-        surf = instr_font.render(line, True, color)
+        surf = assets.text(instr_font, line, color)
         if first_line and line.strip().startswith('FlightX Control Panel Guide'):
             rect = surf.get_rect(midtop=(box_rect.centerx, y))
         else:
@@ -1080,13 +961,13 @@ def render_instructions(menu_font):
         y += surf.get_height() + 10
         first_line = False
 
-    back_font = pygame.font.Font('font/Pixeltype.ttf', max(20, int(menu_font.get_height() * 0.8)))
-    back_surf = back_font.render('Press ESC to return', True, (210, 210, 210))
+    back_font = assets.font(FONT_FILE, max(20, int(menu_font.get_height() * 0.8)))
+    back_surf = assets.text(back_font, 'Press ESC to return', (210, 210, 210))
     back_rect = back_surf.get_rect(bottomright=(box_rect.right - inner_pad, box_rect.bottom - inner_pad))
     config.window.blit(back_surf, back_rect)
 
 
-def draw_control_panel(state, menu_font):
+def draw_control_panel(state, menu_font, snap):
     ground_y = components.Ground.ground_level
     ground_h = getattr(config.ground, 'rect', pygame.Rect(0, 0, 0, 8)).height if config.ground else 8
     panel_y = ground_y + ground_h
@@ -1101,23 +982,27 @@ def draw_control_panel(state, menu_font):
     rects_to_return = {}
 
     # Iteration counter / Round counter top-right
-    iter_font = pygame.font.Font('font/Pixeltype.ttf', max(22, int(menu_font.get_height() * 0.95)))
+    iter_font = assets.font(FONT_FILE, max(22, int(menu_font.get_height() * 0.95)))
     text_content = f'Number of Iterations: {population_manager.generation}'
     if state == MENU_SIM_CLONE:
         text_content = f'Round: {sim_clone_state["round"]}'
         
-    iter_text = iter_font.render(text_content, True, white)
+    iter_text = assets.text(iter_font, text_content, white)
     iter_rect = iter_text.get_rect(topright=(panel_rect.right - padding, panel_rect.top + padding))
     config.window.blit(iter_text, iter_rect)
 
-    score_text = iter_font.render(f'Score: {game_state["score"]}', True, white)
+    score_text = assets.text(iter_font, f'Score: {snap.score}', white)
     score_rect = score_text.get_rect(topright=(panel_rect.right - padding, iter_rect.bottom + 8))
 
-    high_text = iter_font.render(f'Max Score: {game_state["high_score"]}', True, white)
+    high_text = assets.text(iter_font, f'Max Score: {snap.high_score}', white)
     high_rect = high_text.get_rect(topright=(score_rect.left - padding, score_rect.top))
 
+    tps_text = assets.text(iter_font, f'Ticks/s: {sim_thread.ticks_per_sec}', white)
+    tps_rect = tps_text.get_rect(topright=(panel_rect.right - padding, score_rect.bottom + 8))
+
     config.window.blit(high_text, high_rect)
     config.window.blit(score_text, score_rect)
+    config.window.blit(tps_text, tps_rect)
 
     update_graph_data()
     if graph_state['dirty']:
@@ -1131,7 +1016,10 @@ def draw_control_panel(state, menu_font):
     knob_rect = pygame.Rect(0, 0, 18, 24)
     knob_rect.center = (knob_x, slider_track.centery)
     pygame.draw.rect(config.window, white, knob_rect, border_radius=6)
-    speed_label = menu_font.render(f'Speed: {ui_state["simulation_speed"]:.1f}', True, white)
+    if ui_state['turbo'] and state in (MENU_GAME, MENU_SIM_CLONE):
+        speed_label = assets.text(menu_font, 'Speed: TURBO (T)', (255, 200, 100))
+    else:
+        speed_label = assets.text(menu_font, f'Speed: {ui_state["simulation_speed"]:.1f}', white)
     speed_rect = speed_label.get_rect(left=slider_track.left, top=slider_track.bottom + 6)
     config.window.blit(speed_label, speed_rect)
     
@@ -1141,9 +1029,9 @@ def draw_control_panel(state, menu_font):
     # Jump control slider OR Plane control
     jump_track = pygame.Rect(slider_track.left, speed_rect.bottom + max(10, int(menu_font.get_height() * 0.4)), slider_width, 12)
     if state == MENU_SIM_CLONE:
-        small_font = pygame.font.Font('font/Pixeltype.ttf', max(24, int(menu_font.get_height() * 0.8)))
+        small_font = assets.font(FONT_FILE, max(24, int(menu_font.get_height() * 0.8)))
         n = sim_clone_state['planes_per_algo']
-        ctrl = small_font.render(f'Planes per algo: {n}   [-] [+]', True, white)
+        ctrl = assets.text(small_font, f'Planes per algo: {n}   [-] [+]', white)
         config.window.blit(ctrl, (jump_track.left, jump_track.top))
         sim_clone_state['_minus_rect'] = pygame.Rect(jump_track.left + ctrl.get_width() - 55, jump_track.top, 25, 20)
         sim_clone_state['_plus_rect'] = pygame.Rect(jump_track.left + ctrl.get_width() - 25, jump_track.top, 25, 20)
@@ -1156,7 +1044,7 @@ def draw_control_panel(state, menu_font):
         jump_knob = pygame.Rect(0, 0, 18, 24)
         jump_knob.center = (jump_knob_x, jump_track.centery)
         pygame.draw.rect(config.window, white, jump_knob, border_radius=6)
-        jump_label = menu_font.render(f'Jump: {config.jump_scale:.2f}x', True, white)
+        jump_label = assets.text(menu_font, f'Jump: {config.jump_scale:.2f}x', white)
         jump_rect = jump_label.get_rect(left=jump_track.left, top=jump_track.bottom + 6)
         config.window.blit(jump_label, jump_rect)
         rects_to_return['jump_track'] = jump_track
@@ -1177,14 +1065,14 @@ def draw_control_panel(state, menu_font):
         toggle_y = jump_track.bottom + 30 if state == MENU_SIM_CLONE else jump_rect.bottom + max(10, int(menu_font.get_height() * 0.5))
     toggle_rect = pygame.Rect(toggle_x, toggle_y, toggle_w, toggle_h)
     pygame.draw.rect(config.window, white, toggle_rect, border_radius=6)
-    toggle_label = menu_font.render(f'Lines: {"ON" if config.show_lines else "OFF"}', True, dark)
+    toggle_label = assets.text(menu_font, f'Lines: {"ON" if config.show_lines else "OFF"}', dark)
     config.window.blit(toggle_label, toggle_label.get_rect(center=toggle_rect.center))
     rects_to_return['lines_toggle'] = toggle_rect
 
     # Pause / Restart shifted right but clamped
     btn_w = max(160, int(config.win_width * 0.18))
     btn_h = max(44, int(menu_font.get_height() * 1.6))
-    right_column_left = min(iter_rect.left, score_rect.left, high_rect.left)
+    right_column_left = min(iter_rect.left, score_rect.left, high_rect.left, tps_rect.left)
     target_x = right_column_left - padding - btn_w // 2
     center_x = min(panel_rect.centerx + max(140, int(config.win_width * 0.12)), target_x)
     if not config.fullscreen:
@@ -1198,8 +1086,8 @@ def draw_control_panel(state, menu_font):
     restart_rect.center = (center_x, pause_rect.bottom + vertical_offset + restart_rect.height // 2)
     pygame.draw.rect(config.window, white, pause_rect, border_radius=6)
     pygame.draw.rect(config.window, white, restart_rect, border_radius=6)
-    pause_label = menu_font.render('Pause' if not ui_state['is_paused'] else 'Resume', True, dark)
-    restart_label = menu_font.render('Restart', True, dark)
+    pause_label = assets.text(menu_font, 'Pause' if not ui_state['is_paused'] else 'Resume', dark)
+    restart_label = assets.text(menu_font, 'Restart', dark)
     config.window.blit(pause_label, pause_label.get_rect(center=pause_rect.center))
     config.window.blit(restart_label, restart_label.get_rect(center=restart_rect.center))
     
@@ -1207,12 +1095,12 @@ def draw_control_panel(state, menu_font):
     rects_to_return['restart'] = restart_rect
 
     # Info box OR Toggle Info Button
-    info_font = pygame.font.Font('font/Pixeltype.ttf', max(14, int(menu_font.get_height() * 0.65)))
+    info_font = assets.font(FONT_FILE, max(14, int(menu_font.get_height() * 0.65)))
     min_x = slider_track.right + padding
     
     if state == MENU_SIM_CLONE:
-        med_font = pygame.font.Font('font/Pixeltype.ttf', 32)
-        info_txt = med_font.render('Toggle Info', True, dark)
+        med_font = assets.font(FONT_FILE, 32)
+        info_txt = assets.text(med_font, 'Toggle Info', dark)
         info_rect = info_txt.get_rect(topleft=(min_x, panel_rect.top + padding + 5))
         info_bg = info_rect.inflate(20, 10)
         pygame.draw.rect(config.window, (200, 200, 255), info_bg, border_radius=5)
@@ -1221,16 +1109,20 @@ def draw_control_panel(state, menu_font):
         rects_to_return['_info_btn'] = info_bg
         box_right = info_bg.right
     else:
-        alive_count = sum(1 for p in population_manager.players if p.alive)
+        if 'alive' in snap.info:
+            alive_count, total_count = snap.info['alive'], snap.info['total']
+        else:
+            alive_count = sum(1 for p in population_manager.players if p.alive)
+            total_count = len(population_manager.players)
         jump_factor = 1.02 if population_manager.generation % 10 == 0 else 1.0
         jump_impulse = round(2.2 * jump_factor * config.jump_scale, 2)
         info_items = [
             'Reward: +7',
             'Punishment: -1000',
             f'Jump: {jump_impulse}',
-            f'Planes Alive: {alive_count}/{len(population_manager.players)}',
+            f'Planes Alive: {alive_count}/{total_count}',
         ]
-        line_surfs = [info_font.render(t, True, white) for t in info_items]
+        line_surfs = [assets.text(info_font, t, white) for t in info_items]
         box_padding = max(5, int(config.win_width * 0.0040))
         box_width = max(s.get_width() for s in line_surfs) + box_padding * 2
         box_height = sum(s.get_height() for s in line_surfs) + box_padding * 2 + (len(line_surfs) - 1) * 3
@@ -1271,8 +1163,8 @@ def draw_control_panel(state, menu_font):
     txt_col = dark if state == MENU_SIM_CLONE else white
     pygame.draw.rect(config.window, bg_col, graph_box, border_radius=6)
     pygame.draw.rect(config.window, white, graph_box, width=1, border_radius=6)
-    graph_font = pygame.font.Font('font/Pixeltype.ttf', max(12, int(menu_font.get_height() * 0.5)))
-    graph_text = graph_font.render('Graph', True, txt_col)
+    graph_font = assets.font(FONT_FILE, max(12, int(menu_font.get_height() * 0.5)))
+    graph_text = assets.text(graph_font, 'Graph', txt_col)
     config.window.blit(graph_text, graph_text.get_rect(center=graph_box.center))
     
     if state == MENU_SIM_CLONE:
@@ -1285,7 +1177,7 @@ def draw_control_panel(state, menu_font):
     back_rect = pygame.Rect(0, 0, max(260, int(config.win_width * 0.24)), max(48, int(menu_font.get_height() * 1.6)))
     back_rect.bottomright = (panel_rect.right - padding, panel_rect.bottom - padding)
     pygame.draw.rect(config.window, white, back_rect, border_radius=6)
-    back_label = menu_font.render('Back to Menu', True, dark)
+    back_label = assets.text(menu_font, 'Back to Menu', dark)
     config.window.blit(back_label, back_label.get_rect(center=back_rect.center))
     
     rects_to_return['back'] = back_rect
@@ -1297,42 +1189,69 @@ def draw_control_panel(state, menu_font):
         overlay_x = config.win_width // 2 - overlay_w // 2
         overlay_y = config.win_height // 2 - overlay_h // 2 - 50
         
-        ov_surf = pygame.Surface((overlay_w, overlay_h), pygame.SRCALPHA)
-        ov_surf.fill((30, 30, 45, 230))
-        pygame.draw.rect(ov_surf, (100, 100, 150), ov_surf.get_rect(), 2, border_radius=10)
+        ov_surf = cached_box((overlay_w, overlay_h), (30, 30, 45, 230), border=(100, 100, 150), border_radius=10)
         config.window.blit(ov_surf, (overlay_x, overlay_y))
 
-        title = font = pygame.font.Font('font/Pixeltype.ttf', 36).render('ALGORITHM STATS', True, (255, 255, 255))
+        title = font = assets.text(assets.font(FONT_FILE, 36), 'ALGORITHM STATS', (255, 255, 255))
         config.window.blit(title, (overlay_x + overlay_w // 2 - title.get_width() // 2, overlay_y + 15))
 
         oy = overlay_y + 60
-        med_font = pygame.font.Font('font/Pixeltype.ttf', 32)
+        med_font = assets.font(FONT_FILE, 32)
         for algo, col in ALGO_COLORS.items():
             pygame.draw.circle(config.window, col, (overlay_x + 30, oy + 8), 8)
-            alive = sum(1 for p in sim_clone_state['players'] if sim_clone_state['algo_map'].get(id(p)) == algo and p.alive)
-            total = sum(1 for p in sim_clone_state['players'] if sim_clone_state['algo_map'].get(id(p)) == algo)
-            best = sim_clone_state['best_scores'].get(algo, 0)
+            alive, total = snap.info['algos'][algo]
+            best = snap.info['best_scores'].get(algo, 0)
             
-            txt = med_font.render(f'{algo}:  {alive}/{total} alive   Best={best}', True, col)
+            txt = assets.text(med_font, f'{algo}:  {alive}/{total} alive   Best={best}', col)
             config.window.blit(txt, (overlay_x + 50, oy))
             oy += 35
 
+    if perf.recorder is not None:
+        draw_perf_overlay(snap)
+
     return rects_to_return
 
 
+def draw_perf_overlay(snap):
+    """Perf HUD (P): average ms per call of each phase, top-right of the play area."""
+    recorder = perf.recorder
+    hud_font = assets.font(FONT_FILE, 24)
+    lines = [(f'PERF  gen {recorder.generation}', '')]
+    if sim_thread is not None:
+        lines.append(('ticks/s', f'{sim_thread.ticks_per_sec}'))
+    lines.append(('planes alive', f'{len(snap.players)}'))
+    lines += [(name, f'{ms:.3f} ms') for name, ms in recorder.summary()]
+    if recorder.records:
+        last = recorder.records[-1]
+        lines.append(('alloc blocks', f'{last["allocated_blocks"]:+d}'))
+        lines.append(('gc runs', f'{last["gc_collections"]}'))
+
+    row_h = hud_font.get_height()
+    box_w, box_h = 230, row_h * len(lines) + 16
+    box_x, box_y = config.win_width - box_w - 10, 10
+    config.window.blit(cached_box((box_w, box_h), (0, 0, 0, 170), border=(120, 120, 120), border_radius=6),
+                       (box_x, box_y))
+    y = box_y + 8
+    for name, value in lines:
+        config.window.blit(assets.text(hud_font, name, (200, 200, 200)), (box_x + 10, y))
+        value_surf = assets.text(hud_font, value, (255, 255, 255))
+        config.window.blit(value_surf, value_surf.get_rect(topright=(box_x + box_w - 10, y)))
+        y += row_h
+
+
 def render_instructions(menu_font):
     """Render the instruction panel with controls and features guide"""
     config.window.fill((20, 20, 30))
     
     # Title - Larger
-    title_font = pygame.font.Font('font/Pixeltype.ttf', max(80, int(config.win_height * 0.11)))
-    title = title_font.render('CONTROLS & GUIDE', True, (100, 200, 255))
+    title_font = assets.font(FONT_FILE, max(80, int(config.win_height * 0.11)))
+    title = assets.text(title_font, 'CONTROLS & GUIDE', (100, 200, 255))
     title_rect = title.get_rect(center=(config.win_width // 2, config.win_height * 0.1))
     config.window.blit(title, title_rect)
     
     # Content font - Larger
-    content_font = pygame.font.Font('font/Pixeltype.ttf', max(28, int(config.win_height * 0.038)))
-    header_font = pygame.font.Font('font/Pixeltype.ttf', max(38, int(config.win_height * 0.052)))
+    content_font = assets.font(FONT_FILE, max(28, int(config.win_height * 0.038)))
+    header_font = assets.font(FONT_FILE, max(38, int(config.win_height * 0.052)))
     
     # Layout
     left_col_x = config.win_width * 0.15
@@ -1343,26 +1262,29 @@ def render_instructions(menu_font):
     
     # Left Column - Simulation Mode
     y = start_y
-    header = header_font.render('SIMULATION MODE', True, (255, 200, 100))
+    header = assets.text(header_font, 'SIMULATION MODE', (255, 200, 100))
     config.window.blit(header, (left_col_x, y))
     y += section_spacing
     
     sim_controls = [
         ('S', 'Save Champion AI'),
         ('L', 'Load Saved Champion'),
+        ('T', 'Toggle Turbo Speed'),
+        ('P', 'Toggle Perf HUD'),
+        ('C', 'Resume Checkpoint'),
         ('ESC', 'Return to Menu'),
     ]
     
     for key, action in sim_controls:
-        key_text = content_font.render(f'{key}:', True, (150, 255, 150))
-        action_text = content_font.render(action, True, (220, 220, 220))
+        key_text = assets.text(content_font, f'{key}:', (150, 255, 150))
+        action_text = assets.text(content_font, action, (220, 220, 220))
         config.window.blit(key_text, (left_col_x, y))
         config.window.blit(action_text, (left_col_x + 80, y))
         y += line_spacing
     
     # Control Panel Features
     y += section_spacing * 0.5
-    header = header_font.render('CONTROL PANEL', True, (255, 200, 100))
+    header = assets.text(header_font, 'CONTROL PANEL', (255, 200, 100))
     config.window.blit(header, (left_col_x, y))
     y += section_spacing
     
@@ -1375,13 +1297,13 @@ def render_instructions(menu_font):
     ]
     
     for feature in features:
-        text = content_font.render(f'- {feature}', True, (220, 220, 220))
+        text = assets.text(content_font, f'- {feature}', (220, 220, 220))
         config.window.blit(text, (left_col_x, y))
         y += line_spacing
     
     # Right Column - Human vs AI Mode
     y = start_y
-    header = header_font.render('HUMAN vs AI MODE', True, (255, 200, 100))
+    header = assets.text(header_font, 'HUMAN vs AI MODE', (255, 200, 100))
     config.window.blit(header, (right_col_x, y))
     y += section_spacing
     
@@ -1392,37 +1314,63 @@ def render_instructions(menu_font):
     ]
     
     for key, action in player_controls:
-        key_text = content_font.render(f'{key}:', True, (150, 255, 150))
-        action_text = content_font.render(action, True, (220, 220, 220))
+        key_text = assets.text(content_font, f'{key}:', (150, 255, 150))
+        action_text = assets.text(content_font, action, (220, 220, 220))
         config.window.blit(key_text, (right_col_x, y))
         config.window.blit(action_text, (right_col_x + 140, y))
         y += line_spacing
     
     # Save/Load Info
     y += section_spacing * 0.5
-    header = header_font.render('SAVE & LOAD', True, (255, 200, 100))
+    header = assets.text(header_font, 'SAVE & LOAD', (255, 200, 100))
     config.window.blit(header, (right_col_x, y))
     y += section_spacing
     
     save_info = [
         '1. Press S to save best AI',
-        '2. File: champion.pkl',
+        f'2. File: {genome_io.CHAMPION_FILE}',
         '3. Press L to load champion',
         '4. Auto-loads in PvC mode',
     ]
     
     for info in save_info:
-        text = content_font.render(info, True, (220, 220, 220))
+        text = assets.text(content_font, info, (220, 220, 220))
         config.window.blit(text, (right_col_x, y))
         y += line_spacing
     
     # Bottom hint - Larger
-    hint_font = pygame.font.Font('font/Pixeltype.ttf', max(32, int(config.win_height * 0.042)))
-    hint = hint_font.render('Press ESC to return to Main Menu', True, (150, 150, 255))
+    hint_font = assets.font(FONT_FILE, max(32, int(config.win_height * 0.042)))
+    hint = assets.text(hint_font, 'Press ESC to return to Main Menu', (150, 150, 255))
     hint_rect = hint.get_rect(center=(config.win_width // 2, config.win_height * 0.92))
     config.window.blit(hint, hint_rect)
 
 
+# Modes whose simulation runs on a worker thread: (tick, snapshot, allow_turbo)
+SIMULATED_MODES = {
+    MENU_GAME: (game_tick, game_snapshot, True),
+    MENU_SIM_CLONE: (simulate_clone_tick, sim_clone_snapshot, True),
+    MENU_PVC: (lambda: sim_world.step(pvc_players, generation=100),
+               lambda: versus_snapshot(pvc_players), False),
+    MENU_DQN_PLAY: (lambda: sim_world.step(dqn_play_players, generation=100),
+                    lambda: versus_snapshot(dqn_play_players), False),
+}
+
+
+def sync_simulation(state):
+    """
+    Keep a simulation thread running for the current mode (stopping the
+    previous one on a mode change).  Returns the snapshot to draw, or None.
+    """
+    global sim_thread
+    if sim_thread is not None and sim_thread.name != state:
+        sim_thread.stop()
+        sim_thread = None
+    if sim_thread is None and state in SIMULATED_MODES:
+        tick, snapshot, allow_turbo = SIMULATED_MODES[state]
+        sim_thread = simulation.SimulationThread(tick, snapshot, ui_state, allow_turbo, name=state).start()
+    return sim_thread.latest() if sim_thread is not None else None
+
+
 def main():
     global bc_recorder, dqn_play_players
     state = MENU_MAIN
@@ -1432,444 +1380,415 @@ def main():
         title_font, menu_font, author_font = get_fonts()
         events = pygame.event.get()
         control_rects = {}  # Initialize to prevent UnboundLocalError
+        snap = sync_simulation(state)
 
-        if state == MENU_MAIN:
-            layout = layout_main_menu(title_font, menu_font, author_font)
-            buttons = draw_main_menu(layout)
-        elif state == MENU_INSTRUCTIONS:
-            buttons = []
-            render_instructions(menu_font)
-        elif state == MENU_PVC:
-            buttons = []
-            run_pvc_game_step()
-            control_rects = draw_control_panel(state, menu_font)
-        elif state == MENU_SIM_CLONE:
-            buttons = []
-            run_simulate_clone_step()
-            control_rects = draw_control_panel(state, menu_font)
-        elif state == MENU_DQN_PLAY:
-            buttons = []
-            run_dqn_play_step()
-            control_rects = draw_control_panel(state, menu_font)
-        elif state == MENU_DQN_TRAIN:
-            buttons = []
-            render_dqn_training_screen(menu_font)
-            # Check if training finished
-            if dqn_training_state['done']:
-                dqn_training_state['done'] = False
-                dqn_training_state['running'] = False
-                show_notification('DQN Training Complete!')
-                state = MENU_MAIN
-        elif state == MENU_GAME:
-            buttons = []
-            run_game_step()
-            control_rects = draw_control_panel(state, menu_font)
-
-        for event in events:
-            handle_common_events(event)
-
+        with perf.phase('draw'):
             if state == MENU_MAIN:
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    mouse_pos = event.pos
-                    for _, rect, action in buttons:
-                        if rect.collidepoint(mouse_pos):
-                            if action == 'start':
-                                play_click()
-                                state = MENU_GAME
-                                config.pipes.clear()
-                                game_state['pipes_spawn_time'] = 10
-                                game_state['score'] = 0
-                                game_state['high_score'] = 0
-                            elif action == 'pvc':
-                                play_click()
-                                global population_manager, pvc_players
-                                state = MENU_PVC
-                                config.pipes.clear()
-                                game_state['pipes_spawn_time'] = 10
-                                game_state['score'] = 0
-                                # Setup PvC players
-                                import player as player_mod
-                                import pickle
-
-                                pvc_human = player_mod.Player(is_human=True)
-                                pvc_ai = player_mod.Player(is_human=False)
-
-                                # Try to load champion first
-                                champion_loaded = False
-                                if os.path.exists('champion.pkl'):
-                                    try:
-                                        with open('champion.pkl', 'rb') as f:
-                                            champion_brain = pickle.load(f)
-                                        pvc_ai.brain = champion_brain.clone()
-                                        champion_loaded = True
-                                        print("Loaded champion AI for PvC mode")
-                                    except Exception as e:
-                                        print(f"Error loading champion: {e}")
-
-                                if not champion_loaded:
-                                    print("No champion found, creating competent AI")
-                                    for conn in pvc_ai.brain.connections:
-                                        if hasattr(conn, 'enabled') and not conn.enabled:
-                                            continue
-                                        if conn.from_node.id == 0:
-                                            conn.weight = -3.5
-                                        elif conn.from_node.id == 1:
-                                            conn.weight = 0.5
-                                        elif conn.from_node.id == 2:
-                                            conn.weight = 2.0
-                                        elif conn.from_node.id == 3:
-                                            conn.weight = -2.0
-                                        elif conn.from_node.id == pvc_ai.brain.bias_index:
-                                            conn.weight = -1.5
-
-                                pvc_players = [pvc_human, pvc_ai]
-
-                                # Initialize recorder for PvC
-                                from behavioral_cloning import DataRecorder
-                                bc_recorder = DataRecorder()
-
-                            elif action == 'train_clone':
-                                play_click()
-                                print('[MENU] Train Clone clicked')
-                                from behavioral_cloning import BCTrainer
-                                trainer = BCTrainer()
-                                acc, n = trainer.train()
-                                if acc is not None:
-                                    show_notification(f'Clone trained! Acc={acc:.1f}% ({n} samples)')
-                                    print(f'[BC] Training done: acc={acc:.1f}%')
-                                else:
-                                    show_notification('No data! Record in Human vs AI first (R key)')
-                                    print('[BC] No training data found')
-
-                            elif action == 'sim_clone':
-                                play_click()
-                                print('[MENU] Simulate Clone clicked')
-                                players, algo_map = _init_sim_clone_players()
-                                if players:
-                                    sim_clone_state['players'] = players
-                                    sim_clone_state['algo_map'] = algo_map
-                                    sim_clone_state['round'] = 0
-                                    sim_clone_state['history'] = {algo: [] for algo in ALGO_COLORS}
-                                    sim_clone_state['best_scores'] = {'NEAT': 0, 'BC': 0, 'DQN': 0}
-                                    state = MENU_SIM_CLONE
-                                    config.pipes.clear()
-                                    game_state['pipes_spawn_time'] = 10
-                                    game_state['score'] = 0
-                                    game_state['wind_zones'] = []
-                                    game_state['coins'] = []
-                                    game_state['flying_blocks'] = []
-                                    game_state['falling_obstacles'] = []
-                                    game_state['obstacle_counter'] = 0
-                                    print(f'[SIM] Starting with {len(players)} planes')
-                                else:
-                                    show_notification('No trained models! Train BC or DQN first.')
-
-                            elif action == 'train_dqn':
-                                play_click()
-                                if not dqn_training_state['running']:
-                                    dqn_training_state['running'] = True
-                                    dqn_training_state['done'] = False
-                                    dqn_training_state['progress'] = 'Starting...'
-                                    state = MENU_DQN_TRAIN
-
-                                    def _train_dqn_thread():
+                layout = layout_main_menu(title_font, menu_font, author_font)
+                buttons = draw_main_menu(layout)
+            elif state == MENU_INSTRUCTIONS:
+                buttons = []
+                render_instructions(menu_font)
+            elif state == MENU_PVC:
+                buttons = []
+                render_pvc_game_step(snap)
+                control_rects = draw_control_panel(state, menu_font, snap)
+            elif state == MENU_SIM_CLONE:
+                buttons = []
+                render_simulate_clone_step(snap)
+                control_rects = draw_control_panel(state, menu_font, snap)
+            elif state == MENU_DQN_PLAY:
+                buttons = []
+                render_dqn_play_step(snap)
+                control_rects = draw_control_panel(state, menu_font, snap)
+            elif state == MENU_DQN_TRAIN:
+                buttons = []
+                render_dqn_training_screen(menu_font)
+                # Check if training finished
+                if dqn_training_state['done']:
+                    dqn_training_state['done'] = False
+                    dqn_training_state['running'] = False
+                    show_notification('DQN Training Complete!')
+                    state = MENU_MAIN
+            elif state == MENU_GAME:
+                buttons = []
+                render_game_step(snap)
+                control_rects = draw_control_panel(state, menu_font, snap)
+
+        # Handlers change simulation state: keep the worker out while they run
+        with simulation.lock:
+            for event in events:
+                handle_common_events(event)
+
+                if state == MENU_MAIN:
+                    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                        mouse_pos = event.pos
+                        for _, rect, action in buttons:
+                            if rect.collidepoint(mouse_pos):
+                                if action == 'start':
+                                    play_click()
+                                    state = MENU_GAME
+                                    sim_world.reset()
+                                    sim_world.high_score = 0
+                                elif action == 'pvc':
+                                    play_click()
+                                    global population_manager, pvc_players
+                                    state = MENU_PVC
+                                    sim_world.reset()
+                                    # Setup PvC players
+                                    import player as player_mod
+
+                                    pvc_human = player_mod.Player(is_human=True)
+                                    pvc_ai = player_mod.Player(is_human=False)
+
+                                    # Try to load champion first
+                                    champion_loaded = False
+                                    if genome_io.champion_path():
                                         try:
-                                            from dqn_agent import DQNAgent
-                                            agent = DQNAgent()
-
-                                            def _progress(ep, total, reward, score, eps):
-                                                dqn_training_state['progress'] = (
-                                                    f'Episode {ep}/{total}  Reward={reward:.0f}  '
-                                                    f'Score={score}  eps={eps:.3f}'
-                                                )
-
-                                            agent.train(
-                                                num_episodes=300,
-                                                max_steps=3000,
-                                                progress_callback=_progress,
-                                            )
-                                            dqn_training_state['result'] = agent.training_log
+                                            champion_brain = genome_io.load_brain(genome_io.champion_path())
+                                            pvc_ai.brain = champion_brain.clone()
+                                            champion_loaded = True
+                                            print("Loaded champion AI for PvC mode")
                                         except Exception as e:
-                                            print(f'[DQN] Training error: {e}')
-                                            dqn_training_state['progress'] = f'Error: {e}'
-                                        finally:
-                                            dqn_training_state['done'] = True
+                                            print(f"Error loading champion: {e}")
+
+                                    if not champion_loaded:
+                                        print("No champion found, creating competent AI")
+                                        for conn in pvc_ai.brain.connections:
+                                            if hasattr(conn, 'enabled') and not conn.enabled:
+                                                continue
+                                            if conn.from_node.id == 0:
+                                                conn.weight = -3.5
+                                            elif conn.from_node.id == 1:
+                                                conn.weight = 0.5
+                                            elif conn.from_node.id == 2:
+                                                conn.weight = 2.0
+                                            elif conn.from_node.id == 3:
+                                                conn.weight = -2.0
+                                            elif conn.from_node.id == pvc_ai.brain.bias_index:
+                                                conn.weight = -1.5
+                                        pvc_ai.brain.invalidate()
+
+                                    pvc_players = [pvc_human, pvc_ai]
+
+                                    # Initialize recorder for PvC
+                                    from behavioral_cloning import DataRecorder
+                                    bc_recorder = DataRecorder()
+
+                                elif action == 'train_clone':
+                                    play_click()
+                                    print('[MENU] Train Clone clicked')
+                                    from behavioral_cloning import BCTrainer
+                                    trainer = BCTrainer()
+                                    acc, n = trainer.train()
+                                    if acc is not None:
+                                        show_notification(f'Clone trained! Acc={acc:.1f}% ({n} samples)')
+                                        print(f'[BC] Training done: acc={acc:.1f}%')
+                                    else:
+                                        show_notification('No data! Record in Human vs AI first (R key)')
+                                        print('[BC] No training data found')
+
+                                elif action == 'sim_clone':
+                                    play_click()
+                                    print('[MENU] Simulate Clone clicked')
+                                    players, algo_map = _init_sim_clone_players()
+                                    if players:
+                                        sim_clone_state['players'] = players
+                                        sim_clone_state['algo_map'] = algo_map
+                                        sim_clone_state['round'] = 0
+                                        sim_clone_state['history'] = {algo: [] for algo in ALGO_COLORS}
+                                        sim_clone_state['best_scores'] = {'NEAT': 0, 'BC': 0, 'DQN': 0}
+                                        state = MENU_SIM_CLONE
+                                        sim_world.reset()
+                                        print(f'[SIM] Starting with {len(players)} planes')
+                                    else:
+                                        show_notification('No trained models! Train BC or DQN first.')
+
+                                elif action == 'train_dqn':
+                                    play_click()
+                                    if not dqn_training_state['running']:
+                                        dqn_training_state['running'] = True
+                                        dqn_training_state['done'] = False
+                                        dqn_training_state['progress'] = 'Starting...'
+                                        state = MENU_DQN_TRAIN
+
+                                        def _train_dqn_thread():
+                                            try:
+                                                from dqn_agent import DQNAgent
+                                                agent = DQNAgent()
+
+                                                def _progress(ep, total, reward, score, eps):
+                                                    dqn_training_state['progress'] = (
+                                                        f'Episode {ep}/{total}  Reward={reward:.0f}  '
+                                                        f'Score={score}  eps={eps:.3f}'
+                                                    )
+
+                                                agent.train(
+                                                    num_episodes=300,
+                                                    max_steps=3000,
+                                                    progress_callback=_progress,
+                                                )
+                                                dqn_training_state['result'] = agent.training_log
+                                            except Exception as e:
+                                                print(f'[DQN] Training error: {e}')
+                                                dqn_training_state['progress'] = f'Error: {e}'
+                                            finally:
+                                                dqn_training_state['done'] = True
+
+                                        t = threading.Thread(target=_train_dqn_thread, daemon=True)
+                                        t.start()
+
+                                elif action == 'play_dqn':
+                                    play_click()
+                                    print('[MENU] Play vs DQN clicked')
+                                    import player as player_mod
+                                    dqn_human = player_mod.Player(is_human=True)
+                                    dqn_ai = player_mod.DQNPlayer()
+                                    if dqn_ai.load_model():
+                                        state = MENU_DQN_PLAY
+                                        sim_world.reset()
+                                        dqn_play_players = [dqn_human, dqn_ai]
+                                        print('[DQN] Starting Play vs DQN mode')
+                                    else:
+                                        show_notification('No trained DQN! Train first.')
+                                        print('[DQN] No model found')
+
+                                elif action == 'instructions':
+                                    play_click()
+                                    state = MENU_INSTRUCTIONS
+                                    set_music('menu')
+                                elif action == 'audio':
+                                    play_click()
+                                    config.mute = not config.mute
+                                    set_music('menu')
+                                elif action == 'exit':
+                                    play_click()
+                                    save_checkpoint(background=False)
+                                    pygame.quit()
+                                    exit()
+            
+                if state == MENU_INSTRUCTIONS:
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                        state = MENU_MAIN
+                        set_music('menu')
 
-                                    t = threading.Thread(target=_train_dqn_thread, daemon=True)
-                                    t.start()
+                if state == MENU_DQN_TRAIN:
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                        dqn_training_state['running'] = False
+                        dqn_training_state['done'] = True
+                        state = MENU_MAIN
 
-                            elif action == 'play_dqn':
+                if state in (MENU_SIM_CLONE, MENU_DQN_PLAY):
+                    active_players = sim_clone_state['players'] if state == MENU_SIM_CLONE else dqn_play_players
+                    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                        if 'slider_track' in control_rects and (control_rects['slider_track'].collidepoint(event.pos) or control_rects['slider_knob'].collidepoint(event.pos)):
+                            ui_state['slider_dragging'] = True
+                            update_slider_from_mouse(event.pos[0], control_rects['slider_track'])
+                        elif 'jump_track' in control_rects and (control_rects['jump_track'].collidepoint(event.pos) or control_rects['jump_knob'].collidepoint(event.pos)):
+                            ui_state['jump_dragging'] = True
+                            update_jump_from_mouse(event.pos[0], control_rects['jump_track'])
+                        elif 'lines_toggle' in control_rects and control_rects['lines_toggle'].collidepoint(event.pos):
+                            play_click()
+                            config.show_lines = not config.show_lines
+                        elif 'pause' in control_rects and control_rects['pause'].collidepoint(event.pos):
+                            play_click()
+                            ui_state['is_paused'] = not ui_state['is_paused']
+                        elif 'restart' in control_rects and control_rects['restart'].collidepoint(event.pos):
+                            play_click()
+                            sim_world.reset()
+                            for p in active_players:
+                                p.alive = True
+                                p.rect.centery = config.win_height // 2
+                                p.vel = 0
+                        elif 'back' in control_rects and control_rects['back'].collidepoint(event.pos):
+                            play_click()
+                            state = MENU_MAIN
+                            set_music('menu')
+                        
+                        if state == MENU_SIM_CLONE:
+                            if '_minus_rect' in sim_clone_state and sim_clone_state['_minus_rect'].collidepoint(event.pos):
                                 play_click()
-                                print('[MENU] Play vs DQN clicked')
-                                import player as player_mod
-                                dqn_human = player_mod.Player(is_human=True)
-                                dqn_ai = player_mod.DQNPlayer()
-                                if dqn_ai.load_model():
-                                    state = MENU_DQN_PLAY
-                                    config.pipes.clear()
-                                    game_state['pipes_spawn_time'] = 10
-                                    game_state['score'] = 0
-                                    dqn_play_players = [dqn_human, dqn_ai]
-                                    print('[DQN] Starting Play vs DQN mode')
-                                else:
-                                    show_notification('No trained DQN! Train first.')
-                                    print('[DQN] No model found')
-
-                            elif action == 'instructions':
+                                sim_clone_state['planes_per_algo'] = max(1, sim_clone_state['planes_per_algo'] - 1)
+                                # Apply immediately by resetting round
+                                sim_world.reset()
+                                sim_clone_state['round_scores'] = {algo: 0 for algo in ALGO_COLORS}
+                                new_players, new_map = _init_sim_clone_players()
+                                sim_clone_state['players'] = new_players
+                                sim_clone_state['algo_map'] = new_map
+                            
+                            elif '_plus_rect' in sim_clone_state and sim_clone_state['_plus_rect'].collidepoint(event.pos):
                                 play_click()
-                                state = MENU_INSTRUCTIONS
-                                set_music('menu')
-                            elif action == 'audio':
+                                sim_clone_state['planes_per_algo'] = min(20, sim_clone_state['planes_per_algo'] + 1)
+                                # Apply immediately by resetting round
+                                sim_world.reset()
+                                sim_clone_state['round_scores'] = {algo: 0 for algo in ALGO_COLORS}
+                                new_players, new_map = _init_sim_clone_players()
+                                sim_clone_state['players'] = new_players
+                                sim_clone_state['algo_map'] = new_map
+                            
+                            elif '_info_btn' in sim_clone_state and sim_clone_state['_info_btn'].collidepoint(event.pos):
                                 play_click()
-                                config.mute = not config.mute
-                                set_music('menu')
-                            elif action == 'exit':
+                                sim_clone_state['show_info'] = not sim_clone_state.get('show_info', False)
+                            
+                            elif '_graph_btn' in sim_clone_state and sim_clone_state['_graph_btn'].collidepoint(event.pos):
                                 play_click()
-                                pygame.quit()
-                                exit()
-            
-            # Global Key shortcuts (Save/Load)
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_s:
-                    population_manager.save_champion()
-                    # Show confirmation toast? For now print to console
-                if event.key == pygame.K_l:
-                    population_manager.load_champion()
-                    restart_simulation()
-
-            if state == MENU_INSTRUCTIONS:
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    state = MENU_MAIN
-                    set_music('menu')
-
-            if state == MENU_DQN_TRAIN:
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    dqn_training_state['running'] = False
-                    dqn_training_state['done'] = True
-                    state = MENU_MAIN
-
-            if state in (MENU_SIM_CLONE, MENU_DQN_PLAY):
-                active_players = sim_clone_state['players'] if state == MENU_SIM_CLONE else dqn_play_players
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if 'slider_track' in control_rects and (control_rects['slider_track'].collidepoint(event.pos) or control_rects['slider_knob'].collidepoint(event.pos)):
-                        ui_state['slider_dragging'] = True
+                                show_sim_clone_graph()
+                    if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                        ui_state['slider_dragging'] = False
+                        ui_state['jump_dragging'] = False
+                    if event.type == pygame.MOUSEMOTION and ui_state['slider_dragging'] and 'slider_track' in control_rects:
                         update_slider_from_mouse(event.pos[0], control_rects['slider_track'])
-                    elif 'jump_track' in control_rects and (control_rects['jump_track'].collidepoint(event.pos) or control_rects['jump_knob'].collidepoint(event.pos)):
-                        ui_state['jump_dragging'] = True
+                    if event.type == pygame.MOUSEMOTION and ui_state['jump_dragging'] and 'jump_track' in control_rects:
                         update_jump_from_mouse(event.pos[0], control_rects['jump_track'])
-                    elif 'lines_toggle' in control_rects and control_rects['lines_toggle'].collidepoint(event.pos):
-                        play_click()
-                        config.show_lines = not config.show_lines
-                    elif 'pause' in control_rects and control_rects['pause'].collidepoint(event.pos):
-                        play_click()
-                        ui_state['is_paused'] = not ui_state['is_paused']
-                    elif 'restart' in control_rects and control_rects['restart'].collidepoint(event.pos):
-                        play_click()
-                        config.pipes.clear()
-                        game_state['pipes_spawn_time'] = 10
-                        game_state['score'] = 0
-                        for p in active_players:
-                            p.alive = True
-                            p.rect.centery = config.win_height // 2
-                            p.vel = 0
-                    elif 'back' in control_rects and control_rects['back'].collidepoint(event.pos):
-                        play_click()
-                        state = MENU_MAIN
-                        set_music('menu')
-                        
-                    if state == MENU_SIM_CLONE:
-                        if '_minus_rect' in sim_clone_state and sim_clone_state['_minus_rect'].collidepoint(event.pos):
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            state = MENU_MAIN
+                            set_music('menu')
+                        elif event.key == pygame.K_t and state == MENU_SIM_CLONE:
+                            toggle_turbo()
+                        elif event.key == pygame.K_p and state == MENU_SIM_CLONE:
+                            toggle_perf()
+                        else:
+                            for p in active_players:
+                                if p.is_human:
+                                    p.handle_event(event)
+
+                if state == MENU_PVC:
+                    # Control panel interactions
+                    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                        if 'slider_track' in control_rects and (control_rects['slider_track'].collidepoint(event.pos) or control_rects['slider_knob'].collidepoint(event.pos)):
+                            ui_state['slider_dragging'] = True
+                            update_slider_from_mouse(event.pos[0], control_rects['slider_track'])
+                        elif 'jump_track' in control_rects and (control_rects['jump_track'].collidepoint(event.pos) or control_rects['jump_knob'].collidepoint(event.pos)):
+                            ui_state['jump_dragging'] = True
+                            update_jump_from_mouse(event.pos[0], control_rects['jump_track'])
+                        elif 'lines_toggle' in control_rects and control_rects['lines_toggle'].collidepoint(event.pos):
                             play_click()
-                            sim_clone_state['planes_per_algo'] = max(1, sim_clone_state['planes_per_algo'] - 1)
-                            # Apply immediately by resetting round
-                            config.pipes.clear()
-                            game_state['wind_zones'] = []
-                            game_state['coins'] = []
-                            game_state['flying_blocks'] = []
-                            game_state['falling_obstacles'] = []
-                            game_state['obstacle_counter'] = 0
-                            game_state['pipes_spawn_time'] = 10
-                            game_state['score'] = 0
-                            sim_clone_state['round_scores'] = {algo: 0 for algo in ALGO_COLORS}
-                            new_players, new_map = _init_sim_clone_players()
-                            sim_clone_state['players'] = new_players
-                            sim_clone_state['algo_map'] = new_map
-                            
-                        elif '_plus_rect' in sim_clone_state and sim_clone_state['_plus_rect'].collidepoint(event.pos):
+                            config.show_lines = not config.show_lines
+                        elif 'pause' in control_rects and control_rects['pause'].collidepoint(event.pos):
                             play_click()
-                            sim_clone_state['planes_per_algo'] = min(20, sim_clone_state['planes_per_algo'] + 1)
-                            # Apply immediately by resetting round
-                            config.pipes.clear()
-                            game_state['wind_zones'] = []
-                            game_state['coins'] = []
-                            game_state['flying_blocks'] = []
-                            game_state['falling_obstacles'] = []
-                            game_state['obstacle_counter'] = 0
-                            game_state['pipes_spawn_time'] = 10
-                            game_state['score'] = 0
-                            sim_clone_state['round_scores'] = {algo: 0 for algo in ALGO_COLORS}
-                            new_players, new_map = _init_sim_clone_players()
-                            sim_clone_state['players'] = new_players
-                            sim_clone_state['algo_map'] = new_map
-                            
-                        elif '_info_btn' in sim_clone_state and sim_clone_state['_info_btn'].collidepoint(event.pos):
+                            ui_state['is_paused'] = not ui_state['is_paused']
+                        elif 'restart' in control_rects and control_rects['restart'].collidepoint(event.pos):
                             play_click()
-                            sim_clone_state['show_info'] = not sim_clone_state.get('show_info', False)
-                            
-                        elif '_graph_btn' in sim_clone_state and sim_clone_state['_graph_btn'].collidepoint(event.pos):
+                            sim_world.reset()
+                            for p in pvc_players:
+                                p.alive = True
+                                p.rect.centery = config.win_height // 2
+                                p.vel = 0
+                        elif 'back' in control_rects and control_rects['back'].collidepoint(event.pos):
                             play_click()
-                            show_sim_clone_graph()
-                if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-                    ui_state['slider_dragging'] = False
-                    ui_state['jump_dragging'] = False
-                if event.type == pygame.MOUSEMOTION and ui_state['slider_dragging'] and 'slider_track' in control_rects:
-                    update_slider_from_mouse(event.pos[0], control_rects['slider_track'])
-                if event.type == pygame.MOUSEMOTION and ui_state['jump_dragging'] and 'jump_track' in control_rects:
-                    update_jump_from_mouse(event.pos[0], control_rects['jump_track'])
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        state = MENU_MAIN
-                        set_music('menu')
-                    else:
-                        for p in active_players:
-                            if p.is_human:
-                                p.handle_event(event)
-
-            if state == MENU_PVC:
-                # Control panel interactions
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if 'slider_track' in control_rects and (control_rects['slider_track'].collidepoint(event.pos) or control_rects['slider_knob'].collidepoint(event.pos)):
-                        ui_state['slider_dragging'] = True
+                            state = MENU_MAIN
+                            set_music('menu')
+                    if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                        ui_state['slider_dragging'] = False
+                        ui_state['jump_dragging'] = False
+                    if event.type == pygame.MOUSEMOTION and ui_state['slider_dragging'] and 'slider_track' in control_rects:
                         update_slider_from_mouse(event.pos[0], control_rects['slider_track'])
-                    elif 'jump_track' in control_rects and (control_rects['jump_track'].collidepoint(event.pos) or control_rects['jump_knob'].collidepoint(event.pos)):
-                        ui_state['jump_dragging'] = True
+                    if event.type == pygame.MOUSEMOTION and ui_state['jump_dragging'] and 'jump_track' in control_rects:
                         update_jump_from_mouse(event.pos[0], control_rects['jump_track'])
-                    elif 'lines_toggle' in control_rects and control_rects['lines_toggle'].collidepoint(event.pos):
-                        play_click()
-                        config.show_lines = not config.show_lines
-                    elif 'pause' in control_rects and control_rects['pause'].collidepoint(event.pos):
-                        play_click()
-                        ui_state['is_paused'] = not ui_state['is_paused']
-                    elif 'restart' in control_rects and control_rects['restart'].collidepoint(event.pos):
-                        play_click()
-                        config.pipes.clear()
-                        game_state['pipes_spawn_time'] = 10
-                        game_state['score'] = 0
-                        for p in pvc_players:
-                            p.alive = True
-                            p.rect.centery = config.win_height // 2
-                            p.vel = 0
-                    elif 'back' in control_rects and control_rects['back'].collidepoint(event.pos):
-                        play_click()
-                        state = MENU_MAIN
-                        set_music('menu')
-                if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-                    ui_state['slider_dragging'] = False
-                    ui_state['jump_dragging'] = False
-                if event.type == pygame.MOUSEMOTION and ui_state['slider_dragging'] and 'slider_track' in control_rects:
-                    update_slider_from_mouse(event.pos[0], control_rects['slider_track'])
-                if event.type == pygame.MOUSEMOTION and ui_state['jump_dragging'] and 'jump_track' in control_rects:
-                    update_jump_from_mouse(event.pos[0], control_rects['jump_track'])
-                # Player controls + Recording toggle
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        state = MENU_MAIN
-                        set_music('menu')
-                    elif event.key == pygame.K_r:
-                        # Toggle recording for behavioral cloning
-                        if bc_recorder is not None:
-                            if bc_recorder.recording:
-                                bc_recorder.stop()
-                                count = bc_recorder.save()
-                                show_notification(f'Recording saved! {count} samples')
-                            else:
-                                bc_recorder.start()
-                                show_notification('Recording started... Press R to stop')
-                    elif event.key == pygame.K_l:
-                        try:
-                            import pickle
-                            filename = 'champion.pkl'
-                            if os.path.exists(filename):
-                                with open(filename, 'rb') as f:
-                                    champion_brain = pickle.load(f)
-                                show_notification('Champion AI Loaded for PvC!')
-                                for p in pvc_players:
-                                    if not p.is_human:
-                                        p.brain = champion_brain.clone()
-                                        p.alive = True
-                                        p.rect.centery = config.win_height // 2
-                                        p.vel = 0
-                                        p.fitness = 0
-                                        p.lifespan = 0
-                                print(f"Loaded champion brain for PvC mode")
-                            else:
-                                show_notification('No champion.pkl found!')
-                                print(f"Champion file not found: {filename}")
-                        except Exception as e:
-                            show_notification(f'Error loading champion!')
-                            print(f"Error loading champion: {e}")
-                    else:
-                        for p in pvc_players:
-                            if p.is_human:
-                                p.handle_event(event)
-
-                # Capture BC data each frame during PvC
-                if bc_recorder and bc_recorder.recording:
-                    human = next((p for p in pvc_players if p.is_human), None)
-                    if human and human.alive:
-                        keys = pygame.key.get_pressed()
-                        if keys[pygame.K_SPACE] or keys[pygame.K_UP]:
-                            action = 1
-                        elif keys[pygame.K_DOWN]:
-                            action = -1
+                    # Player controls + Recording toggle
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            state = MENU_MAIN
+                            set_music('menu')
+                        elif event.key == pygame.K_r:
+                            # Toggle recording for behavioral cloning
+                            if bc_recorder is not None:
+                                if bc_recorder.recording:
+                                    bc_recorder.stop()
+                                    count = bc_recorder.save()
+                                    show_notification(f'Recording saved! {count} samples')
+                                else:
+                                    bc_recorder.start()
+                                    show_notification('Recording started... Press R to stop')
+                        elif event.key == pygame.K_l:
+                            try:
+                                filename = genome_io.champion_path()
+                                if filename:
+                                    champion_brain = genome_io.load_brain(filename)
+                                    show_notification('Champion AI Loaded for PvC!')
+                                    for p in pvc_players:
+                                        if not p.is_human:
+                                            p.brain = champion_brain.clone()
+                                            p.alive = True
+                                            p.rect.centery = config.win_height // 2
+                                            p.vel = 0
+                                            p.fitness = 0
+                                            p.lifespan = 0
+                                    print(f"Loaded champion brain for PvC mode")
+                                else:
+                                    show_notification('No saved champion found!')
+                                    print(f"Champion file not found: {genome_io.CHAMPION_FILE}")
+                            except Exception as e:
+                                show_notification(f'Error loading champion!')
+                                print(f"Error loading champion: {e}")
                         else:
-                            action = 0
-                        human.look()
-                        bc_recorder.capture(human.vision, action)
-
-            elif state == MENU_GAME:
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if 'slider_track' in control_rects and (control_rects['slider_track'].collidepoint(event.pos) or control_rects['slider_knob'].collidepoint(event.pos)):
-                        ui_state['slider_dragging'] = True
+                            for p in pvc_players:
+                                if p.is_human:
+                                    p.handle_event(event)
+
+                    # Capture BC data each frame during PvC
+                    if bc_recorder and bc_recorder.recording:
+                        human = next((p for p in pvc_players if p.is_human), None)
+                        if human and human.alive:
+                            keys = pygame.key.get_pressed()
+                            if keys[pygame.K_SPACE] or keys[pygame.K_UP]:
+                                action = 1
+                            elif keys[pygame.K_DOWN]:
+                                action = -1
+                            else:
+                                action = 0
+                            human.look()
+                            bc_recorder.capture(human.vision, action)
+
+                elif state == MENU_GAME:
+                    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                        if 'slider_track' in control_rects and (control_rects['slider_track'].collidepoint(event.pos) or control_rects['slider_knob'].collidepoint(event.pos)):
+                            ui_state['slider_dragging'] = True
+                            update_slider_from_mouse(event.pos[0], control_rects['slider_track'])
+                        elif 'jump_track' in control_rects and (control_rects['jump_track'].collidepoint(event.pos) or control_rects['jump_knob'].collidepoint(event.pos)):
+                            ui_state['jump_dragging'] = True
+                            update_jump_from_mouse(event.pos[0], control_rects['jump_track'])
+                        elif 'lines_toggle' in control_rects and control_rects['lines_toggle'].collidepoint(event.pos):
+                            play_click()
+                            config.show_lines = not config.show_lines
+                        elif 'graph' in control_rects and control_rects['graph'].collidepoint(event.pos):
+                            play_click()
+                            graph_state['dirty'] = True
+                            show_graph_window()
+                        elif 'pause' in control_rects and control_rects['pause'].collidepoint(event.pos):
+                            play_click()
+                            ui_state['is_paused'] = not ui_state['is_paused']
+                        elif 'restart' in control_rects and control_rects['restart'].collidepoint(event.pos):
+                            play_click()
+                            restart_simulation()
+                        elif 'back' in control_rects and control_rects['back'].collidepoint(event.pos):
+                            play_click()
+                            state = MENU_MAIN
+                            set_music('menu')
+                    if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                        ui_state['slider_dragging'] = False
+                        ui_state['jump_dragging'] = False
+                    if event.type == pygame.MOUSEMOTION and ui_state['slider_dragging'] and 'slider_track' in control_rects:
                         update_slider_from_mouse(event.pos[0], control_rects['slider_track'])
-                    elif 'jump_track' in control_rects and (control_rects['jump_track'].collidepoint(event.pos) or control_rects['jump_knob'].collidepoint(event.pos)):
-                        ui_state['jump_dragging'] = True
+                    if event.type == pygame.MOUSEMOTION and ui_state['jump_dragging'] and 'jump_track' in control_rects:
                         update_jump_from_mouse(event.pos[0], control_rects['jump_track'])
-                    elif 'lines_toggle' in control_rects and control_rects['lines_toggle'].collidepoint(event.pos):
-                        play_click()
-                        config.show_lines = not config.show_lines
-                    elif 'graph' in control_rects and control_rects['graph'].collidepoint(event.pos):
-                        play_click()
-                        graph_state['dirty'] = True
-                        show_graph_window()
-                    elif 'pause' in control_rects and control_rects['pause'].collidepoint(event.pos):
-                        play_click()
-                        ui_state['is_paused'] = not ui_state['is_paused']
-                    elif 'restart' in control_rects and control_rects['restart'].collidepoint(event.pos):
-                        play_click()
-                        restart_simulation()
-                    elif 'back' in control_rects and control_rects['back'].collidepoint(event.pos):
-                        play_click()
-                        state = MENU_MAIN
-                        set_music('menu')
-                if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-                    ui_state['slider_dragging'] = False
-                    ui_state['jump_dragging'] = False
-                if event.type == pygame.MOUSEMOTION and ui_state['slider_dragging'] and 'slider_track' in control_rects:
-                    update_slider_from_mouse(event.pos[0], control_rects['slider_track'])
-                if event.type == pygame.MOUSEMOTION and ui_state['jump_dragging'] and 'jump_track' in control_rects:
-                    update_jump_from_mouse(event.pos[0], control_rects['jump_track'])
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        state = MENU_MAIN
-                        set_music('menu')
-                    elif event.key == pygame.K_s:
-                        if population_manager.save_champion():
-                            show_notification('Champion AI Saved!')
-                    elif event.key == pygame.K_l:
-                        if population_manager.load_champion():
-                            show_notification('Champion AI Loaded!')
-                            restart_simulation()
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            state = MENU_MAIN
+                            set_music('menu')
+                        elif event.key == pygame.K_t:
+                            toggle_turbo()
+                        elif event.key == pygame.K_p:
+                            toggle_perf()
+                        elif event.key == pygame.K_c:
+                            resume_checkpoint()
+                        elif event.key == pygame.K_s:
+                            if population_manager.save_champion():
+                                show_notification('Champion AI Saved!')
+                        elif event.key == pygame.K_l:
+                            if load_champion():
+                                show_notification('Champion AI Loaded!')
 
         pygame.display.flip()
         clock.tick(60)
@@ -1,5 +1,7 @@
 import pygame
 
+import assets
+
 # Colors
 BG_COLOR = (15, 18, 24)
 BTN_COLOR = (235, 235, 235)
@@ -31,13 +33,7 @@ class Button:
         hovering = self.rect.collidepoint(mouse_pos)
 
         # Shadow
-        shadow_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(
-            shadow_surf,
-            SHADOW_COLOR,
-            shadow_surf.get_rect(),
-            border_radius=self.corner_radius,
-        )
+        shadow_surf = assets.surface(('button_shadow', self.rect.size, self.corner_radius), self._build_shadow)
         surface.blit(shadow_surf, (self.rect.x + self.shadow_offset[0], self.rect.y + self.shadow_offset[1]))
 
         # Button face
@@ -45,10 +41,20 @@ class Button:
         pygame.draw.rect(surface, face_color, self.rect, border_radius=self.corner_radius)
 
         # Text
-        label = self.font.render(self.text, True, TEXT_COLOR)
+        label = assets.text(self.font, self.text, TEXT_COLOR)
         label_rect = label.get_rect(center=self.rect.center)
         surface.blit(label, label_rect)
 
+    def _build_shadow(self):
+        shadow_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(
+            shadow_surf,
+            SHADOW_COLOR,
+            shadow_surf.get_rect(),
+            border_radius=self.corner_radius,
+        )
+        return shadow_surf
+
     def is_clicked(self, event: pygame.event.Event) -> bool:
         return event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(event.pos)
 
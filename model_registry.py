@@ -0,0 +1,94 @@
+"""
+FlightX Model Registry
+======================
+Loads each trained artifact once and hands the same object to every
+plane that flies it.  Before returning a model the registry compares the
+file's modification time with the one it loaded; a retrained or newly
+saved file is picked up on the next get() (hot reload), an unchanged one
+costs a single os.stat().
+
+The models are shared, so callers must treat them as read-only policies:
+predict with them, never train or mutate them.
+
+Registered by default:
+    'neat'  the saved champion brain (champion.fxg, or a legacy champion.pkl)
+    'bc'    the behavioural cloning model (bc_model.pth)
+    'dqn'   the DQN Q-network (dqn_model.pth)
+
+Usage:
+    model = model_registry.registry.get('dqn')      # None if unavailable
+"""
+
+import os
+
+import genome_io
+
+
+class ModelRegistry:
+    def __init__(self):
+        # name -> [path() callable, loader(path), (path, mtime) loaded, model]
+        self._entries = {}
+
+    def register(self, name, path, loader):
+        """
+        `path()` returns the file backing the model (or None when there is
+        none); `loader(path)` builds the model from it.  A loader that
+        returns None or raises leaves the model unavailable until the file
+        changes.
+        """
+        self._entries[name] = [path, loader, None, None]
+
+    def get(self, name):
+        """The model for `name`, reloaded if its file changed since the last load."""
+        entry = self._entries[name]
+        path_fn, loader, loaded, model = entry
+        path = path_fn()
+        try:
+            stamp = (path, os.stat(path).st_mtime_ns) if path else None
+        except OSError:
+            stamp = None
+        if stamp != loaded:
+            model = None
+            if stamp:
+                # A corrupt or mismatched file leaves the algorithm without planes
+                try:
+                    model = loader(path)
+                except Exception as e:
+                    print(f'[MODELS] Could not load {name} model {path}: {e}')
+            entry[2], entry[3] = stamp, model
+        return model
+
+    def clear(self):
+        """Forget every loaded model (they are reloaded on the next get())."""
+        for entry in self._entries.values():
+            entry[2] = entry[3] = None
+
+
+def _load_champion(path):
+    return genome_io.load_brain(path)
+
+
+def _bc_file():
+    from behavioral_cloning import BCTrainer
+    return BCTrainer.MODEL_FILE
+
+
+def _load_bc(path):
+    from behavioral_cloning import BCTrainer
+    return BCTrainer.load_model()
+
+
+def _dqn_file():
+    from dqn_agent import DQNAgent
+    return DQNAgent.MODEL_FILE
+
+
+def _load_dqn(path):
+    from dqn_agent import DQNAgent
+    return DQNAgent.load_model()
+
+
+registry = ModelRegistry()
+registry.register('neat', genome_io.champion_path, _load_champion)
+registry.register('bc', _bc_file, _load_bc)
+registry.register('dqn', _dqn_file, _load_dqn)
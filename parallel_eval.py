@@ -0,0 +1,106 @@
+"""
+FlightX Parallel Evaluator
+===========================
+Scores a NEAT generation on every core.  The population is split into
+shards, each shard is flown by a headless BatchSimulator in a worker
+process, and the lifespans / scores come back to the main process, where
+`Population.natural_selection()` breeds the next generation as usual.
+
+All shards of a generation share one course seed, so every genome faces
+the same pipes no matter which worker evaluated it.
+
+Usage:
+    with ParallelEvaluator(workers=8) as evaluator:
+        results = evaluator.evaluate(population.players, population.generation)
+"""
+
+import multiprocessing
+import os
+import random
+
+import numpy as np
+
+import config
+
+
+# ---- worker side ----
+def _init_worker(win_width, win_height, jump_scale):
+    # Headless: the worker never opens a window
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    config.win_width, config.win_height = win_width, win_height
+    config.jump_scale = jump_scale
+    config.reset_ground()
+
+
+def _run_shard(job):
+    import batch_sim
+    import brain
+    import course
+    import world
+
+    seed, shard, generation, weights, max_ticks, exact = job
+    sim = batch_sim.BatchSimulator(world.World(course.Course(seed)), seed=(seed, shard))
+    sim.reset(len(weights[0]))
+    sim.simulate(brain.BrainBatch.from_weights(weights), generation, max_ticks, exact)
+    return sim.lifespan, sim.score, sim.alive, sim.vision, sim.world.score
+
+
+# ---- main process side ----
+class ParallelEvaluator:
+    """
+    A pool of headless simulators.  `evaluate()` flies one generation and
+    writes lifespan, score and final vision back into the players, so
+    `calculate_fitness()` works exactly as after an on-screen generation.
+    """
+
+    def __init__(self, workers=None, max_ticks=20000, exact=True):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_ticks = max_ticks
+        self.exact = exact
+        self.pool = multiprocessing.Pool(
+            self.workers, initializer=_init_worker,
+            initargs=(config.win_width, config.win_height, config.jump_scale))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def evaluate(self, players, generation=1, seed=None):
+        """
+        Fly `players` on the course `seed` (a fresh random course when None).
+        Returns a dict of per-genome 'fitness', 'lifespan' and 'score' arrays
+        plus 'world_score', the best course score any shard reached.
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+
+        weights = [np.stack(layer) for layer in zip(*(p.brain.compile() for p in players))]
+        bounds = np.linspace(0, len(players), min(self.workers, len(players)) + 1).astype(int)
+        jobs = [(seed, shard, generation, [w[lo:hi] for w in weights], self.max_ticks, self.exact)
+                for shard, (lo, hi) in enumerate(zip(bounds, bounds[1:]))]
+
+        lifespan, score, alive, vision, world_scores = zip(*self.pool.map(_run_shard, jobs))
+        lifespan = np.concatenate(lifespan)
+        score = np.concatenate(score)
+        alive = np.concatenate(alive)
+        vision = np.concatenate(vision)
+
+        fitness = np.zeros(len(players))
+        for i, p in enumerate(players):
+            p.lifespan = int(lifespan[i])
+            p.score = int(score[i])
+            p.alive = bool(alive[i])
+            p.vision = [float(v) for v in vision[i]]
+            p.calculate_fitness()
+            fitness[i] = p.fitness
+
+        return {'fitness': fitness, 'lifespan': lifespan, 'score': score,
+                'world_score': max(world_scores)}
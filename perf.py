@@ -0,0 +1,195 @@
+"""
+FlightX Performance Instrumentation
+===================================
+Opt-in timers for where a generation's time goes.  Nothing is recorded
+until enable() is called; until then phase() hands back a shared no-op
+context and every other call returns immediately.
+
+Phases are timed where they run:
+    tick, pipes, look, think, update, obstacles   World.step / BatchSimulator.step
+    draw                                          the pygame render (main.py)
+    speciate, fitness, cull, sort, reproduce      Population.natural_selection
+
+end_generation() closes a record with the phase totals, ticks/sec, the
+average number of planes alive per tick and the allocations made during
+the generation (net new Python memory blocks and garbage collections).
+Records are kept in `recorder.records`, shown by the game's HUD overlay
+and, with a log path, appended to a JSON-lines file.
+
+Any phase can be run under cProfile for one generation:
+    perf.enable('perf_log.jsonl', profile='reproduce@5')
+writes the profile of generation 5's reproduce phase to
+perf-reproduce-gen5.prof (open it with pstats or snakeviz).
+
+Usage:
+    perf.enable('perf_log.jsonl')
+    with perf.phase('look'):
+        ...
+    perf.end_generation(generation)
+"""
+
+import contextlib
+import cProfile
+import gc
+import json
+import sys
+import time
+
+
+recorder = None
+_NOTHING = contextlib.nullcontext()
+
+
+def _collections():
+    return sum(s['collections'] for s in gc.get_stats())
+
+
+class _Timer:
+    """
+    Adds the time spent inside a `with` block to one phase of the
+    generation in progress when the block ends (the draw phase runs on the
+    UI thread and can straddle the simulation's end_generation()).
+    """
+
+    __slots__ = ('recorder', 'name', 'profiler', 'start')
+
+    def __init__(self, recorder, name, profiler=None):
+        self.recorder = recorder
+        self.name = name
+        self.profiler = profiler
+
+    def __enter__(self):
+        if self.profiler is not None:
+            self.profiler.enable()
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        if self.profiler is not None:
+            self.profiler.disable()
+        totals = self.recorder.totals
+        seconds, calls = totals.get(self.name, (0.0, 0))
+        totals[self.name] = (seconds + elapsed, calls + 1)
+
+
+class Recorder:
+    """
+    Phase totals for the generation in progress plus the finished records.
+
+    `profile` is 'phase@generation'; that phase is profiled for that
+    generation and the stats dumped to perf-<phase>-gen<generation>.prof.
+    """
+
+    # Finished records kept in memory (the log file keeps them all)
+    HISTORY = 100
+
+    def __init__(self, log_path=None, profile=None):
+        self.log_path = log_path
+        self.profile_phase = self.profile_generation = None
+        if profile:
+            phase, _, generation = profile.partition('@')
+            self.profile_phase, self.profile_generation = phase, int(generation or 1)
+        self.profiler = None
+        self.records = []
+        self.generation = 1
+        self._start_generation()
+
+    def _start_generation(self):
+        self.totals = {}
+        self.ticks = 0
+        self.alive = 0
+        self.started = time.perf_counter()
+        self.blocks = sys.getallocatedblocks()
+        self.collections = _collections()
+
+    def phase(self, name):
+        profiler = None
+        if name == self.profile_phase and self.generation == self.profile_generation:
+            if self.profiler is None:
+                self.profiler = cProfile.Profile()
+            profiler = self.profiler
+        return _Timer(self, name, profiler)
+
+    def tick(self, alive):
+        self.ticks += 1
+        self.alive += alive
+
+    def end_generation(self, generation, **extra):
+        wall = time.perf_counter() - self.started
+        record = {
+            'generation': generation,
+            'wall_s': round(wall, 4),
+            'ticks': self.ticks,
+            'ticks_per_sec': round(self.ticks / wall, 1) if wall > 0 else 0,
+            'alive_avg': round(self.alive / self.ticks, 2) if self.ticks else 0,
+            # A copy: the UI thread may add its draw phase meanwhile
+            'phases_ms': {name: {'total': round(seconds * 1000, 3), 'calls': calls}
+                          for name, (seconds, calls) in list(self.totals.items())},
+            'allocated_blocks': sys.getallocatedblocks() - self.blocks,
+            'gc_collections': _collections() - self.collections,
+        }
+        record.update(extra)
+        self.records.append(record)
+        del self.records[:-self.HISTORY]
+        if self.log_path:
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+        if self.profiler is not None:
+            path = f'perf-{self.profile_phase}-gen{self.profile_generation}.prof'
+            self.profiler.dump_stats(path)
+            print(f'[PERF] Profile of {self.profile_phase} in generation {generation} written to {path}')
+            self.profiler = None
+            self.profile_phase = None
+        self.generation = generation + 1
+        self._start_generation()
+        return record
+
+    def summary(self):
+        """
+        (phase, average ms per call) rows in PHASES order: from the last
+        finished generation, or the one in progress before there is any.
+        """
+        if self.records:
+            phases = self.records[-1]['phases_ms']
+            rows = [(name, p['total'] / p['calls']) for name, p in phases.items()]
+        else:
+            rows = [(name, seconds * 1000 / calls) for name, (seconds, calls) in list(self.totals.items())]
+        order = {name: i for i, name in enumerate(PHASES)}
+        rows.sort(key=lambda row: order.get(row[0], len(order)))
+        return rows
+
+
+PHASES = ('tick', 'pipes', 'look', 'think', 'update', 'obstacles', 'draw',
+          'speciate', 'fitness', 'cull', 'sort', 'reproduce')
+
+
+# ---- module interface (no-ops while disabled) ----
+def enable(log_path=None, profile=None):
+    """Start recording; returns the Recorder."""
+    global recorder
+    recorder = Recorder(log_path, profile)
+    return recorder
+
+
+def disable():
+    global recorder
+    recorder = None
+
+
+def phase(name):
+    """Context manager timing one phase (a shared no-op while disabled)."""
+    if recorder is None:
+        return _NOTHING
+    return recorder.phase(name)
+
+
+def tick(alive):
+    """Count one simulation tick with `alive` planes still flying."""
+    if recorder is not None:
+        recorder.tick(alive)
+
+
+def end_generation(generation, **extra):
+    """Close the generation's record (extra keyword arguments are stored with it)."""
+    if recorder is not None:
+        return recorder.end_generation(generation, **extra)
@@ -1,50 +1,53 @@
 import pygame
 import random
 import math
+import assets
 import brain
 import config
 
 
-class Player:
-    def __init__(self, is_human=False):
+class Plane:
+    """
+    A plane's body: hitbox, velocity and the flight / collision rules.
+    Holds no sprites, so the headless RL environment flies exactly the
+    physics the game does.
+    """
+
+    # Flight physics (the batch simulator reads these too)
+    GRAVITY = 0.25
+    MAX_VEL = 5
+    FLAP_IMPULSE = 3.8
+    FLAP_CEILING = -6.0
+    HUMAN_FLAP_IMPULSE = 7.5
+    HUMAN_FLAP_CEILING = -17.0
+    DROP_ACCEL = 0.9
+    DROP_MAX = 6
+
+    def __init__(self, is_human=False, pipes=None):
         self.is_human = is_human
+        # The pipes this plane flies through (a spatial.PipeTrack; the game's by default)
+        self.pipes = config.pipes if pipes is None else pipes
+        self.respawn()
+
+    def respawn(self):
+        """Put the plane back at the start, alive, with a clean flight record."""
         # Bird
         self.x, self.y = 50, 200
-        self.hk_run = pygame.transform.smoothscale(
-            pygame.image.load('Assets/plane1.png').convert_alpha(), (40, 40)
-        )
-        self.hk_air = pygame.transform.smoothscale(
-            pygame.image.load('Assets/plane1.png').convert_alpha(), (40, 40)
-        )
-
-        self.rect = self.hk_run.get_rect(topleft=(self.x, self.y)).inflate(-12, -12)
+        # 40×40 sprite, shrunk to a forgiving hitbox
+        self.rect = pygame.Rect(self.x, self.y, 40, 40).inflate(-12, -12)
 
         self.vel = 0
         self.alive = True
         self.on_ground = False
         self.lifespan = 0
         self.vision = [0, 0, 0, 0]
-        self.fitness = 0
         self.score = 0
-        self.inputs = 4
 
-        self.brain = brain.Brain(self.inputs, hidden_layers=[6])
-        self.brain.generate_net()
     # ---------------- Utility ----------------
     def clamp(self, v, lo=-1, hi=1):
         return max(lo, min(hi, v))
 
     # ---------------- Game Logic ----------------
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        
-        # Draw human player with a different color/tint or marker
-        if self.is_human:
-             # Just a simple indicator for now, maybe a circle around it
-             pygame.draw.circle(window, (50, 255, 50), self.rect.center, 25, 2)
-             
-        window.blit(sprite, self.rect)
-
     def ground_collision(self, ground):
         return self.rect.colliderect(ground)
 
@@ -65,8 +68,8 @@ class Player:
 
     def update(self, ground):
         if not (self.ground_collision(ground) or self.pipe_collision()):
-            self.vel += 0.25
-            self.vel = min(self.vel, 5)
+            self.vel += self.GRAVITY
+            self.vel = min(self.vel, self.MAX_VEL)
             self.rect.y += self.vel
             self.lifespan += 1
         else:
@@ -76,23 +79,19 @@ class Player:
     def bird_flap(self, generation=1):
         if not self.sky_collision():
             if self.is_human:
-                impulse = 7.5 * config.jump_scale
-                ceiling = -17.0 * config.jump_scale
+                impulse = self.HUMAN_FLAP_IMPULSE * config.jump_scale
+                ceiling = self.HUMAN_FLAP_CEILING * config.jump_scale
             else:
-                impulse = 3.8 * config.jump_scale
-                ceiling = -6.0 * config.jump_scale
+                impulse = self.FLAP_IMPULSE * config.jump_scale
+                ceiling = self.FLAP_CEILING * config.jump_scale
             self.vel = max(self.vel - impulse, ceiling)
 
     def bird_drop(self):
         # Allow intentional faster descent
-        self.vel = min(self.vel + 0.9, 6)
+        self.vel = min(self.vel + self.DROP_ACCEL, self.DROP_MAX)
 
-    @staticmethod
-    def closest_pipe():
-        for p in config.pipes:
-            if not p.passed:
-                return p
-        return None
+    def closest_pipe(self):
+        return self.pipes.next
 
     # ---------------- AI ----------------
     def look(self):
@@ -108,10 +107,70 @@ class Player:
         self.vision[2] = self.clamp(p.opening / 150)                   # gap size (normalized)
         self.vision[3] = self.clamp(self.vel / 10)                    # current vertical speed
 
+
+class Player(Plane):
+    # Sprite, bound lazily from the shared asset cache (headless players never load it)
+    SPRITE = 'Assets/plane1.png'
+    SPRITE_SIZE = (40, 40)
+    TINT = None
+    # Vision lines and the human marker; the scripted and model-driven planes draw only their sprite
+    MARKERS = True
+
+    def __init__(self, is_human=False):
+        self.inputs = 4
+        self._brain = None
+        super().__init__(is_human)
+
+    def respawn(self):
+        super().respawn()
+        self.fitness = 0
+
+    @property
+    def brain(self):
+        # The random starting brain is only built if none was assigned (clone() assigns one)
+        if self._brain is None:
+            self._brain = brain.Brain(self.inputs, hidden_layers=[6])
+            self._brain.generate_net()
+        return self._brain
+
+    @brain.setter
+    def brain(self, value):
+        self._brain = value
+
+    # ---------------- Drawing ----------------
+    @property
+    def hk_run(self):
+        return assets.image(self.SPRITE, self.SPRITE_SIZE, self.TINT)
+
+    @property
+    def hk_air(self):
+        return assets.image(self.SPRITE, self.SPRITE_SIZE, self.TINT)
+
+    def draw(self, window):
+        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
+        if not self.MARKERS:
+            window.blit(sprite, self.rect)
+            return
+        
+        # Draw human player with a different color/tint or marker
+        if self.is_human:
+             # Just a simple indicator for now, maybe a circle around it
+             pygame.draw.circle(window, (50, 255, 50), self.rect.center, 25, 2)
+             
+        window.blit(sprite, self.rect)
+
         if config.show_lines:
-            pygame.draw.line(config.window, (255, 255, 255), self.rect.center, (self.rect.centerx, gap))
-            pygame.draw.line(config.window, (255, 255, 255), self.rect.center, (p.x, self.rect.centery))
+            self.draw_vision(window)
 
+    def draw_vision(self, window):
+        p = self.closest_pipe()
+        if not p:
+            return
+        gap = (p.top_rect.bottom + p.bottom_rect.top) / 2
+        pygame.draw.line(window, (255, 255, 255), self.rect.center, (self.rect.centerx, gap))
+        pygame.draw.line(window, (255, 255, 255), self.rect.center, (p.x, self.rect.centery))
+
+    # ---------------- AI ----------------
     def think(self, generation=1):
         if self.is_human:
             return
@@ -139,9 +198,9 @@ class Player:
         gap_bonus = max(0, 1.0 - abs(self.vision[0])) * 100
         self.fitness = (self.lifespan * 2) + (self.score * 1000) + gap_bonus
 
-    def clone(self):
+    def clone(self, detach=False):
         clone = Player()
-        clone.brain = self.brain.clone()
+        clone.brain = self.brain.clone(detach)
         return clone
 
     def handle_event(self, event):
@@ -154,87 +213,78 @@ class Player:
                 self.bird_drop()
 
 
-class BCPlayer(Player):
-    """AI player controlled by a trained Behavioral Cloning model."""
+class PolicyPlayer(Player):
+    """
+    AI player flown by a trained model with a predict_actions(states) method.
+    The model may be shared with other planes (see model_registry.py) and is
+    only used to predict; think_all() decides every plane sharing one model
+    with a single batched forward pass.
+    """
 
-    def __init__(self):
-        super().__init__(is_human=False)
-        self._bc_model = None
-        # Tint sprite blue for visual distinction
-        self.hk_run = self._tint_sprite(self.hk_run, (100, 150, 255))
-        self.hk_air = self._tint_sprite(self.hk_air, (100, 150, 255))
-
-    @staticmethod
-    def _tint_sprite(surface, color):
-        tinted = surface.copy()
-        tinted.fill(color, special_flags=pygame.BLEND_RGB_MULT)
-        return tinted
+    MARKERS = False
 
-    def load_model(self):
-        from behavioral_cloning import BCTrainer
-        self._bc_model = BCTrainer.load_model()
-        return self._bc_model is not None
+    def __init__(self, model=None):
+        super().__init__(is_human=False)
+        self.model = model
 
     def think(self, generation=1):
-        if self._bc_model is None:
+        if self.model is None:
             return
         self.look()
-        action = self._bc_model.predict_action(self.vision)
+        self.act(self.model.predict_actions([self.vision])[0], generation)
+
+    def act(self, action, generation=1):
         if action == 1:
             self.bird_flap(generation)
         elif action == -1:
             self.bird_drop()
 
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        window.blit(sprite, self.rect)
 
+class BCPlayer(PolicyPlayer):
+    """AI player controlled by a trained Behavioral Cloning model."""
 
-class DQNPlayer(Player):
-    """AI player controlled by a trained DQN model."""
+    TINT = (100, 150, 255)  # blue, for visual distinction
 
-    def __init__(self):
-        super().__init__(is_human=False)
-        self._dqn_model = None
-        # Tint sprite orange for visual distinction
-        self.hk_run = self._tint_sprite(self.hk_run, (255, 180, 80))
-        self.hk_air = self._tint_sprite(self.hk_air, (255, 180, 80))
+    def load_model(self):
+        from behavioral_cloning import BCTrainer
+        self.model = BCTrainer.load_model()
+        return self.model is not None
 
-    @staticmethod
-    def _tint_sprite(surface, color):
-        tinted = surface.copy()
-        tinted.fill(color, special_flags=pygame.BLEND_RGB_MULT)
-        return tinted
 
-    def load_model(self):
-        from dqn_agent import DQNAgent
-        self._dqn_model = DQNAgent.load_model()
-        return self._dqn_model is not None
+class DQNPlayer(PolicyPlayer):
+    """AI player controlled by a trained DQN model."""
 
-    def think(self, generation=1):
-        if self._dqn_model is None:
-            return
-        self.look()
-        from dqn_agent import DQNAgent
-        action = DQNAgent.predict_action(self._dqn_model, self.vision)
-        if action == 1:
-            self.bird_flap(generation)
-        elif action == -1:
-            self.bird_drop()
+    TINT = (255, 180, 80)  # orange, for visual distinction
 
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        window.blit(sprite, self.rect)
+    def load_model(self):
+        from dqn_agent import DQNAgent
+        self.model = DQNAgent.load_model()
+        return self.model is not None
+
+
+def think_all(players, generation=1):
+    """
+    think() for every player that has already looked this tick.  Planes
+    flying the same model are batched: their visions go through one forward
+    pass and each gets its action back, so a model costs one inference per
+    tick however many planes share it.
+    """
+    batches = {}
+    for p in players:
+        if isinstance(p, PolicyPlayer) and p.model is not None:
+            batches.setdefault(id(p.model), []).append(p)
+        else:
+            p.think(generation)
+    for group in batches.values():
+        actions = group[0].model.predict_actions([p.vision for p in group])
+        for p, action in zip(group, actions):
+            p.act(action, generation)
 
 
 class HeuristicPlayer(Player):
     """Mathematical AI that plays perfectly by targeting gap center."""
-    def __init__(self):
-        super().__init__(is_human=False)
-        self.hk_run = self.hk_run.copy()
-        self.hk_run.fill((0, 255, 255), special_flags=pygame.BLEND_RGB_MULT) # Cyan
-        self.hk_air = self.hk_air.copy()
-        self.hk_air.fill((0, 255, 255), special_flags=pygame.BLEND_RGB_MULT)
+    TINT = (0, 255, 255)  # Cyan
+    MARKERS = False
 
     def think(self, generation=1):
         p = self.closest_pipe()
@@ -248,19 +298,11 @@ class HeuristicPlayer(Player):
         if self.rect.centery > gap_y + 15 and self.vel >= -2:
             self.bird_flap(generation)
 
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        window.blit(sprite, self.rect)
-
 
 class CautiousPlayer(Player):
     """Mathematical AI that prefers gliding low beneath the upper pipe."""
-    def __init__(self):
-        super().__init__(is_human=False)
-        self.hk_run = self.hk_run.copy()
-        self.hk_run.fill((255, 50, 255), special_flags=pygame.BLEND_RGB_MULT) # Magenta
-        self.hk_air = self.hk_air.copy()
-        self.hk_air.fill((255, 50, 255), special_flags=pygame.BLEND_RGB_MULT)
+    TINT = (255, 50, 255)  # Magenta
+    MARKERS = False
 
     def think(self, generation=1):
         p = self.closest_pipe()
@@ -274,19 +316,11 @@ class CautiousPlayer(Player):
         if self.rect.centery > safe_y and self.vel >= -2:
             self.bird_flap(generation)
 
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        window.blit(sprite, self.rect)
-
 
 class AggressivePlayer(Player):
     """Mathematical AI that hugs the top pipe."""
-    def __init__(self):
-        super().__init__(is_human=False)
-        self.hk_run = self.hk_run.copy()
-        self.hk_run.fill((255, 255, 50), special_flags=pygame.BLEND_RGB_MULT) # Yellow
-        self.hk_air = self.hk_air.copy()
-        self.hk_air.fill((255, 255, 50), special_flags=pygame.BLEND_RGB_MULT)
+    TINT = (255, 255, 50)  # Yellow
+    MARKERS = False
 
     def think(self, generation=1):
         p = self.closest_pipe()
@@ -300,37 +334,21 @@ class AggressivePlayer(Player):
         if self.rect.centery > safe_y and self.vel >= -2:
             self.bird_flap(generation)
 
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        window.blit(sprite, self.rect)
-
 
 class RandomPlayer(Player):
     """Flaps randomly."""
-    def __init__(self):
-        super().__init__(is_human=False)
-        self.hk_run = self.hk_run.copy()
-        self.hk_run.fill((200, 200, 200), special_flags=pygame.BLEND_RGB_MULT)
-        self.hk_air = self.hk_air.copy()
-        self.hk_air.fill((200, 200, 200), special_flags=pygame.BLEND_RGB_MULT)
+    TINT = (200, 200, 200)
+    MARKERS = False
 
     def think(self, generation=1):
         if random.random() < 0.05:
             self.bird_flap(generation)
 
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        window.blit(sprite, self.rect)
-
 
 class LazyPlayer(Player):
     """Waits until the last moment to flap."""
-    def __init__(self):
-        super().__init__(is_human=False)
-        self.hk_run = self.hk_run.copy()
-        self.hk_run.fill((100, 255, 100), special_flags=pygame.BLEND_RGB_MULT)
-        self.hk_air = self.hk_air.copy()
-        self.hk_air.fill((100, 255, 100), special_flags=pygame.BLEND_RGB_MULT)
+    TINT = (100, 255, 100)
+    MARKERS = False
 
     def think(self, generation=1):
         p = self.closest_pipe()
@@ -344,19 +362,11 @@ class LazyPlayer(Player):
         if self.rect.centery > safe_y and self.vel >= 3:
             self.bird_flap(generation)
 
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        window.blit(sprite, self.rect)
-
 
 class PanickyPlayer(Player):
     """Overcorrects frequently."""
-    def __init__(self):
-        super().__init__(is_human=False)
-        self.hk_run = self.hk_run.copy()
-        self.hk_run.fill((255, 100, 100), special_flags=pygame.BLEND_RGB_MULT)
-        self.hk_air = self.hk_air.copy()
-        self.hk_air.fill((255, 100, 100), special_flags=pygame.BLEND_RGB_MULT)
+    TINT = (255, 100, 100)
+    MARKERS = False
 
     def think(self, generation=1):
         p = self.closest_pipe()
@@ -369,19 +379,11 @@ class PanickyPlayer(Player):
         if self.rect.centery > safe_y and random.random() < 0.6:
             self.bird_flap(generation)
 
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        window.blit(sprite, self.rect)
-
 
 class CenterPlayer(Player):
     """Maintains center of screen until pipe is close."""
-    def __init__(self):
-        super().__init__(is_human=False)
-        self.hk_run = self.hk_run.copy()
-        self.hk_run.fill((255, 255, 255), special_flags=pygame.BLEND_RGB_MULT)
-        self.hk_air = self.hk_air.copy()
-        self.hk_air.fill((255, 255, 255), special_flags=pygame.BLEND_RGB_MULT)
+    TINT = (255, 255, 255)
+    MARKERS = False
 
     def think(self, generation=1):
         p = self.closest_pipe()
@@ -393,19 +395,11 @@ class CenterPlayer(Player):
             if self.rect.centery > config.win_height * 0.5 and self.vel >= 0:
                 self.bird_flap(generation)
 
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        window.blit(sprite, self.rect)
-
 
 class HighFlyerPlayer(Player):
     """Stays high and dives in."""
-    def __init__(self):
-        super().__init__(is_human=False)
-        self.hk_run = self.hk_run.copy()
-        self.hk_run.fill((255, 192, 203), special_flags=pygame.BLEND_RGB_MULT) # Pink
-        self.hk_air = self.hk_air.copy()
-        self.hk_air.fill((255, 192, 203), special_flags=pygame.BLEND_RGB_MULT)
+    TINT = (255, 192, 203)  # Pink
+    MARKERS = False
 
     def think(self, generation=1):
         p = self.closest_pipe()
@@ -421,7 +415,3 @@ class HighFlyerPlayer(Player):
         else:
             if self.rect.centery > config.win_height * 0.2 and self.vel >= 0:
                 self.bird_flap(generation)
-
-    def draw(self, window):
-        sprite = self.hk_air if self.vel < -0.1 else self.hk_run
-        window.blit(sprite, self.rect)
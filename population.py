@@ -2,15 +2,38 @@ import config
 import player
 import math
 import species
+import genome_io
 import operator
-import pickle
+import perf
+import time
+import world
+import brain
+
+import numpy as np
 
 class Population:
-    def __init__(self, size):
+    # Threshold auto-tuning: scale by this factor per generation toward target_species
+    THRESHOLD_STEP = 1.1
+    # speciate(): free players whose founders are picked in one go, and
+    # (players × species) distances computed per _claim() step
+    FOUND_BLOCK = 256
+    CLAIM_CELLS = 1 << 18
+
+    def __init__(self, size, target_species=None):
         self.players = []
         self.generation = 1
         self.species = []
         self.size = size
+        # Compatibility threshold for new species; tuned each generation
+        # toward `target_species` species when that is set
+        self.threshold = species.Species.THRESHOLD
+        self.target_species = target_species
+        # Seconds spent in each natural_selection() phase, last generation
+        self.timings = {}
+        # Two (size, genome length) buffers, alternated each generation:
+        # the children's weights are read-only views into one of them while
+        # the next generation is bred into the other.
+        self._genome_buffers = [None, None]
         for i in range(0, self.size):
             self.players.append(player.Player())
 
@@ -19,32 +42,133 @@ class Population:
             if p.alive:
                 p.look()
                 p.think(self.generation)
-                p.draw(config.window)
                 p.update(config.ground)
 
-    def natural_selection(self):
-        print('SPECIATE')
-        self.speciate()
+    def run_generation(self, sim_world=None, max_ticks=None, vectorized=False, evaluator=None):
+        """
+        Play one generation without rendering until every plane has crashed
+        (or `max_ticks` have elapsed), then evolve the next generation.
+        With `vectorized=True` the planes are stepped together as NumPy
+        arrays by a BatchSimulator; with a parallel_eval.ParallelEvaluator
+        they are sharded across its worker processes.  Returns the score the
+        generation reached.
+        """
+        if sim_world is None:
+            sim_world = world.World()
+        sim_world.reset()
+
+        if evaluator is not None:
+            results = evaluator.evaluate(self.players, self.generation)
+            sim_world.add_score(results['world_score'])
+        elif vectorized:
+            import batch_sim
+            batch_sim.BatchSimulator(sim_world).run(self.players, self.generation, max_ticks)
+        else:
+            ticks = 0
+            while not self.extinct():
+                sim_world.step(self.players, self.generation)
+                ticks += 1
+                if max_ticks is not None and ticks >= max_ticks:
+                    break
 
-        print('CALCULATE FITNESS')
-        self.calculate_fitness()
+        score = sim_world.score
+        sim_world.reset()
+        self.natural_selection()
+        return score
 
-        print('KILL EXTINCT')
+    def natural_selection(self):
+        phases = (
+            ('speciate', self.speciate),
+            ('fitness', self.calculate_fitness),
+            ('cull', self.cull_species),
+            ('sort', self.sort_species_by_fitness),
+            ('reproduce', self.next_gen),
+        )
+        generation = self.generation
+        self.timings = {}
+        for name, phase in phases:
+            start = time.perf_counter()
+            with perf.phase(name):
+                phase()
+            self.timings[name] = time.perf_counter() - start
+        perf.end_generation(generation, species=len(self.species), players=len(self.players))
+
+    def cull_species(self):
         self.kill_extinct_species()
-
-        print('KILL STALE')
         self.kill_stale_species()
 
-        print('SORT BY FITNESS')
-        self.sort_species_by_fitness()
-
-        print('CHILDREN FOR NEXT GEN')
-        self.next_gen()
-
     def speciate(self):
+        """
+        Put every player in the first species whose benchmark is within the
+        threshold, founding a new species otherwise.  Distances to each
+        benchmark are computed for the whole population at once.
+        """
         for s in self.species:
             s.players = []
 
+        genomes = [p.brain.genome() for p in self.players]
+        if len({len(g) for g in genomes}) > 1:
+            self.speciate_pairwise()
+        elif genomes:
+            genomes = np.stack(genomes)
+            owner = np.full(len(genomes), -1)
+            self._claim(owner, genomes, 0, self.species, np.arange(len(genomes)))
+
+            # Unclaimed players found new species, in player order.  Founders
+            # are picked a block of free players at a time from the block's
+            # own distance matrix; the block's new species then claim the
+            # free players after it.
+            while True:
+                free = np.flatnonzero(owner < 0)
+                if not len(free):
+                    break
+                block = free[:self.FOUND_BLOCK]
+                close = species.genome_distance_matrix(genomes[block], genomes[block]) < self.threshold
+                first_new = len(self.species)
+                unowned = np.ones(len(block), dtype=bool)
+                for a in range(len(block)):
+                    if unowned[a]:
+                        self.species.append(species.Species(self.players[block[a]], self.threshold))
+                        claimed = unowned & close[a]
+                        claimed[a] = True
+                        owner[block[claimed]] = len(self.species) - 1
+                        unowned &= ~claimed
+                self._claim(owner, genomes, first_new, self.species[first_new:], free[len(block):])
+
+            for s in self.species:
+                s.players = []
+            for p, j in zip(self.players, owner.tolist()):
+                self.species[j].add_to_species(p)
+
+        if self.target_species:
+            self.tune_threshold()
+
+    @classmethod
+    def _claim(cls, owner, genomes, first, group, candidates):
+        """
+        Give every unowned player among `candidates` the first species of
+        `group` (numbered from `first`) whose threshold it is within.
+        """
+        k = genomes.shape[1]
+        start = 0
+        while start < len(group):
+            free = candidates[owner[candidates] < 0]
+            if not len(free):
+                return
+            part = group[start:start + max(1, cls.CLAIM_CELLS // len(free))]
+            if all(len(s.benchmark_genome) == k for s in part):
+                benchmarks = np.stack([s.benchmark_genome for s in part])
+                thresholds = np.array([s.threshold for s in part])
+                close = species.genome_distance_matrix(genomes[free], benchmarks) < thresholds
+            else:
+                close = np.column_stack([species.genome_distances(genomes[free], s.benchmark_genome)
+                                         < s.threshold for s in part])
+            hit = close.any(axis=1)
+            owner[free[hit]] = first + start + close.argmax(axis=1)[hit]
+            start += len(part)
+
+    def speciate_pairwise(self):
+        # One player at a time (brains with different connection counts)
         for p in self.players:
             add_to_species = False
             for s in self.species:
@@ -53,7 +177,20 @@ class Population:
                     add_to_species = True
                     break
             if not add_to_species:
-                self.species.append(species.Species(p))
+                self.species.append(species.Species(p, self.threshold))
+
+    def tune_threshold(self):
+        """Loosen the threshold when there are too many species, tighten it when too few."""
+        count = sum(1 for s in self.species if s.players)
+        step = self.THRESHOLD_STEP
+        if count > 2 * self.target_species or 2 * count < self.target_species:
+            step **= 2  # far off target: move faster
+        if count > self.target_species:
+            self.threshold *= step
+        elif count < self.target_species:
+            self.threshold /= step
+        for s in self.species:
+            s.threshold = self.threshold
 
     def calculate_fitness(self):
         for p in self.players:
@@ -62,12 +199,7 @@ class Population:
             s.calculate_average_fitness()
 
     def kill_extinct_species(self):
-        species_bin = []
-        for s in self.species:
-            if len(s.players) == 0:
-                species_bin.append(s)
-        for s in species_bin:
-            self.species.remove(s)
+        self.species = [s for s in self.species if s.players]
 
     def kill_stale_species(self):
         player_bin = []
@@ -80,10 +212,11 @@ class Population:
                         player_bin.append(p)
                 else:
                     s.staleness = 0
-        for p in player_bin:
-            self.players.remove(p)
-        for s in species_bin:
-            self.species.remove(s)
+        if species_bin:
+            player_bin = set(player_bin)
+            species_bin = set(species_bin)
+            self.players = [p for p in self.players if p not in player_bin]
+            self.species = [s for s in self.species if s not in species_bin]
 
     def sort_species_by_fitness(self):
         for s in self.species:
@@ -92,6 +225,59 @@ class Population:
         self.species.sort(key=operator.attrgetter('benchmark_fitness'), reverse=True)
 
     def next_gen(self):
+        """
+        Replace the players with the next generation: every species'
+        champion, children_per_species mutated offspring per species, and
+        the remaining slots filled from the best species.
+
+        When all brains share one layout the child genomes are bred into a
+        preallocated buffer and loaded into the existing Player objects;
+        otherwise each child is a full clone.  Both paths draw the same
+        random numbers in the same order.
+        """
+        k = len(self.species[0].champion.brain.genome())
+        same_layout = all(len(s.champion.brain.genome()) == k
+                          and all(len(p.brain.genome()) == k for p in s.players)
+                          for s in self.species)
+        if not same_layout:
+            self.next_gen_cloned()
+            return
+
+        slot = self.generation % 2
+        genomes = self._genome_buffers[slot]
+        if genomes is None or genomes.shape != (self.size, k):
+            genomes = self._genome_buffers[slot] = np.empty((self.size, k))
+
+        # Champions first, unchanged
+        row = 0
+        for s in self.species:
+            genomes[row] = s.champion.brain.genome()
+            row += 1
+
+        # Fill open player slots with children
+        children_per_species = math.floor((self.size - len(self.species)) / len(self.species))
+        for s in self.species:
+            for i in range(0, children_per_species):
+                genomes[row] = brain.mutated_genome(s.pick_parent().brain.genome().tolist())
+                row += 1
+
+        while row < self.size:
+            genomes[row] = brain.mutated_genome(self.species[0].pick_parent().brain.genome().tolist())
+            row += 1
+
+        template = self.species[0].champion.brain
+        while len(self.players) < self.size:
+            p = player.Player()
+            p.brain = brain.Brain(template.inputs, template.hidden_layers, True)
+            self.players.append(p)
+        del self.players[self.size:]
+
+        for p, genome in zip(self.players, genomes):
+            p.respawn()
+            p.brain.load_genome(genome)
+        self.generation += 1
+
+    def next_gen_cloned(self):
         children = []
 
         # Clone of champion is added to each species
@@ -120,7 +306,7 @@ class Population:
                 extinct = False
         return extinct
 
-    def save_champion(self, filename='champion.pkl'):
+    def save_champion(self, filename=genome_io.CHAMPION_FILE):
         # Find global best player
         if not self.species:
             return False
@@ -129,32 +315,39 @@ class Population:
         champion = best_species.champion
         
         try:
-            with open(filename, 'wb') as f:
-                pickle.dump(champion.brain, f)
+            genome_io.save_brains(filename, [champion.brain])
             print(f"Saved champion brain to {filename}")
             return True
         except Exception as e:
             print(f"Error saving champion: {e}")
             return False
 
-    def load_champion(self, filename='champion.pkl'):
+    def load_champion(self, filename=None, elite=None):
+        """
+        Restart from generation 1 with mutated copies of the saved champion,
+        or of the brains in `elite` (e.g. HallOfFame.elite()) taken in turn.
+        """
         try:
-            with open(filename, 'rb') as f:
-                brain = pickle.load(f)
-                
+            if elite:
+                parents, source = list(elite), f'{len(elite)} hall-of-fame champions'
+            else:
+                # Default: champion.fxg, or a legacy champion.pkl
+                filename = filename or genome_io.champion_path() or genome_io.CHAMPION_FILE
+                parents, source = [genome_io.load_brain(filename)], filename
+
             # clear current population
             self.players = []
             self.species = []
             
-            # Create a population based on this brain
-            for _ in range(self.size):
+            # Create a population based on these brains
+            for i in range(self.size):
                 p = player.Player()
-                p.brain = brain.clone()
+                p.brain = parents[i % len(parents)].clone()
                 p.brain.mutate() # Small mutation to create diversity
                 self.players.append(p)
                 
             self.generation = 1
-            print(f"Loaded champion from {filename}")
+            print(f"Loaded champion from {source}")
             return True
         except Exception as e:
             print(f"Error loading champion: {e}")
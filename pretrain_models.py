@@ -85,8 +85,8 @@ def train_bc_model(data):
 
 
 # ─── Train DQN model ────────────────────────────────────────────────────
-def train_dqn_model():
-    """Train DQN agent headlessly."""
+def train_dqn_model(prioritized=False):
+    """Train DQN agent headlessly (prioritized=True samples replay by TD error)."""
     from dqn_agent import DQNAgent
 
     agent = DQNAgent(
@@ -98,6 +98,7 @@ def train_dqn_model():
         batch_size=64,
         target_update=500,
         buffer_capacity=50000,
+        prioritized=prioritized,
     )
 
     def progress(ep, total, reward, score, eps):
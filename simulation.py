@@ -0,0 +1,166 @@
+"""
+FlightX Simulation Thread
+=========================
+Runs a game mode's simulation on a worker thread so the pygame loop only
+handles events and draws.
+
+The worker calls the mode's tick function at the speed-slider rate (or
+flat out in turbo mode) and, once the renderer has taken the previous
+frame, publishes a Snapshot: detached copies of the obstacles and live
+planes plus the HUD numbers.  The renderer always draws the newest
+complete snapshot, so a slow natural_selection() never stutters the UI
+and the 60 fps display cap never throttles the simulation.
+
+The worker holds `lock` while it ticks; anything else that touches
+simulation state (event handlers, restarts) must hold it too.
+
+Usage:
+    sim = SimulationThread(tick, lambda: Snapshot(world, players), ui_state).start()
+    ...
+    snap = sim.latest()         # newest Snapshot, or None before the first one
+    sim.stop()
+"""
+
+import copy
+import threading
+import time
+
+import pygame
+
+import spatial
+
+
+lock = threading.RLock()
+
+
+def _detach(obj, **overrides):
+    """Shallow copy of `obj` with its own Rects, so later ticks cannot move it."""
+    clone = copy.copy(obj)
+    for name, value in vars(obj).items():
+        if isinstance(value, pygame.Rect):
+            setattr(clone, name, value.copy())
+        elif isinstance(value, list):
+            setattr(clone, name, [v.copy() if isinstance(v, pygame.Rect) else v for v in value])
+    for name, value in overrides.items():
+        setattr(clone, name, value)
+    return clone
+
+
+class Snapshot:
+    """
+    One frame of a World and its live players, safe to draw while the
+    simulation moves on.  Keyword arguments are kept in `info` for the HUD.
+    """
+
+    def __init__(self, world, players, **info):
+        self.pipes = spatial.PipeTrack(_detach(p) for p in world.pipes)
+        self.wind_zones = [_detach(wz) for wz in world.wind_zones]
+        self.coins = [_detach(c) for c in world.coins]
+        self.flying_blocks = [_detach(fb) for fb in world.flying_blocks]
+        self.falling_obstacles = [_detach(fo) for fo in world.falling_obstacles]
+        # Players look at the snapshot's pipes when drawing their vision lines
+        self.players = [_detach(p, pipes=self.pipes) for p in players if p.alive]
+        self.score = world.score
+        self.high_score = world.high_score
+        self.info = info
+
+    def draw(self, window):
+        for group in (self.pipes, self.wind_zones, self.coins,
+                      self.flying_blocks, self.falling_obstacles, self.players):
+            for ob in group:
+                ob.draw(window)
+
+
+class SimulationThread:
+    """
+    Ticks `tick()` on a daemon thread and publishes `snapshot()` results.
+
+    `settings` is read every frame for 'is_paused', 'simulation_speed'
+    (ticks per 1/60 s) and 'turbo' (as many ticks as the worker can run;
+    ignored unless `allow_turbo`).
+    """
+
+    FRAME = 1 / 60
+    # In turbo, the worker lets go of `lock` after this many seconds of ticks
+    TURBO_BATCH = 0.012
+
+    def __init__(self, tick, snapshot, settings, allow_turbo=True, name='simulation'):
+        self.tick = tick
+        self.snapshot = snapshot
+        self.settings = settings
+        self.allow_turbo = allow_turbo
+        self.name = name
+        self.ticks_per_sec = 0
+        self.error = None
+        self._front = None      # last published snapshot (renderer side)
+        self._wanted = True     # renderer has taken _front; build the next one
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        with lock:
+            self._front = self.snapshot()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def latest(self):
+        """Newest published snapshot; re-raises a crash from the worker."""
+        if self.error is not None:
+            raise self.error
+        self._wanted = True
+        return self._front
+
+    # ---- worker ----
+    def _run(self):
+        next_frame = time.perf_counter()
+        window_start, window_ticks = next_frame, 0
+        try:
+            while self._running:
+                settings = self.settings
+                turbo = settings['turbo'] and self.allow_turbo and not settings['is_paused']
+                ticks = 0
+                with lock:
+                    if turbo:
+                        deadline = time.perf_counter() + self.TURBO_BATCH
+                        while True:
+                            self.tick()
+                            ticks += 1
+                            if time.perf_counter() >= deadline:
+                                break
+                    elif not settings['is_paused']:
+                        ticks = max(1, int(round(settings['simulation_speed'])))
+                        for _ in range(ticks):
+                            self.tick()
+                    if self._wanted:
+                        # Build the back buffer, then swap it in whole
+                        back = self.snapshot()
+                        self._front, self._wanted = back, False
+
+                # Ticks/second, averaged over half a second
+                now = time.perf_counter()
+                window_ticks += ticks
+                if now - window_start >= 0.5:
+                    self.ticks_per_sec = int(window_ticks / (now - window_start))
+                    window_start, window_ticks = now, 0
+
+                if turbo:
+                    # Short nap so the UI thread can take the lock between batches
+                    time.sleep(0.001)
+                    next_frame = now
+                else:
+                    next_frame += self.FRAME
+                    delay = next_frame - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        next_frame = time.perf_counter()
+        except Exception as e:
+            self.error = e
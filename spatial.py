@@ -0,0 +1,105 @@
+"""
+FlightX Spatial Index
+=====================
+Lookup structures that keep per-tick collision work proportional to what
+is actually near the planes instead of population × obstacles.
+
+PipeTrack   the on-screen pipes, sorted by x (they spawn at the right edge
+            and all scroll left together), with `next` pointing at the
+            first pipe not yet passed.
+ObstacleGrid  x-buckets over the wind zones, coins, flying blocks and
+            falling obstacles, rebuilt once per tick.  Every plane flies
+            near x = 50, so a query usually touches one or two buckets.
+"""
+
+import collections
+
+
+class PipeTrack(collections.deque):
+    """
+    Pipes in spawn order (= sorted by x).
+
+    `next` is the closest pipe still ahead of the planes (None when there
+    is none).  `passed` flips front to back, so it only ever moves forward:
+    append() fills it when the track was exhausted, and World.update_pipes()
+    calls advance() on the tick a pipe is passed.  Every look, think and
+    collision check reads the attribute instead of walking the track.
+    """
+
+    def __init__(self, pipes=()):
+        super().__init__(pipes)
+        self._cursor = 0
+        self.next = None
+        self.advance()
+
+    def append(self, pipe):
+        super().append(pipe)
+        if self.next is None:
+            self.advance()
+
+    def clear(self):
+        super().clear()
+        self._cursor = 0
+        self.next = None
+
+    def popleft(self):
+        pipe = super().popleft()
+        self._cursor = max(0, self._cursor - 1)
+        return pipe
+
+    def drop_off_screen(self):
+        """Remove the pipes that scrolled off the left edge."""
+        while self and self[0].off_screen:
+            self.popleft()
+
+    def advance(self):
+        """Move `next` past the pipes that have been passed."""
+        cursor = self._cursor
+        try:
+            pipe = self[cursor]
+            while pipe.passed:
+                cursor += 1
+                pipe = self[cursor]
+        except IndexError:
+            pipe = None
+        self._cursor = cursor
+        self.next = pipe
+
+
+class ObstacleGrid:
+    """
+    One tick's non-pipe obstacles, bucketed by the x-span they cover.
+
+    `query(left, right)` returns, for every group given to the constructor,
+    the obstacles whose span overlaps [left, right) — in their original
+    order, so callers apply effects exactly as a full scan would.
+    """
+
+    BUCKET = 64
+
+    def __init__(self, groups):
+        self.groups = len(groups)
+        self.buckets = collections.defaultdict(list)
+        order = 0
+        for g, group in enumerate(groups):
+            for ob in group:
+                left, right = ob.x_span()
+                for b in range(left // self.BUCKET, (right - 1) // self.BUCKET + 1):
+                    self.buckets[b].append((order, g, ob))
+                order += 1
+        self._cache = {}
+
+    def query(self, left, right):
+        key = (left, right)
+        found = self._cache.get(key)
+        if found is None:
+            hits = {}
+            for b in range(left // self.BUCKET, (right - 1) // self.BUCKET + 1):
+                for entry in self.buckets.get(b, ()):
+                    hits[entry[0]] = entry
+            found = tuple([] for _ in range(self.groups))
+            for order in sorted(hits):
+                _, g, ob = hits[order]
+                found[g].append(ob)
+            self._cache[key] = found
+        return found
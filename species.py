@@ -1,15 +1,51 @@
 import operator
 import random
 
+import numpy as np
+
+
+def genome_distances(genomes, benchmark):
+    """
+    Species.weight_difference() of every row of `genomes` (n, k) against one
+    `benchmark` genome, as an (n,) array.  cumsum adds left to right, like
+    the scalar loop, so the results match it exactly.
+    """
+    k = min(genomes.shape[1], len(benchmark))
+    if k == 0:
+        return np.zeros(len(genomes))
+    return np.abs(genomes[:, :k] - benchmark[:k]).cumsum(axis=1)[:, -1]
+
+
+def genome_distance_matrix(genomes, benchmarks):
+    """
+    genome_distances() of every row of `genomes` (n, k) against every row
+    of `benchmarks` (m, k), as an (n, m) array.  The columns are added one
+    at a time, left to right, so every entry matches the scalar loop.
+    """
+    total = np.zeros((len(genomes), len(benchmarks)))
+    step = np.empty_like(total)
+    columns, rows = np.ascontiguousarray(genomes.T), np.ascontiguousarray(benchmarks.T)
+    for g, b in zip(columns, rows):
+        np.subtract(g[:, None], b, out=step)
+        np.abs(step, out=step)
+        total += step
+    return total
+
+
 class Species:
-    def __init__(self, player):
+    THRESHOLD = 1.2
+
+    def __init__(self, player, threshold=THRESHOLD):
         self.players = []
         self.average_fitness = 0
-        self.threshold = 1.2
+        self.threshold = threshold
         self.players.append(player)
         self.benchmark_fitness = player.fitness
-        self.benchmark_brain = player.brain.clone()
-        self.champion = player.clone()
+        self.champion_score = player.score
+        # Own copies: the players' weights live in Population's genome buffers
+        self.benchmark_brain = player.brain.clone(detach=True)
+        self.benchmark_genome = self.benchmark_brain.genome()
+        self.champion = player.clone(detach=True)
         self.staleness = 0
 
     def similarity(self, brain):
@@ -18,12 +54,10 @@ class Species:
 
     @staticmethod
     def weight_difference(brain_1, brain_2):
+        # Sum of |w1 - w2| over the connections both brains have, in order
         total_weight_difference = 0
-        for i in range(0, len(brain_1.connections)):
-            for j in range(0, len(brain_2.connections)):
-                if i == j:
-                    total_weight_difference += abs(brain_1.connections[i].weight -
-                                                   brain_2.connections[j].weight)
+        for w1, w2 in zip(brain_1.genome().tolist(), brain_2.genome().tolist()):
+            total_weight_difference += abs(w1 - w2)
         return total_weight_difference
 
     def add_to_species(self, player):
@@ -34,7 +68,8 @@ class Species:
         if self.players[0].fitness > self.benchmark_fitness:
             self.staleness = 0
             self.benchmark_fitness = self.players[0].fitness
-            self.champion = self.players[0].clone()
+            self.champion_score = self.players[0].score
+            self.champion = self.players[0].clone(detach=True)
         else:
             self.staleness += 1
 
@@ -47,8 +82,11 @@ class Species:
         else:
             self.average_fitness = 0
 
+    def pick_parent(self):
+        return self.players[random.randint(1, len(self.players)) - 1]
+
     def offspring(self):
-        baby = self.players[random.randint(1, len(self.players)) - 1].clone()
+        baby = self.pick_parent().clone()
         baby.brain.mutate()
         return baby
 
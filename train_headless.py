@@ -0,0 +1,104 @@
+"""
+Headless NEAT trainer for FlightX
+==================================
+Evolves the NEAT population without rendering anything, so training runs
+as fast as the simulation allows (and works on servers with no display).
+Save the champion and load it in the game with the L key to watch it fly.
+
+Usage:
+    python train_headless.py --generations 200 --population 100
+    python train_headless.py --vectorized --population 2000
+    python train_headless.py --workers 8 --population 1000
+    python train_headless.py --perf-log perf_log.jsonl --profile think@3
+    python train_headless.py --checkpoint-every 10 --resume
+    python train_headless.py --hall-of-fame hall_of_fame.sqlite --seed-elite 10
+"""
+
+import argparse
+import contextlib
+import time
+
+import checkpoint
+import config
+import genome_io
+import hall_of_fame
+import parallel_eval
+import perf
+import population
+import world
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Evolve FlightX NEAT planes without a display.')
+    parser.add_argument('--generations', type=int, default=100, help='number of generations to evolve')
+    parser.add_argument('--population', type=int, default=100, help='planes per generation')
+    parser.add_argument('--max-ticks', type=int, default=20000,
+                        help='cap on ticks per generation so a perfect flyer cannot run forever')
+    parser.add_argument('--vectorized', action='store_true',
+                        help='step the whole population as NumPy arrays (see batch_sim.py)')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='evaluate each generation on this many processes (0 = in this process)')
+    parser.add_argument('--target-species', type=int, default=None,
+                        help='auto-tune the compatibility threshold toward this many species')
+    parser.add_argument('--perf-log', default=None,
+                        help='append per-generation phase timings to this JSON-lines file (see perf.py)')
+    parser.add_argument('--profile', default=None, metavar='PHASE@GEN',
+                        help='run one phase under cProfile for one generation, e.g. reproduce@5')
+    parser.add_argument('--checkpoint', default=checkpoint.CHECKPOINT_FILE,
+                        help='population checkpoint file (see checkpoint.py)')
+    parser.add_argument('--checkpoint-every', type=int, default=0, metavar='N',
+                        help='checkpoint the whole population every N generations (0 = never)')
+    parser.add_argument('--resume', action='store_true',
+                        help='continue from the --checkpoint file instead of generation 1')
+    parser.add_argument('--hall-of-fame', default=None, metavar='FILE',
+                        help='archive every generation\'s species champions in this SQLite file')
+    parser.add_argument('--seed-elite', type=int, default=0, metavar='K',
+                        help='start from the K best distinct champions in --hall-of-fame')
+    parser.add_argument('--save', default=genome_io.CHAMPION_FILE, help='where to write the champion brain')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    config.reset_ground()
+    if args.perf_log or args.profile:
+        perf.enable(args.perf_log, args.profile)
+
+    sim = world.World()
+    if args.resume:
+        # After World(): the checkpoint's random state must not be spent on its first course
+        pop = checkpoint.load(args.checkpoint)
+    else:
+        pop = population.Population(args.population, target_species=args.target_species)
+    hall = hall_of_fame.HallOfFame(args.hall_of_fame) if args.hall_of_fame else None
+    if hall is not None and args.seed_elite and not args.resume:
+        pop.load_champion(elite=hall.elite(args.seed_elite))
+    saver = checkpoint.Checkpointer(args.checkpoint, args.checkpoint_every)
+
+    evaluator = None
+    if args.workers:
+        evaluator = parallel_eval.ParallelEvaluator(args.workers, max_ticks=args.max_ticks)
+
+    start = time.perf_counter()
+    with evaluator or contextlib.nullcontext():
+        for _ in range(args.generations):
+            gen = pop.generation
+            gen_start = time.perf_counter()
+            score = pop.run_generation(sim, max_ticks=args.max_ticks, vectorized=args.vectorized,
+                                       evaluator=evaluator)
+            phases = '  '.join(f'{name} {secs * 1000:.0f}ms' for name, secs in pop.timings.items())
+            print(f'[NEAT] Gen {gen}  Score={score}  Best={sim.high_score}  Species={len(pop.species)}  '
+                  f'({time.perf_counter() - gen_start:.2f}s; selection: {phases})')
+            if hall is not None:
+                hall.record_generation(pop.species, gen)
+            saver.maybe_save(pop)
+    saver.wait()
+
+    elapsed = time.perf_counter() - start
+    print(f'[NEAT] {args.generations} generations in {elapsed:.1f}s')
+    pop.save_champion(args.save)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+"""
+FlightX World
+=============
+Obstacle spawning, scrolling, scoring and collision bookkeeping shared by
+the pygame game loop and the headless trainer.  Nothing in here draws, so
+a World can be stepped without a display.
+"""
+
+import config
+import components
+import course
+import perf
+import player
+import spatial
+
+
+class World:
+    """
+    The scrolling course: pipes (kept in `config.pipes`, where players look
+    by default, unless a separate spatial.PipeTrack is given), wind zones,
+    coins, flying blocks and falling obstacles.
+
+    Obstacles come from a course.Course.  Pass one to replay the same
+    course after every reset(); by default each reset() rolls a new one.
+
+    Call `step(players)` once per simulation tick.
+    """
+
+    SPAWN_INTERVAL = 200
+
+    def __init__(self, course=None, pipes=None):
+        if config.ground is None:
+            config.reset_ground()
+        self.fixed_course = course
+        self.pipes = config.pipes if pipes is None else pipes
+        self.high_score = 0
+        self.reset()
+
+    def reset(self):
+        self.course = self.fixed_course if self.fixed_course is not None else course.Course()
+        self.pipes.clear()
+        self.wind_zones = []
+        self.coins = []
+        self.flying_blocks = []
+        self.falling_obstacles = []
+        self.obstacle_counter = 0
+        self.pipes_spawn_time = 10
+        self.score = 0
+
+    def add_score(self, points):
+        self.score += points
+        if self.score > self.high_score:
+            self.high_score = self.score
+
+    # ---- spawning ----
+    def generate_pipes(self):
+        score = self.score
+        spawn = self.obstacle_counter
+        self.obstacle_counter += 1
+        counter = self.obstacle_counter
+
+        def rng(kind):
+            return self.course.rng(spawn, kind)
+
+        # ── Pipe type selection (score-gated) ──
+        if score >= 30 and counter % 3 == 0:
+            pipe = components.MultiHolePipes(config.win_width, rng('pipe'))
+        elif counter % 4 == 0:
+            pipe = components.MovingPipes(config.win_width, rng('pipe'))
+        else:
+            pipe = components.Pipes(config.win_width, rng('pipe'))
+        self.pipes.append(pipe)
+
+        # ── Compute gap center of the pipe just spawned ──
+        gap_y = int((pipe.top_height + (components.Ground.ground_level - pipe.bottom_height)) / 2)
+
+        # ── Wind zones: after 50 pts ──
+        if score >= 50 and counter % 4 == 0:
+            self.wind_zones.append(components.WindZone(config.win_width, rng('wind')))
+
+        # ── Flying blocks: after 20 pts ──
+        if score >= 20 and counter % 3 == 0:
+            self.flying_blocks.append(components.FlyingBlock(config.win_width, rng('block')))
+
+        # ── Falling obstacles: after 15 pts ──
+        if score >= 15 and counter % 3 == 0:
+            self.falling_obstacles.append(components.FallingObstacle(config.win_width, rng('falling')))
+
+        # ── Coins: placed between pipes at gap center ──
+        if counter % 3 == 0:
+            self.coins.append(components.Coin(config.win_width, gap_y, rng('coin')))
+
+    def spawn_tick(self):
+        if self.pipes_spawn_time <= 0:
+            self.generate_pipes()
+            self.pipes_spawn_time = self.SPAWN_INTERVAL
+        self.pipes_spawn_time -= 1
+
+    # ---- per-tick updates ----
+    def update_pipes(self, players=()):
+        """
+        Scroll pipes; each newly passed pipe scores for the world and every
+        live player.  Returns the number of pipes passed this tick.
+        """
+        passed = 0
+        for p in self.pipes:
+            p.update()
+            if p.passed and not p.counted:
+                p.counted = True
+                passed += 1
+                self.add_score(1)
+                for pl in players:
+                    if pl.alive:
+                        pl.score += 1
+        if passed:
+            self.pipes.advance()
+        self.pipes.drop_off_screen()
+        return passed
+
+    @property
+    def next_pipe(self):
+        """The closest pipe not yet passed (kept current by update_pipes)."""
+        return self.pipes.next
+
+    def update_obstacles(self, players):
+        """Update wind zones, coins, flying blocks and falling obstacles; apply their effects."""
+        self.advance_obstacles()
+        self.apply_obstacles(players)
+
+    def advance_obstacles(self):
+        """Move every non-pipe obstacle one tick and drop the ones that left the screen."""
+        for group in (self.wind_zones, self.coins, self.flying_blocks, self.falling_obstacles):
+            for ob in group:
+                ob.update()
+            group[:] = [ob for ob in group if not ob.off_screen]
+
+    def obstacle_grid(self):
+        """x-bucket index of this tick's wind zones, coins, flying blocks and falling obstacles."""
+        return spatial.ObstacleGrid((self.wind_zones, self.coins, self.flying_blocks, self.falling_obstacles))
+
+    def apply_obstacles(self, players):
+        # Only obstacles overlapping a plane's x-span can touch it
+        grid = self.obstacle_grid()
+        for pl in players:
+            if not pl.alive:
+                continue
+            wind_zones, coins, flying_blocks, falling_obstacles = grid.query(pl.rect.left, pl.rect.right)
+            for wz in wind_zones:
+                wz.apply_force(pl)
+            for coin in coins:
+                if coin.check_collect(pl.rect):
+                    self.add_score(coin.BONUS)
+            for fb in flying_blocks:
+                if fb.check_collision(pl.rect):
+                    pl.alive = False
+            for fo in falling_obstacles:
+                if fo.check_collision(pl.rect):
+                    pl.alive = False
+
+    def step(self, players, generation=1):
+        """Advance the course by one tick and let every live player look, think and move."""
+        with perf.phase('tick'):
+            with perf.phase('pipes'):
+                self.spawn_tick()
+                self.update_pipes(players)
+            # Planes only see the pipes, so all of them can look, then all
+            # think, then all move (timed separately by perf)
+            live = [p for p in players if p.alive]
+            with perf.phase('look'):
+                for p in live:
+                    p.look()
+            with perf.phase('think'):
+                player.think_all(live, generation)
+            with perf.phase('update'):
+                for p in live:
+                    p.update(config.ground)
+            with perf.phase('obstacles'):
+                self.update_obstacles(players)
+        perf.tick(len(live))
+
+    # ---- rendering (optional) ----
+    def draw(self, window):
+        for p in self.pipes:
+            p.draw(window)
+        for wz in self.wind_zones:
+            wz.draw(window)
+        for coin in self.coins:
+            coin.draw(window)
+        for fb in self.flying_blocks:
+            fb.draw(window)
+        for fo in self.falling_obstacles:
+            fo.draw(window)